@@ -0,0 +1,8 @@
+"""
+Benchmarks for Recce's hot paths on synthetic dbt projects.
+
+- ``python -m benchmarks.run``: time lineage, selection, CLL and ``/api/info`` at 1k/10k/50k models, emitting JSON.
+- ``python -m benchmarks.lineage``: compare lineage building against the ``manifest.to_dict()`` baseline.
+
+Run from the repository root; the synthetic projects are derived from ``tests/data/manifest/base``.
+"""
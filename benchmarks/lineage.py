@@ -0,0 +1,89 @@
+"""
+Time and peak RSS of building the lineage dict for one environment.
+
+Each mode runs in a fresh subprocess so peak RSS is not polluted by the previous run:
+
+- ``to_dict``: the previous implementation's cost — ``manifest.to_dict()`` (which ``get_lineage_cached`` and
+  ``build_parent_map`` each called once) followed by the lineage build.
+- ``typed``: ``DbtAdapter.get_lineage`` reading attributes straight off the typed manifest.
+
+Usage::
+
+    python -m benchmarks.lineage --models 10000
+"""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+MODES = ["to_dict", "typed"]
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _run_mode(mode: str, artifacts_dir: Path) -> dict:
+    from recce.adapter.dbt_adapter import DbtAdapter, load_catalog, load_manifest
+
+    manifest = load_manifest(path=str(artifacts_dir / "manifest.json"))
+    catalog = load_catalog(path=str(artifacts_dir / "catalog.json"))
+    adapter = DbtAdapter.__new__(DbtAdapter)
+    adapter.curr_manifest = manifest
+    adapter.curr_catalog = catalog
+    adapter.base_manifest = manifest
+    adapter.base_catalog = catalog
+
+    rss_before = _peak_rss_mb()
+    start = time.perf_counter()
+    if mode == "to_dict":
+        manifest.to_dict()
+        manifest.to_dict()
+    # base=True skips the perf tracker, which needs the recce event setup
+    lineage = adapter.get_lineage(base=True)
+    elapsed = time.perf_counter() - start
+    return {
+        "mode": mode,
+        "nodes": len(lineage["nodes"]),
+        "seconds": round(elapsed, 3),
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+        "peak_rss_delta_mb": round(_peak_rss_mb() - rss_before, 1),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--models", type=int, default=10000, help="Number of synthetic models")
+    parser.add_argument("--mode", choices=MODES, help=argparse.SUPPRESS)
+    parser.add_argument("--artifacts", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.mode:
+        print(json.dumps(_run_mode(args.mode, args.artifacts)))
+        return
+
+    from benchmarks.synthetic import write_artifacts
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        write_artifacts(Path(tmp), args.models)
+        for mode in MODES:
+            output = subprocess.run(
+                [sys.executable, "-m", "benchmarks.lineage", "--mode", mode, "--artifacts", tmp],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            results.append(json.loads(output.strip().splitlines()[-1]))
+    print(json.dumps({"models": args.models, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""
+Time Recce's hot paths against synthetic dbt projects on a local DuckDB warehouse.
+
+Each project size runs in its own subprocess so dbt's global state and peak RSS do not leak between sizes.
+Results are printed (or written with ``--output``) as JSON so runs can be diffed across versions.
+
+Usage::
+
+    python -m benchmarks.run                       # 1k, 10k and 50k models
+    python -m benchmarks.run --sizes 1000 --output bench.json
+"""
+
+import argparse
+import json
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List
+
+DEFAULT_SIZES = [1000, 10000, 50000]
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024, 1)
+
+
+class _Timings:
+    def __init__(self):
+        self.results: Dict[str, dict] = {}
+
+    @contextmanager
+    def measure(self, name: str):
+        start = time.perf_counter()
+        entry = {}
+        yield entry
+        entry["seconds"] = round(time.perf_counter() - start, 4)
+        entry["peak_rss_mb"] = _peak_rss_mb()
+        self.results[name] = entry
+
+
+def _bench_size(num_models: int, modified_fraction: float) -> dict:
+    from fastapi.testclient import TestClient
+
+    from benchmarks.synthetic import write_project
+    from recce.adapter.dbt_adapter import DbtAdapter, load_manifest
+    from recce.core import RecceContext, set_default_context
+    from recce.server import app
+    from recce.state import FileStateLoader
+    from recce.util.cll import CllCache, set_cll_cache
+
+    timings = _Timings()
+    with tempfile.TemporaryDirectory() as tmp:
+        project_dir = write_project(Path(tmp) / "project", num_models, modified_fraction=modified_fraction)
+        # Start every run with a cold CLL cache that is not shared with the user's ~/.recce
+        set_cll_cache(CllCache(db_path=str(Path(tmp) / "cll_cache.db")))
+
+        with timings.measure("load_manifest") as entry:
+            manifest = load_manifest(path=str(project_dir / "target" / "manifest.json"))
+            entry["nodes"] = len(manifest.nodes)
+        del manifest
+
+        with timings.measure("adapter_load"):
+            adapter = DbtAdapter.load(
+                project_dir=str(project_dir),
+                profiles_dir=str(project_dir),
+                target_path="target",
+                target_base_path="target-base",
+            )
+
+        with timings.measure("get_lineage") as entry:
+            entry["nodes"] = len(adapter.get_lineage()["nodes"])
+            adapter.get_lineage(base=True)
+
+        with timings.measure("get_lineage_diff") as entry:
+            entry["diff"] = len(adapter.get_lineage_diff().diff)
+
+        with timings.measure("select_nodes") as entry:
+            modified = adapter.select_nodes("state:modified,resource_type:model")
+            entry["selected"] = len(modified)
+
+        with timings.measure("select_nodes[state:modified+]") as entry:
+            entry["selected"] = len(adapter.select_nodes("state:modified+"))
+
+        with timings.measure("get_merged_lineage"):
+            adapter.get_merged_lineage()
+
+        with timings.measure("build_full_cll_map") as entry:
+            full_map = adapter.build_full_cll_map()
+            entry["nodes"] = len(full_map.nodes)
+            entry["columns"] = len(full_map.columns)
+
+        node_id = sorted(modified)[0]
+        with timings.measure("get_cll[node]") as entry:
+            cll = adapter.get_cll(node_id=node_id, change_analysis=True)
+            entry["nodes"] = len(cll.nodes)
+            entry["columns"] = len(cll.columns)
+
+        with timings.measure("get_cll[column]") as entry:
+            cll = adapter.get_cll(node_id=node_id, column="col_0")
+            entry["columns"] = len(cll.columns)
+
+        context = RecceContext(state_loader=FileStateLoader())
+        context.adapter_type = "dbt"
+        context.adapter = adapter
+        set_default_context(context)
+        app.state.last_activity = None
+        client = TestClient(app)
+        with timings.measure("api_info") as entry:
+            response = client.get("/api/info")
+            response.raise_for_status()
+            entry["bytes"] = len(response.content)
+
+    return {"models": num_models, "modified_fraction": modified_fraction, "timings": timings.results}
+
+
+def _environment() -> dict:
+    from importlib.metadata import version
+
+    def _version(package):
+        try:
+            return version(package)
+        except Exception:
+            return None
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "recce": _version("recce") or _version("recce-nightly"),
+        "dbt-core": _version("dbt-core"),
+        "dbt-duckdb": _version("dbt-duckdb"),
+        "sqlglot": _version("sqlglot"),
+    }
+
+
+def run(sizes: List[int], modified_fraction: float) -> dict:
+    runs = []
+    for size in sizes:
+        output = subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "benchmarks.run",
+                "--child",
+                "--sizes",
+                str(size),
+                "--modified-fraction",
+                str(modified_fraction),
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        runs.append(json.loads(output.strip().splitlines()[-1]))
+    return {"environment": _environment(), "runs": runs}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Numbers of synthetic models")
+    parser.add_argument(
+        "--modified-fraction", type=float, default=0.05, help="Fraction of models changed in the current env"
+    )
+    parser.add_argument("--output", type=Path, help="Write the JSON result to this file instead of stdout")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(_bench_size(args.sizes[0], args.modified_fraction)))
+        return
+
+    result = run(args.sizes, args.modified_fraction)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(result, f, indent=2)
+    else:
+        print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,251 @@
+"""
+Synthetic dbt artifacts for benchmarks.
+
+The generated project is shaped like a real one: a layer of sources, staging models that select from
+them, and downstream models that join one to three upstream models. Every model carries the
+``unique``/``not_null`` tests on its key so lineage picks up primary keys, and a catalog entry so
+column-aware code paths have real work to do. Node payloads are cloned from the jaffle_shop fixture
+in ``tests/data/manifest/base`` so the per-node size matches what dbt actually writes.
+"""
+
+import copy
+import json
+import random
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+TEMPLATE_DIR = Path(__file__).resolve().parent.parent / "tests" / "data" / "manifest" / "base"
+
+DATABASE = "jaffle_shop"
+SCHEMA = "prod"
+PACKAGE = "jaffle_shop"
+COLUMNS_PER_MODEL = 8
+
+
+def _load_template() -> Tuple[dict, dict]:
+    with open(TEMPLATE_DIR / "manifest.json") as f:
+        manifest = json.load(f)
+    with open(TEMPLATE_DIR / "catalog.json") as f:
+        catalog = json.load(f)
+    return manifest, catalog
+
+
+def _relation(name: str) -> str:
+    return f'"{DATABASE}"."{SCHEMA}"."{name}"'
+
+
+def _model_sql(name: str, parents: List[str], parent_names: Dict[str, str]) -> Tuple[str, str]:
+    columns = [f"col_{i}" for i in range(COLUMNS_PER_MODEL)]
+    first = parents[0]
+    select = ["t0.id"]
+    for i, column in enumerate(columns):
+        alias = f"t{i % len(parents)}"
+        if i % 3 == 0:
+            select.append(f"{alias}.{column} + 1 as {column}")
+        else:
+            select.append(f"{alias}.{column}")
+
+    def _from(compiled: bool) -> str:
+        def target(parent_id):
+            parent_name = parent_names[parent_id]
+            if parent_id.startswith("source."):
+                return _relation(parent_name) if compiled else f"{{{{ source('raw', '{parent_name}') }}}}"
+            return _relation(parent_name) if compiled else f"{{{{ ref('{parent_name}') }}}}"
+
+        clause = f"from {target(first)} as t0"
+        for i, parent in enumerate(parents[1:], start=1):
+            clause += f"\nleft join {target(parent)} as t{i} on t0.id = t{i}.id"
+        return clause
+
+    body = "select\n    " + ",\n    ".join(select) + "\n"
+    return body + _from(False), body + _from(True)
+
+
+def generate_artifacts(num_models: int, seed: int = 0) -> Tuple[dict, dict]:
+    """
+    Generate a ``(manifest_dict, catalog_dict)`` pair with ``num_models`` models.
+
+    The result is deterministic for a given ``num_models`` and ``seed``.
+    """
+    rng = random.Random(seed)
+    template_manifest, template_catalog = _load_template()
+    template_nodes = template_manifest["nodes"]
+    model_template = template_nodes[f"model.{PACKAGE}.customers"]
+    test_template = template_nodes[f"test.{PACKAGE}.unique_customers_customer_id.c5af1ff4b1"]
+    source_template = template_manifest["sources"][f"source.{PACKAGE}.jaffle-shop-data.raw_customers"]
+    catalog_template = template_catalog["nodes"][f"model.{PACKAGE}.customers"]
+
+    nodes: Dict[str, dict] = {}
+    sources: Dict[str, dict] = {}
+    parent_map: Dict[str, List[str]] = {}
+    names: Dict[str, str] = {}
+    catalog_nodes: Dict[str, dict] = {}
+    catalog_sources: Dict[str, dict] = {}
+
+    def catalog_entry(name: str) -> dict:
+        entry = copy.deepcopy(catalog_template)
+        entry["metadata"].update(schema=SCHEMA, name=name, database=DATABASE)
+        columns = {"id": {"type": "BIGINT", "index": 1, "name": "id", "comment": None}}
+        for i in range(COLUMNS_PER_MODEL):
+            columns[f"col_{i}"] = {"type": "BIGINT", "index": i + 2, "name": f"col_{i}", "comment": None}
+        entry["columns"] = columns
+        return entry
+
+    num_sources = max(1, num_models // 20)
+    for i in range(num_sources):
+        name = f"raw_{i}"
+        unique_id = f"source.{PACKAGE}.raw.{name}"
+        source = copy.deepcopy(source_template)
+        source.update(
+            name=name,
+            unique_id=unique_id,
+            source_name="raw",
+            identifier=name,
+            schema=SCHEMA,
+            fqn=[PACKAGE, "raw", name],
+            relation_name=_relation(name),
+        )
+        source["meta"] = {}
+        sources[unique_id] = source
+        parent_map[unique_id] = []
+        names[unique_id] = name
+        catalog_sources[unique_id] = catalog_entry(name)
+
+    source_ids = list(sources)
+    model_ids: List[str] = []
+    num_staging = max(1, num_models // 5)
+    for i in range(num_models):
+        name = f"stg_model_{i}" if i < num_staging else f"model_{i}"
+        unique_id = f"model.{PACKAGE}.{name}"
+        if i < num_staging:
+            parents = [source_ids[i % len(source_ids)]]
+        else:
+            # Prefer recent models so the graph has depth, not just a wide fan-out from staging.
+            window = model_ids[-200:]
+            parents = rng.sample(window, k=min(len(window), rng.randint(1, 3)))
+
+        raw_code, compiled_code = _model_sql(name, parents, names)
+        node = copy.deepcopy(model_template)
+        node.update(
+            name=name,
+            unique_id=unique_id,
+            alias=name,
+            schema=SCHEMA,
+            database=DATABASE,
+            path=f"{name}.sql",
+            original_file_path=f"models/{name}.sql",
+            fqn=[PACKAGE, name],
+            raw_code=raw_code,
+            compiled_code=compiled_code,
+            relation_name=_relation(name),
+            refs=[{"name": names[p], "package": None, "version": None} for p in parents if p.startswith("model.")],
+            sources=[["raw", names[p]] for p in parents if p.startswith("source.")],
+        )
+        node["checksum"] = {"name": "sha256", "checksum": f"{seed:08x}{i:056x}"}
+        node["depends_on"] = {"macros": [], "nodes": list(parents)}
+        node["columns"] = {}
+        nodes[unique_id] = node
+        parent_map[unique_id] = list(parents)
+        names[unique_id] = name
+        catalog_nodes[unique_id] = catalog_entry(name)
+        model_ids.append(unique_id)
+
+        for test_type in ("unique", "not_null"):
+            test_name = f"{test_type}_{name}_id"
+            test_id = f"test.{PACKAGE}.{test_name}.{i:010x}"
+            test = copy.deepcopy(test_template)
+            test.update(
+                name=test_name,
+                unique_id=test_id,
+                alias=test_name,
+                fqn=[PACKAGE, test_name],
+                path=f"{test_name}.sql",
+                column_name="id",
+                attached_node=unique_id,
+                refs=[{"name": name, "package": None, "version": None}],
+            )
+            test["depends_on"] = {"macros": [], "nodes": [unique_id]}
+            test["test_metadata"] = {"name": test_type, "kwargs": {"column_name": "id"}, "namespace": None}
+            nodes[test_id] = test
+            parent_map[test_id] = [unique_id]
+
+    child_map: Dict[str, List[str]] = {unique_id: [] for unique_id in parent_map}
+    for unique_id, parents in parent_map.items():
+        for parent in parents:
+            child_map[parent].append(unique_id)
+
+    manifest = dict(template_manifest)
+    manifest.update(
+        nodes=nodes,
+        sources=sources,
+        exposures={},
+        metrics={},
+        semantic_models={},
+        saved_queries={},
+        unit_tests={},
+        groups={},
+        disabled={},
+        parent_map=parent_map,
+        child_map=child_map,
+        group_map={},
+    )
+    catalog = dict(template_catalog, nodes=catalog_nodes, sources=catalog_sources, errors=None)
+    return manifest, catalog
+
+
+def _dump(target_dir: Path, manifest: dict, catalog: dict) -> Tuple[Path, Path]:
+    target_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = target_dir / "manifest.json"
+    catalog_path = target_dir / "catalog.json"
+    with open(manifest_path, "w") as f:
+        json.dump(manifest, f)
+    with open(catalog_path, "w") as f:
+        json.dump(catalog, f)
+    return manifest_path, catalog_path
+
+
+def write_artifacts(target_dir: Path, num_models: int, seed: int = 0) -> Tuple[Path, Path]:
+    """Write ``manifest.json`` and ``catalog.json`` for a synthetic project into ``target_dir``."""
+    manifest, catalog = generate_artifacts(num_models, seed=seed)
+    return _dump(target_dir, manifest, catalog)
+
+
+def write_project(project_dir: Path, num_models: int, modified_fraction: float = 0.05, seed: int = 0) -> Path:
+    """
+    Write a dbt project backed by a local DuckDB file with ``target-base`` and ``target`` artifacts.
+
+    The current environment is the base one with ``modified_fraction`` of the models changed. Returns the
+    project directory, which doubles as the profiles directory.
+    """
+    project_dir.mkdir(parents=True, exist_ok=True)
+    with open(project_dir / "dbt_project.yml", "w") as f:
+        f.write(f'name: "{PACKAGE}"\nconfig-version: 2\nversion: "0.1"\nprofile: "{PACKAGE}"\n')
+    with open(project_dir / "profiles.yml", "w") as f:
+        f.write(
+            f"{PACKAGE}:\n  target: dev\n  outputs:\n    dev:\n      type: duckdb\n"
+            f"      path: '{project_dir / 'bench.duckdb'}'\n"
+        )
+
+    base_manifest, catalog = generate_artifacts(num_models, seed=seed)
+    curr_manifest = modify_artifacts(base_manifest, modified_fraction, seed=seed)
+    _dump(project_dir / "target-base", base_manifest, catalog)
+    _dump(project_dir / "target", curr_manifest, catalog)
+    return project_dir
+
+
+def modify_artifacts(manifest: dict, fraction: float, seed: int = 0) -> dict:
+    """
+    Return a copy of ``manifest`` where ``fraction`` of the models have changed SQL and checksums.
+
+    Used to build a "current" environment from a "base" one.
+    """
+    rng = random.Random(seed)
+    manifest = dict(manifest, nodes=dict(manifest["nodes"]))
+    model_ids = [unique_id for unique_id in manifest["nodes"] if unique_id.startswith("model.")]
+    for unique_id in rng.sample(model_ids, k=int(len(model_ids) * fraction)):
+        node = copy.deepcopy(manifest["nodes"][unique_id])
+        node["raw_code"] = node["raw_code"].replace("+ 1 as", "+ 2 as")
+        node["compiled_code"] = node["compiled_code"].replace("+ 1 as", "+ 2 as")
+        node["checksum"] = {"name": "sha256", "checksum": "f" * 8 + node["checksum"]["checksum"][8:]}
+        manifest["nodes"][unique_id] = node
+    return manifest
@@ -1,8 +1,5 @@
 import os
 
-import requests
-from packaging.version import Version
-
 
 def is_ci_env():
     # List of CI environment variables and their expected values
@@ -64,6 +61,9 @@ def get_version():
 
 
 def fetch_latest_version():
+    """Query PyPI for the latest release. Blocking; use recce.util.version_check from the CLI and server."""
+    import requests
+
     current_version = get_version()
     if "dev" in current_version:
         # Skip fetching latest version if it's a dev version
@@ -80,5 +80,16 @@ def fetch_latest_version():
 
 
 __version__ = get_version()
-__latest_version__ = fetch_latest_version()
-__is_recce_outdated__ = Version(__version__) < Version(__latest_version__)
+
+
+def __getattr__(name):
+    # Resolved lazily from the disk-cached version check so `import recce` never touches the network
+    if name == "__latest_version__":
+        from recce.util.version_check import get_latest_version
+
+        return get_latest_version()
+    if name == "__is_recce_outdated__":
+        from recce.util.version_check import is_recce_outdated
+
+        return is_recce_outdated()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -60,6 +60,15 @@ class BaseAdapter(ABC):
         """
         return build_merged_lineage(self.get_lineage_diff())
 
+    def get_lineage_version(self) -> Optional[str]:
+        """Content version of the artifacts behind the lineage, CLL and node selection.
+
+        Changes whenever any of them could change, so the server can use it to
+        build ETags. ``None`` means the adapter cannot tell, and responses are
+        not cached.
+        """
+        return None
+
     @abstractmethod
     def select_nodes(
         self,
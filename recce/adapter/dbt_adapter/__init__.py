@@ -7,7 +7,7 @@ import time
 import uuid
 from contextlib import contextmanager
 from copy import deepcopy
-from dataclasses import dataclass, fields
+from dataclasses import dataclass, field, fields
 from errno import ENOENT
 from functools import lru_cache
 from pathlib import Path
@@ -32,8 +32,10 @@ from recce.exceptions import (
     UnsupportedDbtSchemaError,
     is_duckdb_external_access_blocked,
 )
+from recce.util.artifact_reader import prune_manifest, read_json_artifact
 from recce.util.cll import CLLPerformanceTracking, cll, get_cll_cache
 from recce.util.lineage import (
+    LineageIndex,
     build_column_key,
     filter_dependency_maps,
     find_downstream,
@@ -68,6 +70,7 @@ from ...models import RunType
 from ...models.lineage import build_merged_lineage
 from ...models.types import (
     CllColumn,
+    CllColumnDep,
     CllData,
     CllNode,
     LineageDiff,
@@ -213,6 +216,11 @@ class EnvironmentEventHandler(FileSystemEventHandler):
             self.observer.stop()
 
 
+def _enum_value(value):
+    """Return the serialized form of a dbt enum field (e.g. NodeType.Model -> "model")."""
+    return getattr(value, "value", value)
+
+
 def merge_tables(tables: List[agate.Table]) -> agate.Table:
     if dbt_version < "v1.8":
         from dbt.clients.agate_helper import merge_tables
@@ -224,6 +232,7 @@ def merge_tables(tables: List[agate.Table]) -> agate.Table:
         return merge_tables(tables)
 
 
+@track_timing("as_manifest")
 def as_manifest(m: WritableManifest) -> Manifest:
     if dbt_version < "v1.8":
         data = m.__dict__
@@ -254,36 +263,59 @@ def _guard_unsupported_schema(artifact: str, found_version_url):
         raise UnsupportedDbtSchemaError(artifact, found)
 
 
-@track_timing(record_size=True)
-def load_manifest(path: str = None, data: dict = None):
+def _read_artifact(artifact_cls, artifact: str, path: str, timing_name: str = None) -> dict:
+    """Read an artifact file and check its schema version, like ``read_and_check_versions``."""
+    from dbt.exceptions import DbtRuntimeError
+
+    try:
+        data = read_json_artifact(path, timing_name=timing_name)
+    except (EnvironmentError, ValueError) as exc:
+        raise DbtRuntimeError(f'Could not read {artifact_cls.__name__} at "{path}" as JSON: {exc}') from exc
+
+    found = (data.get("metadata") or {}).get("dbt_schema_version")
+    if found and hasattr(artifact_cls, "dbt_schema_version") and not artifact_cls.is_compatible_version(found):
+        _guard_unsupported_schema(artifact, found)
+        raise IncompatibleSchemaError(expected=str(artifact_cls.dbt_schema_version), found=found)
+    return data
+
+
+@track_timing(record_size=True, pass_name=True)
+def load_manifest(
+    path: str = None, data: dict = None, prune: bool = False, prune_macros: bool = False, timing_name: str = None
+):
+    """Load a manifest from a file or a dict.
+
+    ``prune`` drops the sections recce never reads, and ``prune_macros`` also the SQL of
+    macros no resource depends on; see ``prune_manifest``.
+    """
     if path is not None:
         if not os.path.isfile(path):
             return None
-        try:
-            return WritableManifest.read_and_check_versions(path)
-        except IncompatibleSchemaError as e:
-            _guard_unsupported_schema("manifest", e.found)
-            raise
-    if data is not None:
+        data = _read_artifact(WritableManifest, "manifest", path, timing_name=timing_name)
+    elif data is not None:
         _guard_unsupported_schema("manifest", (data.get("metadata") or {}).get("dbt_schema_version"))
-        return WritableManifest.upgrade_schema_version(data)
+    else:
+        return None
+
+    if prune or prune_macros:
+        data = prune_manifest(data, macro_bodies=prune_macros, timing_name=timing_name)
+    return WritableManifest.upgrade_schema_version(data)
 
 
-@track_timing(record_size=True)
-def load_catalog(path: str = None, data: dict = None):
+@track_timing(record_size=True, pass_name=True)
+def load_catalog(path: str = None, data: dict = None, timing_name: str = None):
     if path is not None:
         if not os.path.isfile(path):
             return None
-        try:
-            return CatalogArtifact.read_and_check_versions(path)
-        except IncompatibleSchemaError as e:
-            _guard_unsupported_schema("catalog", e.found)
-            raise
+        return CatalogArtifact.upgrade_schema_version(
+            _read_artifact(CatalogArtifact, "catalog", path, timing_name=timing_name)
+        )
     if data is not None:
         _guard_unsupported_schema("catalog", (data.get("metadata") or {}).get("dbt_schema_version"))
         return CatalogArtifact.upgrade_schema_version(data)
 
 
+@track_timing("previous_state")
 def previous_state(state_path: Path, target_path: Path, project_root: Path) -> PreviousState:
     if dbt_version < "v1.5.2":
         return PreviousState(state_path, target_path)
@@ -339,6 +371,54 @@ class DbtArgs:
     require_ref_searches_node_package_before_root: Optional[bool] = False  # dbt v1.11
 
 
+@dataclass
+class _ManifestNameIndex:
+    """Nodes and sources of one manifest grouped by name, in manifest order.
+
+    Lets ``ref()``/``source()`` resolution and name lookups find a node in
+    O(1) instead of scanning every node of the manifest.
+    """
+
+    nodes_by_name: Dict[str, List[Any]]
+    sources_by_name: Dict[Tuple[str, str], List[Any]]
+
+    @classmethod
+    def build(cls, manifest) -> "_ManifestNameIndex":
+        nodes_by_name: Dict[str, List[Any]] = {}
+        for node in manifest.nodes.values():
+            nodes_by_name.setdefault(node.name, []).append(node)
+        sources_by_name: Dict[Tuple[str, str], List[Any]] = {}
+        for source in manifest.sources.values():
+            sources_by_name.setdefault((source.source_name, source.name), []).append(source)
+        return cls(nodes_by_name=nodes_by_name, sources_by_name=sources_by_name)
+
+    def find_node(self, name: str, package: Optional[str] = None):
+        """Return the first node with the name (and package, if given), like a scan of manifest.nodes."""
+        for node in self.nodes_by_name.get(name, ()):
+            if package is None or node.package_name == package:
+                return node
+        return None
+
+    def find_source(self, source_name: str, name: str):
+        sources = self.sources_by_name.get((source_name, name))
+        return sources[0] if sources else None
+
+
+@dataclass
+class _CllJob:
+    """A node whose column-level lineage still needs its SQL parsed by ``cll()``."""
+
+    node: CllNode
+    parent_list: List[str]
+    base: bool
+    manifest: Manifest
+    table_id_map: Dict[str, Optional[str]]
+    schema: dict
+    dialect: str
+    pre_compiled: Optional[str] = None
+    jinja_context: Optional[dict] = None
+
+
 @dataclass
 class DbtAdapter(BaseAdapter):
     runtime_config: RuntimeConfig = None
@@ -347,6 +427,14 @@ class DbtAdapter(BaseAdapter):
     previous_state: PreviousState = None
     target_path: str = None
     _full_cll_map: Optional["CllData"] = None
+    _full_cll_index: Optional[LineageIndex] = None
+    # node_id -> (content key, per-node CllData) of the last full CLL map; kept across
+    # artifact reloads so build_full_cll_map only recomputes what changed
+    _full_cll_parts: Dict[str, Tuple[str, "CllData"]] = field(default_factory=dict)
+    # id(manifest) -> (manifest, index); the manifest is kept to detect a reused id
+    _name_indexes: Dict[int, Tuple[Any, _ManifestNameIndex]] = field(default_factory=dict)
+    # artifact slot -> (artifact, artifact.to_dict()); memoized by export_artifacts
+    _artifact_dicts: Dict[str, Tuple[Any, dict]] = field(default_factory=dict)
     curr_manifest: WritableManifest = None
     curr_catalog: CatalogArtifact = None
     base_path: str = None
@@ -355,6 +443,12 @@ class DbtAdapter(BaseAdapter):
 
     # Review mode
     review_mode: bool = False
+    # Drop manifest content recce never reads when importing artifacts from a state;
+    # macro bodies only in modes that never run queries
+    prune_artifacts: bool = False
+    prune_macro_bodies: bool = False
+    # Load artifact files in worker processes; see _load_artifacts_in_processes
+    artifact_processes: bool = False
 
     duckdb_external_access: bool = False
 
@@ -429,6 +523,10 @@ class DbtAdapter(BaseAdapter):
                 runtime_config=runtime_config,
                 adapter=adapter,
                 review_mode=review,
+                prune_artifacts=review,
+                prune_macro_bodies=str(kwargs.get("mode")) in ["read-only", "preview"],
+                artifact_processes=kwargs.get("artifact_processes")
+                or os.environ.get("RECCE_ARTIFACT_PROCESSES", "false").lower() == "true",
                 base_path=target_base_path,
                 duckdb_external_access=kwargs.get("duckdb_external_access", False),
             )
@@ -555,7 +653,8 @@ class DbtAdapter(BaseAdapter):
     def load_artifacts(self):
         """
         Load the artifacts from the 'target' and 'target-base' directory.
-        Artifacts are loaded in parallel using ThreadPoolExecutor.
+        Artifacts are loaded in parallel using ThreadPoolExecutor, or in worker
+        processes if artifact_processes is set.
         """
         from concurrent.futures import ThreadPoolExecutor
 
@@ -574,22 +673,54 @@ class DbtAdapter(BaseAdapter):
         curr_catalog_path = os.path.join(project_root, target_path, "catalog.json")
         base_catalog_path = os.path.join(project_root, target_base_path, "catalog.json")
 
-        # Load all 4 artifacts in parallel
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            curr_manifest_future = executor.submit(load_manifest, path=curr_manifest_path, timing_name="curr_manifest")
-            base_manifest_future = executor.submit(load_manifest, path=base_manifest_path, timing_name="base_manifest")
-            curr_catalog_future = executor.submit(load_catalog, path=curr_catalog_path, timing_name="curr_catalog")
-            base_catalog_future = executor.submit(load_catalog, path=base_catalog_path, timing_name="base_catalog")
+        def _previous_state():
+            return previous_state(
+                Path(target_base_path),
+                Path(self.runtime_config.target_path),
+                Path(self.runtime_config.project_root),
+            )
 
-            # Collect results (raises if any future failed)
-            curr_manifest = curr_manifest_future.result()
+        if self.artifact_processes:
+            artifacts, manifest, prev_state = self._load_artifacts_in_processes(
+                {
+                    "curr_manifest": curr_manifest_path,
+                    "base_manifest": base_manifest_path,
+                    "curr_catalog": curr_catalog_path,
+                    "base_catalog": base_catalog_path,
+                },
+                _previous_state,
+            )
+            curr_manifest = artifacts["curr_manifest"]
             if curr_manifest is None:
                 raise FileNotFoundError(ENOENT, os.strerror(ENOENT), curr_manifest_path)
-            base_manifest = base_manifest_future.result()
+            base_manifest = artifacts["base_manifest"]
             if base_manifest is None:
                 raise FileNotFoundError(ENOENT, os.strerror(ENOENT), base_manifest_path)
-            curr_catalog = curr_catalog_future.result()
-            base_catalog = base_catalog_future.result()
+            curr_catalog = artifacts["curr_catalog"]
+            base_catalog = artifacts["base_catalog"]
+        else:
+            # Load all 4 artifacts in parallel
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                curr_manifest_future = executor.submit(
+                    load_manifest, path=curr_manifest_path, timing_name="curr_manifest"
+                )
+                base_manifest_future = executor.submit(
+                    load_manifest, path=base_manifest_path, timing_name="base_manifest"
+                )
+                curr_catalog_future = executor.submit(load_catalog, path=curr_catalog_path, timing_name="curr_catalog")
+                base_catalog_future = executor.submit(load_catalog, path=base_catalog_path, timing_name="base_catalog")
+
+                # Collect results (raises if any future failed)
+                curr_manifest = curr_manifest_future.result()
+                if curr_manifest is None:
+                    raise FileNotFoundError(ENOENT, os.strerror(ENOENT), curr_manifest_path)
+                base_manifest = base_manifest_future.result()
+                if base_manifest is None:
+                    raise FileNotFoundError(ENOENT, os.strerror(ENOENT), base_manifest_path)
+                curr_catalog = curr_catalog_future.result()
+                base_catalog = base_catalog_future.result()
+            manifest = as_manifest(curr_manifest)
+            prev_state = _previous_state()
 
         # set the value if all the artifacts are loaded successfully
         self.curr_manifest = curr_manifest
@@ -599,14 +730,12 @@ class DbtAdapter(BaseAdapter):
 
         # clear cached CLL data
         self._full_cll_map = None
+        self._full_cll_index = None
+        self._name_indexes.clear()
 
         # set the manifest
-        self.manifest = as_manifest(curr_manifest)
-        self.previous_state = previous_state(
-            Path(target_base_path),
-            Path(self.runtime_config.target_path),
-            Path(self.runtime_config.project_root),
-        )
+        self.manifest = manifest
+        self.previous_state = prev_state
 
         # set the file paths to watch
         self.artifacts_files = [
@@ -616,6 +745,70 @@ class DbtAdapter(BaseAdapter):
             base_catalog_path,
         ]
 
+    @staticmethod
+    def _load_artifacts_in_processes(
+        paths: Dict[str, str], load_previous_state: Callable[[], PreviousState]
+    ) -> Tuple[Dict[str, Any], Optional[Manifest], PreviousState]:
+        """Load the artifact files in worker processes, one per artifact.
+
+        JSON decoding and dataclass construction hold the GIL, so threads barely
+        overlap; workers send each artifact back pickled instead. Meanwhile the
+        previous state loads in a thread, and the current manifest goes through
+        as_manifest as soon as it arrives. An artifact whose worker fails is loaded
+        in-process, which raises the actual error.
+
+        Returns the artifacts by name, the current Manifest and the previous state.
+        """
+        import multiprocessing
+        import pickle
+        from concurrent.futures import (
+            ProcessPoolExecutor,
+            ThreadPoolExecutor,
+            as_completed,
+        )
+
+        from recce.util.artifact_reader import load_artifact_worker
+        from recce.util.startup_perf import get_startup_tracker
+
+        tracker = get_startup_tracker()
+        artifacts = {}
+        manifest = None
+        # spawn, not fork: the server process may hold dbt connections and watchdog threads
+        with (
+            ProcessPoolExecutor(max_workers=len(paths), mp_context=multiprocessing.get_context("spawn")) as processes,
+            ThreadPoolExecutor(max_workers=1) as threads,
+        ):
+            futures = {}
+            for name, path in paths.items():
+                kind = "manifest" if name.endswith("_manifest") else "catalog"
+                futures[processes.submit(load_artifact_worker, kind, path)] = (name, kind, time.perf_counter_ns())
+            previous_state_future = threads.submit(load_previous_state)
+
+            for future in as_completed(futures):
+                name, kind, submitted = futures[future]
+                try:
+                    payload, timings = future.result()
+                    start = time.perf_counter_ns()
+                    artifacts[name] = pickle.loads(payload) if payload is not None else None
+                    timings["unpickle"] = (time.perf_counter_ns() - start) / 1_000_000
+                except Exception as e:
+                    logger.debug(f"Failed to load {name} in a worker process, load it in-process: {e}")
+                    loader = load_manifest if kind == "manifest" else load_catalog
+                    artifacts[name] = loader(path=paths[name], timing_name=name)
+                else:
+                    if tracker:
+                        tracker.record_timing(name, (time.perf_counter_ns() - submitted) / 1_000_000)
+                        for phase, elapsed_ms in timings.items():
+                            tracker.record_timing(f"{name}_{phase}", elapsed_ms)
+                        if artifacts[name] is not None:
+                            tracker.set_artifact_size(name, os.path.getsize(paths[name]))
+
+                if name == "curr_manifest" and artifacts[name] is not None:
+                    manifest = as_manifest(artifacts[name])
+
+            prev_state = previous_state_future.result()
+        return artifacts, manifest, prev_state
+
     def is_python_model(self, node_id: str, base: Optional[bool] = False):
         manifest = self.curr_manifest if base is False else self.base_manifest
         model = manifest.nodes.get(node_id)
@@ -624,14 +817,17 @@ class DbtAdapter(BaseAdapter):
 
         return False
 
+    def _get_name_index(self, manifest) -> _ManifestNameIndex:
+        """Return the name index of a manifest, built once per manifest object."""
+        entry = self._name_indexes.get(id(manifest))
+        if entry is None or entry[0] is not manifest:
+            entry = (manifest, _ManifestNameIndex.build(manifest))
+            self._name_indexes[id(manifest)] = entry
+        return entry[1]
+
     def find_node_by_name(self, node_name, base=False) -> Optional[ManifestNode]:
         manifest = self.curr_manifest if base is False else self.base_manifest
-
-        for key, node in manifest.nodes.items():
-            if node.name == node_name:
-                return node
-
-        return None
+        return self._get_name_index(manifest).find_node(node_name)
 
     def catalog_column_types(self, model: str, base: bool = False) -> Dict[str, str]:
         """Resolve each column's true DB type for a model from the loaded catalog.
@@ -661,6 +857,33 @@ class DbtAdapter(BaseAdapter):
 
         return {col_name: col_metadata.type for col_name, col_metadata in catalog_node.columns.items()}
 
+    def get_relation_fingerprint(self, node_name: str, base: bool = False) -> Optional[str]:
+        """Fingerprint the relation a model name resolves to in one environment.
+
+        Combines the relation name, the file checksum, the compiled SQL and the
+        catalog stats (row count and last-modified time on warehouses that report
+        them), so rebuilding a model with different SQL or data changes the value.
+        Returns None when the name does not resolve to a node.
+        """
+        node = self.find_node_by_name(node_name, base=base)
+        if node is None:
+            return None
+
+        catalog = self.curr_catalog if base is False else self.base_catalog
+        catalog_node = catalog.nodes.get(node.unique_id) if catalog is not None else None
+        stats = {}
+        if catalog_node is not None:
+            stats = {key: stat.value for key, stat in catalog_node.stats.items() if stat.include}
+
+        payload = {
+            "unique_id": node.unique_id,
+            "relation_name": getattr(node, "relation_name", None),
+            "checksum": node.checksum.checksum if getattr(node, "checksum", None) else None,
+            "compiled_code": getattr(node, "compiled_code", None),
+            "stats": stats,
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
     def get_node_name_by_id(self, unique_id):
         if unique_id.startswith("source."):
             if unique_id in self.curr_manifest.sources:
@@ -757,11 +980,10 @@ class DbtAdapter(BaseAdapter):
 
     def build_parent_map(self, nodes: Dict, base: Optional[bool] = False) -> Dict[str, List[str]]:
         manifest = self.curr_manifest if base is False else self.base_manifest
-        manifest_dict = manifest.to_dict()
 
         node_ids = nodes.keys()
         parent_map = {}
-        for k, parents in manifest_dict["parent_map"].items():
+        for k, parents in (manifest.parent_map or {}).items():
             if k not in node_ids:
                 continue
             parent_map[k] = [parent for parent in parents if parent in node_ids]
@@ -770,10 +992,10 @@ class DbtAdapter(BaseAdapter):
 
     def build_parent_list_per_node(self, node_id: str, base: Optional[bool] = False) -> List[str]:
         manifest = self.curr_manifest if base is False else self.base_manifest
-        manifest_dict = manifest.to_dict()
+        parent_map = manifest.parent_map or {}
 
-        if node_id in manifest_dict["parent_map"]:
-            return manifest_dict["parent_map"][node_id]
+        if node_id in parent_map:
+            return parent_map[node_id]
 
     def get_lineage(self, base: Optional[bool] = False):
         manifest = self.curr_manifest if base is False else self.base_manifest
@@ -807,6 +1029,41 @@ class DbtAdapter(BaseAdapter):
     def _get_merged_lineage_cached(self, cache_key) -> MergedLineage:
         return build_merged_lineage(self.get_lineage_diff())
 
+    def get_lineage_version(self) -> str:
+        cache_key = hash(
+            (
+                id(self.base_manifest),
+                id(self.base_catalog),
+                id(self.curr_manifest),
+                id(self.curr_catalog),
+            )
+        )
+        return self._get_lineage_version_cached(cache_key)
+
+    @lru_cache(maxsize=1)
+    def _get_lineage_version_cached(self, cache_key) -> str:
+        """Digest of the artifact metadata, node checksums and catalog columns of both environments."""
+        h = hashlib.sha256()
+        for manifest, catalog in [(self.base_manifest, self.base_catalog), (self.curr_manifest, self.curr_catalog)]:
+            h.update(b"\x01")
+            if manifest is not None:
+                h.update(f"{manifest.metadata.invocation_id}\x00{manifest.metadata.generated_at}\x00".encode("utf-8"))
+                for key in ["nodes", "sources", "exposures", "metrics", "semantic_models"]:
+                    resources = getattr(manifest, key, None) or {}
+                    for unique_id in sorted(resources):
+                        checksum = getattr(resources[unique_id], "checksum", None)
+                        h.update(f"{unique_id}\x00{getattr(checksum, 'checksum', '')}\x00".encode("utf-8"))
+            h.update(b"\x01")
+            if catalog is not None:
+                h.update(f"{catalog.metadata.invocation_id}\x00{catalog.metadata.generated_at}\x00".encode("utf-8"))
+                for tables in [catalog.nodes, catalog.sources]:
+                    for unique_id in sorted(tables):
+                        h.update(unique_id.encode("utf-8"))
+                        for name, column in tables[unique_id].columns.items():
+                            h.update(f"\x00{name}\x00{column.type}".encode("utf-8"))
+                        h.update(b"\x00")
+        return h.hexdigest()
+
     @lru_cache(maxsize=2)
     def get_lineage_cached(self, base: Optional[bool] = False, cache_key=0):
         if base is False:
@@ -819,38 +1076,39 @@ class DbtAdapter(BaseAdapter):
         manifest_metadata = manifest.metadata if manifest is not None else None
         catalog_metadata = catalog.metadata if catalog is not None else None
 
-        manifest_dict = manifest.to_dict()
-
+        # Read the handful of fields lineage needs straight off the typed manifest objects.
+        # manifest.to_dict() would serialize every node, macro and doc only to discard most of it.
+        child_map_all = manifest.child_map or {}
         nodes = {}
 
-        for node in manifest_dict["nodes"].values():
-            unique_id = node["unique_id"]
-            resource_type = node["resource_type"]
+        for node in manifest.nodes.values():
+            unique_id = node.unique_id
+            resource_type = _enum_value(node.resource_type)
 
             if resource_type not in ["model", "seed", "exposure", "snapshot"]:
                 continue
 
             nodes[unique_id] = {
-                "id": node["unique_id"],
-                "name": node["name"],
-                "resource_type": node["resource_type"],
-                "package_name": node["package_name"],
-                "schema": node["schema"],
-                "config": node["config"],
-                "checksum": node["checksum"],
-                "raw_code": node["raw_code"],
+                "id": unique_id,
+                "name": node.name,
+                "resource_type": resource_type,
+                "package_name": node.package_name,
+                "schema": node.schema,
+                "config": node.config.to_dict(),
+                "checksum": node.checksum.to_dict(),
+                "raw_code": node.raw_code,
             }
 
             # List of <type>.<package_name>.<node_name>.<hash>
             # model.jaffle_shop.customer_segments
             # test.jaffle_shop.not_null_customers_customer_id.5c9bf9911d
             # test.jaffle_shop.unique_customers_customer_id.c5af1ff4b1
-            child_map: List[str] = manifest_dict["child_map"][unique_id]
+            child_map: List[str] = child_map_all.get(unique_id, [])
             cols_not_null = []
             cols_unique = []
 
             for child in child_map:
-                node_name = node["name"]
+                node_name = node.name
                 comps = child.split(".")
                 if len(comps) < MIN_DBT_NODE_COMPOSITION:
                     # only happens in unittest
@@ -882,16 +1140,16 @@ class DbtAdapter(BaseAdapter):
                 if primary_key:
                     nodes[unique_id]["primary_key"] = primary_key
 
-        for source in manifest_dict["sources"].values():
-            unique_id = source["unique_id"]
+        for source in manifest.sources.values():
+            unique_id = source.unique_id
 
             nodes[unique_id] = {
-                "id": source["unique_id"],
-                "name": source["name"],
-                "source_name": source["source_name"],
-                "resource_type": source["resource_type"],
-                "package_name": source["package_name"],
-                "config": source["config"],
+                "id": unique_id,
+                "name": source.name,
+                "source_name": source.source_name,
+                "resource_type": _enum_value(source.resource_type),
+                "package_name": source.package_name,
+                "config": source.config.to_dict(),
             }
 
             if catalog is not None and unique_id in catalog.sources:
@@ -900,31 +1158,17 @@ class DbtAdapter(BaseAdapter):
                     for col_name, col_metadata in catalog.sources[unique_id].columns.items()
                 }
 
-        for exposure in manifest_dict["exposures"].values():
-            nodes[exposure["unique_id"]] = {
-                "id": exposure["unique_id"],
-                "name": exposure["name"],
-                "resource_type": exposure["resource_type"],
-                "package_name": exposure["package_name"],
-                "config": exposure["config"],
-            }
-        for metric in manifest_dict["metrics"].values():
-            nodes[metric["unique_id"]] = {
-                "id": metric["unique_id"],
-                "name": metric["name"],
-                "resource_type": metric["resource_type"],
-                "package_name": metric["package_name"],
-                "config": metric["config"],
-            }
-
-        if "semantic_models" in manifest_dict:
-            for semantic_models in manifest_dict["semantic_models"].values():
-                nodes[semantic_models["unique_id"]] = {
-                    "id": semantic_models["unique_id"],
-                    "name": semantic_models["name"],
-                    "resource_type": semantic_models["resource_type"],
-                    "package_name": semantic_models["package_name"],
-                    "config": semantic_models["config"],
+        others = [manifest.exposures, manifest.metrics]
+        if getattr(manifest, "semantic_models", None) is not None:
+            others.append(manifest.semantic_models)
+        for resources in others:
+            for resource in resources.values():
+                nodes[resource.unique_id] = {
+                    "id": resource.unique_id,
+                    "name": resource.name,
+                    "resource_type": _enum_value(resource.resource_type),
+                    "package_name": resource.package_name,
+                    "config": resource.config.to_dict(),
                 }
 
         parent_map = self.build_parent_map(nodes, base)
@@ -982,120 +1226,239 @@ class DbtAdapter(BaseAdapter):
 
     @lru_cache(maxsize=128)
     def get_change_analysis_cached(self, node_id: str):
-        breaking_perf_tracker = BreakingPerformanceTracking()
-        lineage_diff = self.get_lineage_diff()
-        diff = lineage_diff.diff
+        diff = self.get_lineage_diff().diff
+        node_diff = diff.get(node_id)
+        if node_diff is not None and node_diff.change_status == "modified" and node_diff.change is None:
+            self.classify_modified_nodes([node_id])
+        return node_diff
+
+    # Modified nodes per worker process when classify_modified_nodes picks the pool size
+    _CHANGE_CLASSIFY_NODES_PER_WORKER = 16
+
+    def classify_modified_nodes(
+        self, node_ids: Optional[List[str]] = None, jobs: Optional[int] = None
+    ) -> Dict[str, NodeDiff]:
+        """Classify the changes of many modified nodes in one batch.
 
-        if node_id not in diff or diff[node_id].change_status != "modified":
-            return diff.get(node_id)
+        Defaults to every modified node of the lineage diff; nodes that already
+        carry a classification are skipped. Results are read from and written to
+        the CLL cache under a key of the base and current checksums, so re-opening
+        the same PR skips the sqlglot parsing.
 
-        breaking_perf_tracker.increment_modified_nodes()
+        The remaining nodes are parsed by ``parse_change_category`` in a pool of
+        ``jobs`` worker processes. By default a worker is started for every
+        ``_CHANGE_CLASSIFY_NODES_PER_WORKER`` nodes, up to the CPU count, and
+        small batches stay in-process.
+
+        Sets ``change`` on the NodeDiff of each classified node and returns them.
+        """
+        breaking_perf_tracker = BreakingPerformanceTracking()
         breaking_perf_tracker.start_lineage_diff()
 
+        lineage_diff = self.get_lineage_diff()
+        diff = lineage_diff.diff
         base = lineage_diff.base
         current = lineage_diff.current
+        if node_ids is None:
+            node_ids = list(diff)
+        node_ids = [
+            nid
+            for nid in node_ids
+            if nid in diff and diff[nid].change_status == "modified" and diff[nid].change is None
+        ]
+        if not node_ids:
+            return {}
 
-        curr_manifest = self.manifest
+        dialect = self.adapter.connections.TYPE
+        if self.manifest.metadata.adapter_type is not None:
+            dialect = self.manifest.metadata.adapter_type
         breaking_perf_tracker.record_checkpoint("manifest")
 
-        def ref_func(*args):
-            if len(args) == 1:
-                node = args[0]
-            elif len(args) > 1:
-                node = args[1]
-            else:
-                return None
-            return node
+        changes: Dict[str, NodeChange] = {}
+        content_keys = {}
+        schemas = {}
+        for nid in node_ids:
+            breaking_perf_tracker.increment_modified_nodes()
+            base_node = base.get("nodes", {}).get(nid)
+            curr_node = current.get("nodes", {}).get(nid)
+            if (
+                curr_node.get("resource_type") not in ["model", "snapshot"]
+                or curr_node.get("raw_code") is None
+                or base_node.get("raw_code") is None
+            ):
+                changes[nid] = NodeChange(category="unknown")
+                continue
+            try:
+                schema = (self._get_change_analysis_schema(base, nid), self._get_change_analysis_schema(current, nid))
+                content_key = self._make_change_content_key(
+                    str((base_node.get("checksum") or {}).get("checksum")),
+                    str((curr_node.get("checksum") or {}).get("checksum")),
+                    schema[0],
+                    schema[1],
+                    dialect,
+                )
+            except Exception:
+                # A bad node is classified as unknown instead of failing the whole batch
+                changes[nid] = NodeChange(category="unknown")
+                continue
+            schemas[nid] = schema
+            content_keys[nid] = content_key
 
-        def source_func(source_name, table_name):
-            source_name = source_name.replace("-", "_")
-            return f"__{source_name}__{table_name}"
+        cache = get_cll_cache()
+        parsed: Dict[str, NodeChange] = {}
+        for nid, cached_json in cache.get_nodes(content_keys.items()).items():
+            try:
+                parsed[nid] = NodeChange.model_validate_json(cached_json)
+            except Exception as e:
+                logger.debug("[change cache] corrupted entry for %s, reclassifying: %s", nid, e)
+        cache_hits = len(parsed)
+        breaking_perf_tracker.record_checkpoint("cache")
 
         jinja_context = dict(
-            ref=ref_func,
-            source=source_func,
+            ref=self._change_analysis_ref,
+            source=self._change_analysis_source,
         )
-
-        base_node = base.get("nodes", {}).get(node_id)
-        curr_node = current.get("nodes", {}).get(node_id)
-        change = NodeChange(category="unknown")
-        if (
-            curr_node.get("resource_type") in ["model", "snapshot"]
-            and curr_node.get("raw_code") is not None
-            and base_node.get("raw_code") is not None
-        ):
+        pending = {}
+        for nid in content_keys:
+            if nid in parsed:
+                continue
             try:
+                base_sql = self.generate_sql(base["nodes"][nid].get("raw_code"), base=True, context=jinja_context)
+                curr_sql = self.generate_sql(current["nodes"][nid].get("raw_code"), base=False, context=jinja_context)
+            except Exception:
+                changes[nid] = NodeChange(category="unknown")
+                continue
+            pending[nid] = (base_sql, curr_sql, schemas[nid][0], schemas[nid][1], dialect)
+        breaking_perf_tracker.record_checkpoint("render")
 
-                def _get_schema(lineage):
-                    schema = {}
-                    nodes = lineage["nodes"]
-                    parent_list = lineage["parent_map"].get(node_id, [])
-                    for parent_id in parent_list:
-                        parent_node = nodes.get(parent_id)
-                        if parent_node is None:
-                            continue
-                        columns = parent_node.get("columns") or {}
-                        name = parent_node.get("name")
-                        if parent_node.get("resource_type") == "source":
-                            parts = parent_id.split(".")
-                            source = parts[2]
-                            table = parts[3]
-                            source = source.replace("-", "_")
-                            name = f"__{source}__{table}"
-                        schema[name] = {name: column.get("type") for name, column in columns.items()}
-                    return schema
-
-                base_sql = self.generate_sql(
-                    base_node.get("raw_code"),
-                    base=True,
-                    context=jinja_context,
-                )
-                curr_sql = self.generate_sql(
-                    curr_node.get("raw_code"),
-                    base=False,
-                    context=jinja_context,
-                )
-                base_schema = _get_schema(base)
-                curr_schema = _get_schema(current)
-                dialect = self.adapter.connections.TYPE
-                if curr_manifest.metadata.adapter_type is not None:
-                    dialect = curr_manifest.metadata.adapter_type
-
-                change = parse_change_category(
-                    base_sql,
-                    curr_sql,
-                    old_schema=base_schema,
-                    new_schema=curr_schema,
-                    dialect=dialect,
-                    perf_tracking=breaking_perf_tracker,
-                )
-
-                # Make sure that the case of the column names are the same
-                changed_columns = {
-                    column.lower(): change_status for column, change_status in (change.columns or {}).items()
-                }
-                changed_columns_names = set(changed_columns)
-                changed_columns_final = {}
+        if jobs is None:
+            jobs = min(os.cpu_count() or 1, len(pending) // self._CHANGE_CLASSIFY_NODES_PER_WORKER)
+        if jobs <= 1 or len(pending) <= 1:
+            for nid, args in pending.items():
+                try:
+                    parsed[nid] = parse_change_category(*args, perf_tracking=breaking_perf_tracker)
+                except Exception:
+                    # TODO: telemetry
+                    changes[nid] = NodeChange(category="unknown")
+        else:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+
+            from recce.util.change_classifier import change_category_worker
+
+            # spawn, not fork: the server process may hold dbt connections and watchdog threads
+            with ProcessPoolExecutor(
+                max_workers=min(jobs, len(pending)), mp_context=multiprocessing.get_context("spawn")
+            ) as executor:
+                futures = {nid: executor.submit(change_category_worker, *args) for nid, args in pending.items()}
+                for nid, future in futures.items():
+                    try:
+                        parsed[nid], counters = future.result()
+                    except Exception:
+                        changes[nid] = NodeChange(category="unknown")
+                        continue
+                    breaking_perf_tracker.sqlglot_error_nodes += counters["sqlglot_error_nodes"]
+                    breaking_perf_tracker.other_error_nodes += counters["other_error_nodes"]
+        breaking_perf_tracker.record_checkpoint("classify")
 
-                base_columns = base_node.get("columns") or {}
-                curr_columns = curr_node.get("columns") or {}
-                columns_names = set(base_columns) | set(curr_columns)
+        batch_to_store = [(nid, content_keys[nid], parsed[nid].model_dump_json()) for nid in pending if nid in parsed]
+        if batch_to_store:
+            cache.put_nodes_batch(batch_to_store)
 
-                for column_name in columns_names:
-                    if column_name.lower() in changed_columns_names:
-                        changed_columns_final[column_name] = changed_columns[column_name.lower()]
+        for nid, change in parsed.items():
+            changes[nid] = self._match_change_column_names(change, base["nodes"][nid], current["nodes"][nid])
 
-                change.columns = changed_columns_final
-            except Exception:
-                # TODO: telemetry
-                pass
+        result = {}
+        for nid, change in changes.items():
+            diff[nid].change = change
+            result[nid] = diff[nid]
 
         breaking_perf_tracker.end_lineage_diff()
-        log_performance("change analysis per node", breaking_perf_tracker.to_dict())
+        log_performance(
+            "change analysis",
+            {**breaking_perf_tracker.to_dict(), "cache_hits": cache_hits, "jobs": max(jobs, 1)},
+        )
         breaking_perf_tracker.reset()
-        node_diff = diff.get(node_id)
-        node_diff.change = change
-        return node_diff
+        return result
+
+    @staticmethod
+    def _change_analysis_ref(*args):
+        if len(args) == 1:
+            node = args[0]
+        elif len(args) > 1:
+            node = args[1]
+        else:
+            return None
+        return node
+
+    @staticmethod
+    def _change_analysis_source(source_name, table_name):
+        source_name = source_name.replace("-", "_")
+        return f"__{source_name}__{table_name}"
+
+    @staticmethod
+    def _get_change_analysis_schema(lineage: dict, node_id: str) -> dict:
+        """Schema of a node's parents, named the way the change analysis Jinja context renders them."""
+        schema = {}
+        nodes = lineage["nodes"]
+        parent_list = lineage["parent_map"].get(node_id, [])
+        for parent_id in parent_list:
+            parent_node = nodes.get(parent_id)
+            if parent_node is None:
+                continue
+            columns = parent_node.get("columns") or {}
+            name = parent_node.get("name")
+            if parent_node.get("resource_type") == "source":
+                parts = parent_id.split(".")
+                source = parts[2]
+                table = parts[3]
+                source = source.replace("-", "_")
+                name = f"__{source}__{table}"
+            schema[name] = {name: column.get("type") for name, column in columns.items()}
+        return schema
+
+    @staticmethod
+    def _match_change_column_names(change: NodeChange, base_node: dict, curr_node: dict) -> NodeChange:
+        """Map the changed columns reported by sqlglot back to the case used in the catalog."""
+        changed_columns = {column.lower(): change_status for column, change_status in (change.columns or {}).items()}
+        changed_columns_final = {}
+
+        base_columns = base_node.get("columns") or {}
+        curr_columns = curr_node.get("columns") or {}
+        columns_names = set(base_columns) | set(curr_columns)
+
+        for column_name in columns_names:
+            if column_name.lower() in changed_columns:
+                changed_columns_final[column_name] = changed_columns[column_name.lower()]
+
+        return change.model_copy(update={"columns": changed_columns_final})
+
+    @staticmethod
+    def _make_change_content_key(
+        base_checksum: str,
+        curr_checksum: str,
+        base_schema: dict,
+        curr_schema: dict,
+        dialect: str = "",
+    ) -> str:
+        """Content-based cache key for the change classification of a modified node.
+
+        Covers both checksums (dbt's sha256 of raw_code), the parent schemas the
+        SQL is qualified against, and the dialect. A leading ``change`` field
+        keeps these keys apart from the per-node CllData content keys.
+        """
+        h = hashlib.sha256()
+        for part in [
+            "change",
+            dialect or "",
+            base_checksum,
+            curr_checksum,
+            json.dumps(base_schema, sort_keys=True),
+            json.dumps(curr_schema, sort_keys=True),
+        ]:
+            h.update(part.encode("utf-8"))
+            h.update(b"\x00")
+        return h.hexdigest()
 
     @staticmethod
     def _make_node_content_key(
@@ -1143,31 +1506,149 @@ class DbtAdapter(BaseAdapter):
                 return str(cs.checksum)
         return nid
 
+    # Version of the compact per-node encoding below. Bump together with
+    # recce.util.cll._CACHE_SCHEMA_VERSION so old rows miss instead of failing to decode.
+    _CLL_ENCODING_VERSION = 1
+
     @staticmethod
     def _serialize_cll_data(cll_data: CllData) -> str:
-        """Serialize a per-node CllData to JSON, excluding change analysis fields (change_status, change_category)."""
+        """Serialize a per-node CllData for the CLL cache, excluding change analysis fields.
+
+        Uses a compact positional encoding: every node and column id is interned
+        once in ``ids`` and referenced by index, ``parent_map`` is stored as index
+        lists, and a column object shared by ``node.columns`` and ``columns`` is
+        stored once.
+        """
+        ids: List[str] = []
+        id_index: Dict[str, int] = {}
+
+        def intern(value: Optional[str]) -> int:
+            if value is None:
+                return -1
+            index = id_index.get(value)
+            if index is None:
+                index = id_index[value] = len(ids)
+                ids.append(value)
+            return index
+
+        column_rows = []
+        column_index: Dict[int, int] = {}
+
+        def column_ref(col: CllColumn) -> int:
+            # Keyed by object identity to keep the sharing get_cll_cached sets up
+            index = column_index.get(id(col))
+            if index is None:
+                index = column_index[id(col)] = len(column_rows)
+                column_rows.append(
+                    [
+                        intern(col.id),
+                        intern(col.table_id),
+                        col.name,
+                        col.type,
+                        col.transformation_type,
+                        [[intern(dep.node), dep.column] for dep in col.depends_on],
+                    ]
+                )
+            return index
+
+        node_rows = [
+            [
+                intern(nid),
+                intern(n.id),
+                n.name,
+                n.package_name,
+                n.resource_type,
+                n.source_name,
+                n.impacted,
+                [[c_name, column_ref(c)] for c_name, c in n.columns.items()],
+            ]
+            for nid, n in cll_data.nodes.items()
+        ]
+        columns = [[intern(cid), column_ref(c)] for cid, c in cll_data.columns.items()]
+        parent_map = [[intern(pid), [intern(p) for p in parents]] for pid, parents in cll_data.parent_map.items()]
+
         return json.dumps(
             {
-                "nodes": {
-                    nid: n.model_dump(exclude={"change_status", "change_category"}) for nid, n in cll_data.nodes.items()
-                },
-                "columns": {cid: c.model_dump(exclude={"change_status"}) for cid, c in cll_data.columns.items()},
-                "parent_map": {pid: list(parents) for pid, parents in cll_data.parent_map.items()},
-            }
+                "v": DbtAdapter._CLL_ENCODING_VERSION,
+                "ids": ids,
+                "column_rows": column_rows,
+                "nodes": node_rows,
+                "columns": columns,
+                "parent_map": parent_map,
+            },
+            separators=(",", ":"),
         )
 
     @staticmethod
     def _deserialize_cll_data(data_str: str) -> CllData:
-        """Deserialize a per-node CllData from JSON."""
+        """Deserialize a per-node CllData written by ``_serialize_cll_data``.
+
+        Cache rows are written by Recce itself, so models are built with
+        ``model_construct`` and skip pydantic validation.
+        """
         data = json.loads(data_str)
-        return CllData(
-            nodes={nid: CllNode(**n) for nid, n in data["nodes"].items()},
-            columns={cid: CllColumn(**c) for cid, c in data["columns"].items()},
-            parent_map={pid: set(parents) for pid, parents in data["parent_map"].items()},
+        if data.get("v") != DbtAdapter._CLL_ENCODING_VERSION:
+            raise ValueError(f"Unsupported CLL cache encoding: {data.get('v')}")
+        ids = data["ids"]
+
+        column_objs = [
+            CllColumn.model_construct(
+                id=ids[id_idx] if id_idx >= 0 else None,
+                table_id=ids[table_idx] if table_idx >= 0 else None,
+                name=name,
+                type=col_type,
+                transformation_type=transformation_type,
+                depends_on=[CllColumnDep.model_construct(node=ids[node_idx], column=col) for node_idx, col in deps],
+            )
+            for id_idx, table_idx, name, col_type, transformation_type, deps in data["column_rows"]
+        ]
+        nodes = {
+            ids[key_idx]: CllNode.model_construct(
+                id=ids[id_idx],
+                name=name,
+                package_name=package_name,
+                resource_type=resource_type,
+                source_name=source_name,
+                impacted=impacted,
+                columns={c_name: column_objs[c_idx] for c_name, c_idx in node_columns},
+            )
+            for key_idx, id_idx, name, package_name, resource_type, source_name, impacted, node_columns in data["nodes"]
+        }
+        return CllData.model_construct(
+            nodes=nodes,
+            columns={ids[cid_idx]: column_objs[c_idx] for cid_idx, c_idx in data["columns"]},
+            parent_map={ids[pid_idx]: {ids[p] for p in parents} for pid_idx, parents in data["parent_map"]},
+            child_map={},
         )
 
+    @staticmethod
+    def _copy_cll_data_without_change(cll_data: CllData) -> CllData:
+        """Shallow-copy a per-node CllData with its change analysis fields cleared.
+
+        Keeps a column shared between ``node.columns`` and ``columns`` shared in the copy.
+        """
+        columns = {}
+        copied = {}
+        for c_id, c in cll_data.columns.items():
+            columns[c_id] = copied[id(c)] = c.model_copy(update={"change_status": None})
+        nodes = {}
+        for n_id, n in cll_data.nodes.items():
+            node_columns = {
+                c_name: copied.get(id(c)) or c.model_copy(update={"change_status": None})
+                for c_name, c in n.columns.items()
+            }
+            nodes[n_id] = n.model_copy(
+                update={"change_status": None, "change_category": None, "impacted": None, "columns": node_columns}
+            )
+        return CllData.model_construct(nodes=nodes, columns=columns, parent_map=cll_data.parent_map, child_map={})
+
     def build_full_cll_map(self) -> CllData:
-        """Build the full CLL map for every node in the manifest. Result is cached."""
+        """Build the full CLL map for every node in the manifest. Result is cached.
+
+        After an artifact reload, nodes whose content key is unchanged and that have
+        no changed ancestor reuse their per-node data from the previous map. Only
+        the changed nodes and their dependents go through the cache or get recomputed.
+        """
         if self._full_cll_map is not None:
             return self._full_cll_map
 
@@ -1193,8 +1674,11 @@ class DbtAdapter(BaseAdapter):
         parent_map = {}
         node_cache_hits = 0
         node_cache_misses = 0
+        node_reused = 0
         batch_to_store = []
 
+        content_keys = {}
+        parent_lists = {}
         for node_id in all_node_ids:
             checksum = self._get_node_checksum(manifest, node_id)
             p_list: List[str] = []
@@ -1224,9 +1708,31 @@ class DbtAdapter(BaseAdapter):
                     p_list = n.depends_on.nodes
 
             parent_checksums = [self._get_node_checksum(manifest, pid) for pid in p_list]
-            content_key = self._make_node_content_key(checksum, parent_checksums, col_names, adapter_type)
+            content_keys[node_id] = self._make_node_content_key(checksum, parent_checksums, col_names, adapter_type)
+            parent_lists[node_id] = p_list
+
+        # Reuse the previous map's data for nodes that are unchanged and not downstream of a change
+        previous_parts = self._full_cll_parts
+        dirty = {nid for nid, key in content_keys.items() if previous_parts.get(nid, (None,))[0] != key}
+        if previous_parts and dirty:
+            dirty |= LineageIndex(parent_lists).downstream(dirty)
+        reusable = {nid for nid in content_keys if nid in previous_parts and nid not in dirty}
+        parts = {}
+
+        # One bulk read instead of a SQLite round-trip per node
+        cached_entries = cache.get_nodes((nid, key) for nid, key in content_keys.items() if nid not in reusable)
+
+        for node_id, content_key in content_keys.items():
+            if node_id in reusable:
+                cll_data_one = self._copy_cll_data_without_change(previous_parts[node_id][1])
+                node_reused += 1
+                parts[node_id] = (content_key, cll_data_one)
+                nodes[node_id] = cll_data_one.nodes.get(node_id)
+                columns.update(cll_data_one.columns)
+                parent_map.update(cll_data_one.parent_map)
+                continue
 
-            cached_json = cache.get_node(node_id, content_key)
+            cached_json = cached_entries.get(node_id)
             if cached_json:
                 try:
                     cll_data_one = self._deserialize_cll_data(cached_json)
@@ -1258,11 +1764,13 @@ class DbtAdapter(BaseAdapter):
                     logger.debug("[cll cache] failed to serialize %s: %s", node_id, e)
 
             # Merge per-node data into accumulators
+            parts[node_id] = (content_key, cll_data_one)
             nodes[node_id] = cll_data_one.nodes.get(node_id)
             for c_id, c in cll_data_one.columns.items():
                 columns[c_id] = c
             for p_id, parents in cll_data_one.parent_map.items():
                 parent_map[p_id] = parents
+        self._full_cll_parts = parts
 
         # Batch-write newly computed entries
         batch_write_ok = cache.put_nodes_batch(batch_to_store) if batch_to_store else True
@@ -1274,6 +1782,7 @@ class DbtAdapter(BaseAdapter):
             {
                 "node_cache_hits": node_cache_hits,
                 "node_cache_misses": node_cache_misses,
+                "node_reused": node_reused,
                 "hit_pct": hit_pct,
                 "batch_stored": len(batch_to_store) if batch_write_ok else 0,
             },
@@ -1287,7 +1796,8 @@ class DbtAdapter(BaseAdapter):
                     child_map[parent] = set()
                 child_map[parent].add(parent_id)
 
-        # Add change analysis for all nodes
+        # Add change analysis for all nodes, classifying the modified ones in one batch
+        self.classify_modified_nodes()
         for node_id, node in nodes.items():
             node_diff = self.get_change_analysis_cached(node_id)
             if node_diff is not None:
@@ -1352,8 +1862,19 @@ class DbtAdapter(BaseAdapter):
             cll_tracker.reset()
             return result
 
+        if node_id is not None and column is not None and not no_cll and not no_filter and not disable_cll_cache:
+            result = self._get_column_cll_from_index(
+                node_id, column, change_analysis, no_upstream, no_downstream, cll_tracker
+            )
+            cll_tracker.end_column_lineage()
+            cll_tracker.set_total_nodes(len(result.nodes) + len(result.columns))
+            log_performance("column level lineage [column_index]", cll_tracker.to_dict())
+            cll_tracker.reset()
+            return result
+
         manifest = self.curr_manifest
-        manifest_dict = manifest.to_dict()
+        if change_analysis:
+            self.classify_modified_nodes()
 
         # Find related model nodes
         if node_id is not None:
@@ -1370,38 +1891,32 @@ class DbtAdapter(BaseAdapter):
         child_map = {}
 
         if not no_upstream:
-            cll_node_ids = cll_node_ids.union(find_upstream(cll_node_ids, manifest_dict.get("parent_map")))
+            cll_node_ids = cll_node_ids.union(find_upstream(cll_node_ids, manifest.parent_map or {}))
         if not no_downstream:
-            cll_node_ids = cll_node_ids.union(find_downstream(cll_node_ids, manifest_dict.get("child_map")))
+            cll_node_ids = cll_node_ids.union(find_downstream(cll_node_ids, manifest.child_map or {}))
 
         if not no_cll:
             if not disable_cll_cache:
-                # Full map path: build entire CLL map once (cached), then slice
+                # Full map path: build entire CLL map once (cached), then slice.
+                # The full map is shared across requests and must not be mutated,
+                # so each selected node gets a shallow overlay (model_copy) with
+                # its own columns dict and masked change fields. Columns are only
+                # copied when their change status has to be masked.
                 full_map_data = self.build_full_cll_map()
 
                 for cll_node_id in cll_node_ids:
-                    if cll_node_id not in full_map_data.nodes:
+                    full_node = full_map_data.nodes.get(cll_node_id)
+                    if full_node is None:
                         continue
                     cll_tracker.increment_cll_nodes()
-                    nodes[cll_node_id] = deepcopy(full_map_data.nodes[cll_node_id])
-
-                    for c_name in nodes[cll_node_id].columns:
-                        col_id = f"{cll_node_id}_{c_name}"
-                        if col_id in full_map_data.columns:
-                            columns[col_id] = deepcopy(full_map_data.columns[col_id])
+                    nodes[cll_node_id] = self._overlay_cll_node(full_map_data, full_node, columns, change_analysis)
 
+                # Parent sets are only read from here on, so they are shared with the full map
                 for key in list(nodes.keys()) + list(columns.keys()):
                     if key in full_map_data.parent_map:
-                        parent_map[key] = set(full_map_data.parent_map[key])
-
-                if not change_analysis:
-                    for node in nodes.values():
-                        node.change_status = None
-                        node.change_category = None
-                        node.impacted = None
-                    for col in columns.values():
-                        col.change_status = None
-                else:
+                        parent_map[key] = full_map_data.parent_map[key]
+
+                if change_analysis:
                     for _ in nodes:
                         cll_tracker.increment_change_analysis_nodes()
             else:
@@ -1614,6 +2129,109 @@ class DbtAdapter(BaseAdapter):
             child_map=child_map,
         )
 
+    @staticmethod
+    def _overlay_cll_node(
+        full_map: CllData,
+        full_node: CllNode,
+        columns: Dict[str, CllColumn],
+        change_analysis: bool,
+        column_ids: Optional[Set[str]] = None,
+    ) -> CllNode:
+        """Return a shallow per-request copy of a node from the shared full CLL map.
+
+        The copy gets its own ``columns`` dict (restricted to ``column_ids`` if
+        given) and, without ``change_analysis``, masked change fields. Columns are
+        shared with the full map unless their change status has to be masked.
+        The selected columns are also added to ``columns``.
+        """
+
+        def overlay_column(col: CllColumn) -> CllColumn:
+            if change_analysis or col.change_status is None:
+                return col
+            return col.model_copy(update={"change_status": None})
+
+        node_columns = {}
+        for c_name, c in full_node.columns.items():
+            col_id = f"{full_node.id}_{c_name}"
+            if column_ids is not None and c.id not in column_ids:
+                continue
+            full_col = full_map.columns.get(col_id)
+            if full_col is not None:
+                columns[col_id] = overlay_column(full_col)
+            node_columns[c_name] = columns[col_id] if full_col is c else overlay_column(c)
+
+        update = {"columns": node_columns}
+        if not change_analysis:
+            update.update(change_status=None, change_category=None, impacted=None)
+        return full_node.model_copy(update=update)
+
+    def _get_full_cll_index(self) -> LineageIndex:
+        """Return the reachability index of the full CLL map, built once per map."""
+        full_map = self.build_full_cll_map()
+        index = self._full_cll_index
+        if index is None or index.parent_map is not full_map.parent_map:
+            index = self._full_cll_index = LineageIndex(full_map.parent_map)
+        return index
+
+    def _get_column_cll_from_index(
+        self,
+        node_id: str,
+        column: str,
+        change_analysis: bool,
+        no_upstream: bool,
+        no_downstream: bool,
+        cll_tracker: LineagePerfTracker,
+    ) -> CllData:
+        """Column lineage of one column, read from the full CLL map through its index.
+
+        Equivalent to slicing the node-level lineage of ``node_id`` and then
+        filtering it to the column's dependencies, but only touches the ids
+        reachable from the column.
+        """
+        full_map = self.build_full_cll_map()
+        index = self._get_full_cll_index()
+
+        anchor_id = f"{node_id}_{column}"
+        cll_tracker.set_init_nodes(1)
+        cll_tracker.set_anchor_nodes(1)
+        result_ids = {anchor_id}
+        if not no_upstream:
+            result_ids |= index.upstream([anchor_id])
+        if not no_downstream:
+            result_ids |= index.downstream([anchor_id])
+
+        # As in get_cll, a node is only part of the result if the node itself is
+        # reachable; reachable columns are returned on their own otherwise.
+        nodes = {}
+        columns = {}
+        for result_id in result_ids:
+            full_node = full_map.nodes.get(result_id)
+            if full_node is None:
+                continue
+            cll_tracker.increment_cll_nodes()
+            node = self._overlay_cll_node(full_map, full_node, columns, change_analysis, result_ids)
+            if change_analysis:
+                cll_tracker.increment_change_analysis_nodes()
+                node.impacted = True
+            nodes[result_id] = node
+
+        for result_id in result_ids:
+            full_col = full_map.columns.get(result_id)
+            if full_col is not None and result_id not in columns:
+                if not change_analysis and full_col.change_status is not None:
+                    full_col = full_col.model_copy(update={"change_status": None})
+                columns[result_id] = full_col
+
+        parent_map = {}
+        child_map = {}
+        for result_id in result_ids:
+            if result_id in full_map.parent_map:
+                parent_map[result_id] = {p for p in full_map.parent_map[result_id] if p in result_ids}
+            if result_id in full_map.child_map:
+                child_map[result_id] = {c for c in full_map.child_map[result_id] if c in result_ids}
+
+        return CllData(nodes=nodes, columns=columns, parent_map=parent_map, child_map=child_map)
+
     @staticmethod
     def _get_parent_table_name(manifest, parent_id: str) -> Optional[str]:
         """Get the table name (alias) for a parent node as it appears in compiled SQL."""
@@ -1694,47 +2312,49 @@ class DbtAdapter(BaseAdapter):
         table_id_map[key] = result
         return result
 
-    @lru_cache(maxsize=128)
-    def get_cll_cached(self, node_id: str, base: Optional[bool] = False) -> Optional[CllData]:
-        cll_tracker = CLLPerformanceTracking()
+    @staticmethod
+    def _apply_all_columns(node: CllNode, parent_list: List[str], transformation_type) -> CllData:
+        cll_data = CllData()
+        cll_data.nodes[node.id] = node
+        cll_data.parent_map[node.id] = set(parent_list)
+        for col in node.columns.values():
+            column_id = f"{node.id}_{col.name}"
+            col.transformation_type = transformation_type
+            cll_data.columns[column_id] = col
+            cll_data.parent_map[column_id] = set()
+        return cll_data
+
+    def _prepare_cll_job(self, node_id: str, base: Optional[bool] = False) -> Union[None, CllData, "_CllJob"]:
+        """Collect everything needed to compute the CLL of a node.
 
+        Returns ``None`` if the node does not exist, a finished ``CllData`` if
+        the lineage does not need SQL parsing (sources, seeds, python models,
+        ...), or a ``_CllJob`` whose SQL still has to go through ``cll()``.
+        """
         node, parent_list = self.get_cll_node(node_id, base=base)
         if node is None:
             return None
 
-        cll_tracker.set_total_nodes(1)
-        cll_tracker.start_column_lineage()
-
-        def _apply_all_columns(node: CllNode, transformation_type):
-            cll_data = CllData()
-            cll_data.nodes[node.id] = node
-            cll_data.parent_map[node.id] = set(parent_list)
-            for col in node.columns.values():
-                column_id = f"{node.id}_{col.name}"
-                col.transformation_type = transformation_type
-                cll_data.columns[column_id] = col
-                cll_data.parent_map[column_id] = set()
-            return cll_data
-
         manifest = self.manifest if base is False else self.previous_state.manifest
         catalog = self.curr_catalog if base is False else self.base_catalog
         resource_type = node.resource_type
         if resource_type not in {"model", "seed", "source", "snapshot"}:
-            return _apply_all_columns(node, "unknown")
+            return self._apply_all_columns(node, parent_list, "unknown")
 
         if resource_type == "source" or resource_type == "seed":
-            return _apply_all_columns(node, "source")
+            return self._apply_all_columns(node, parent_list, "source")
 
         if node.raw_code is None or self.is_python_model(node.id, base=base):
-            return _apply_all_columns(node, "unknown")
+            return self._apply_all_columns(node, parent_list, "unknown")
 
         if node.name == "metricflow_time_spine":
-            return _apply_all_columns(node, "source")
+            return self._apply_all_columns(node, parent_list, "source")
 
         if not node.columns:
-            return _apply_all_columns(node, "unknown")
+            return self._apply_all_columns(node, parent_list, "unknown")
 
         table_id_map = {}
+        jinja_context = None
 
         # Check if the manifest node already has compiled SQL
         manifest_node = manifest.nodes.get(node_id)
@@ -1773,6 +2393,8 @@ class DbtAdapter(BaseAdapter):
                 node_id,
             )
 
+            name_index = self._get_name_index(manifest)
+
             def ref_func(*args):
                 node_name: str = None
                 project_or_package: str = None
@@ -1783,36 +2405,27 @@ class DbtAdapter(BaseAdapter):
                     project_or_package = args[0]
                     node_name = args[1]
 
-                for key, n in manifest.nodes.items():
-                    if n.name != node_name:
-                        continue
-                    if project_or_package is not None and n.package_name != project_or_package:
-                        continue
-
-                    # replace id "." to "_"
-                    unique_id = n.unique_id
-                    table_name = unique_id.replace(".", "_")
-                    table_id_map[table_name.lower()] = unique_id
-                    return table_name
+                n = name_index.find_node(node_name, project_or_package)
+                if n is None:
+                    raise ValueError(f"Cannot find node {node_name} in the manifest")
 
-                raise ValueError(f"Cannot find node {node_name} in the manifest")
+                # replace id "." to "_"
+                unique_id = n.unique_id
+                table_name = unique_id.replace(".", "_")
+                table_id_map[table_name.lower()] = unique_id
+                return table_name
 
             def source_func(source_name, name):
-                for key, n in manifest.sources.items():
-                    if n.source_name != source_name:
-                        continue
-                    if n.name != name:
-                        continue
-
-                    # replace id "." to "_"
-                    unique_id = n.unique_id
-                    table_name = unique_id.replace(".", "_")
-                    table_id_map[table_name.lower()] = unique_id
-                    return table_name
+                n = name_index.find_source(source_name, name)
+                if n is None:
+                    raise ValueError(f"Cannot find source {source_name}.{name} in the manifest")
 
-                raise ValueError(f"Cannot find source {source_name}.{name} in the manifest")
+                # replace id "." to "_"
+                unique_id = n.unique_id
+                table_name = unique_id.replace(".", "_")
+                table_id_map[table_name.lower()] = unique_id
+                return table_name
 
-            raw_code = node.raw_code
             jinja_context = dict(
                 ref=ref_func,
                 source=source_func,
@@ -1831,21 +2444,33 @@ class DbtAdapter(BaseAdapter):
                             columns[col_name] = col_metadata.type
                     schema[table_name] = columns
 
-        try:
-            if pre_compiled:
-                compiled_sql = pre_compiled
-            else:
-                compiled_sql = self.generate_sql(raw_code, base=base, context=jinja_context)
-            dialect = self.adapter.type()
-            if self.get_manifest(base).metadata.adapter_type is not None:
-                dialect = self.get_manifest(base).metadata.adapter_type
-            m2c, c2c_map = cll(compiled_sql, schema=schema, dialect=dialect)
-        except RecceException:
-            cll_tracker.increment_sqlglot_error_nodes()
-            return _apply_all_columns(node, "unknown")
-        except Exception:
-            cll_tracker.increment_other_error_nodes()
-            return _apply_all_columns(node, "unknown")
+        dialect = self.adapter.type()
+        if self.get_manifest(base).metadata.adapter_type is not None:
+            dialect = self.get_manifest(base).metadata.adapter_type
+
+        return _CllJob(
+            node=node,
+            parent_list=parent_list,
+            base=base,
+            manifest=manifest,
+            table_id_map=table_id_map,
+            schema=schema,
+            dialect=dialect,
+            pre_compiled=pre_compiled,
+            jinja_context=jinja_context,
+        )
+
+    def _render_cll_job_sql(self, job: "_CllJob") -> str:
+        if job.pre_compiled:
+            return job.pre_compiled
+        # The ref()/source() of the Jinja context fill job.table_id_map while rendering
+        return self.generate_sql(job.node.raw_code, base=job.base, context=job.jinja_context)
+
+    def _finish_cll_job(self, job: "_CllJob", m2c, c2c_map) -> CllData:
+        node = job.node
+        node_id = node.id
+        manifest = job.manifest
+        table_id_map = job.table_id_map
 
         # Add cll dependency to the node.
         cll_data = CllData()
@@ -1862,7 +2487,7 @@ class DbtAdapter(BaseAdapter):
         unresolved: Set[str] = set()
 
         # parent map for node
-        depends_on = set(parent_list)
+        depends_on = set(job.parent_list)
         for d in m2c:
             parent_id = self._resolve_compiled_table(table_id_map, manifest, d.node)
             if parent_id is None:
@@ -1892,11 +2517,126 @@ class DbtAdapter(BaseAdapter):
                 sorted(unresolved),
             )
 
+        return cll_data
+
+    @lru_cache(maxsize=128)
+    def get_cll_cached(self, node_id: str, base: Optional[bool] = False) -> Optional[CllData]:
+        cll_tracker = CLLPerformanceTracking()
+
+        job = self._prepare_cll_job(node_id, base=base)
+        if not isinstance(job, _CllJob):
+            return job
+
+        cll_tracker.set_total_nodes(1)
+        cll_tracker.start_column_lineage()
+
+        try:
+            compiled_sql = self._render_cll_job_sql(job)
+            m2c, c2c_map = cll(compiled_sql, schema=job.schema, dialect=job.dialect)
+        except RecceException:
+            cll_tracker.increment_sqlglot_error_nodes()
+            return self._apply_all_columns(job.node, job.parent_list, "unknown")
+        except Exception:
+            cll_tracker.increment_other_error_nodes()
+            return self._apply_all_columns(job.node, job.parent_list, "unknown")
+
+        cll_data = self._finish_cll_job(job, m2c, c2c_map)
+
         cll_tracker.end_column_lineage()
         log_performance("column level lineage per node", cll_tracker.to_dict())
         cll_tracker.reset()
         return cll_data
 
+    def get_cll_batch(
+        self,
+        node_ids: List[str],
+        base: Optional[bool] = False,
+        jobs: int = 1,
+        on_complete: Callable[[str], None] = None,
+    ) -> Tuple[Dict[str, Optional[CllData]], Dict[str, Exception]]:
+        """Compute the per-node CLL of many nodes.
+
+        With ``jobs > 1`` the sqlglot work (``parse_one``, ``qualify``,
+        ``traverse_scope``) of every node is fanned out to a pool of ``jobs``
+        worker processes. Each worker only receives the compiled SQL, the
+        parent schema and the dialect; Jinja rendering and mapping the result
+        back to unique ids stay in this process. With ``jobs <= 1`` the nodes
+        are computed in-process with ``get_cll_cached``.
+
+        Returns ``(results, errors)``: the CllData (or None) per node, and the
+        exception for nodes whose computation failed.
+        """
+        results: Dict[str, Optional[CllData]] = {}
+        errors: Dict[str, Exception] = {}
+
+        def _complete(nid):
+            if on_complete is not None:
+                on_complete(nid)
+
+        if jobs <= 1:
+            for nid in node_ids:
+                try:
+                    results[nid] = self.get_cll_cached(nid, base=base)
+                except Exception as e:
+                    errors[nid] = e
+                _complete(nid)
+            return results, errors
+
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        from recce.util.cll import cll_worker
+
+        cll_tracker = CLLPerformanceTracking()
+        cll_tracker.start_column_lineage()
+        cll_nodes = 0
+
+        # spawn, not fork: the server process may hold dbt connections and watchdog threads
+        with ProcessPoolExecutor(max_workers=jobs, mp_context=multiprocessing.get_context("spawn")) as executor:
+            pending = {}
+            for nid in node_ids:
+                try:
+                    job = self._prepare_cll_job(nid, base=base)
+                    if isinstance(job, _CllJob):
+                        cll_nodes += 1
+                        try:
+                            compiled_sql = self._render_cll_job_sql(job)
+                        except Exception:
+                            cll_tracker.increment_other_error_nodes()
+                            results[nid] = self._apply_all_columns(job.node, job.parent_list, "unknown")
+                            _complete(nid)
+                            continue
+                        future = executor.submit(cll_worker, compiled_sql, job.schema, job.dialect)
+                        pending[future] = (nid, job)
+                        continue
+                    results[nid] = job
+                except Exception as e:
+                    errors[nid] = e
+                _complete(nid)
+
+            for future in as_completed(pending):
+                nid, job = pending[future]
+                try:
+                    status, cll_result = future.result()
+                    if status == "ok":
+                        m2c, c2c_map = cll_result
+                        results[nid] = self._finish_cll_job(job, m2c, c2c_map)
+                    else:
+                        # Same fallback as get_cll_cached when the SQL cannot be analyzed
+                        if status == "sqlglot_error":
+                            cll_tracker.increment_sqlglot_error_nodes()
+                        else:
+                            cll_tracker.increment_other_error_nodes()
+                        results[nid] = self._apply_all_columns(job.node, job.parent_list, "unknown")
+                except Exception as e:
+                    errors[nid] = e
+                _complete(nid)
+
+        cll_tracker.set_total_nodes(cll_nodes)
+        cll_tracker.end_column_lineage()
+        log_performance("column level lineage [batch]", cll_tracker.to_dict())
+        return results, errors
+
     def get_cll_node(self, node_id: str, base: Optional[bool] = False) -> Tuple[Optional[CllNode], list[str]]:
         manifest = self.curr_manifest if base is False else self.base_manifest
         catalog = self.curr_catalog if base is False else self.base_catalog
@@ -1980,10 +2720,10 @@ class DbtAdapter(BaseAdapter):
         curr_manifest = self.get_manifest(base=False)
         base_manifest = self.get_manifest(base=True)
 
-        for unique_id, node in base_manifest.nodes.items():
-            name_to_unique_id[node.name] = unique_id
-        for unique_id, node in curr_manifest.nodes.items():
-            name_to_unique_id[node.name] = unique_id
+        # The last node with a name wins, and current wins over base
+        for manifest in (base_manifest, curr_manifest):
+            for name, nodes in self._get_name_index(manifest).nodes_by_name.items():
+                name_to_unique_id[name] = nodes[-1].unique_id
         return name_to_unique_id
 
     def start_monitor_artifacts(self, callback: Callable = None):
@@ -2050,6 +2790,8 @@ class DbtAdapter(BaseAdapter):
         self.runtime_config.dependencies = dependencies
 
     def refresh(self, refresh_file_path: str = None):
+        self._artifact_dicts.clear()
+
         # Refresh the artifacts
         if refresh_file_path is None:
             return self.load_artifacts()
@@ -2080,7 +2822,11 @@ class DbtAdapter(BaseAdapter):
         # Any artifact change invalidates change analysis and full map
         self.get_change_analysis_cached.cache_clear()
         self._get_merged_lineage_cached.cache_clear()
+        self._get_lineage_version_cached.cache_clear()
+        self._get_selection_graph_cached.cache_clear()
         self._full_cll_map = None
+        self._full_cll_index = None
+        self._name_indexes.clear()
 
     def create_relation(self, model, base=False):
         node = self.find_node_by_name(model, base)
@@ -2089,6 +2835,85 @@ class DbtAdapter(BaseAdapter):
 
         return self.adapter.Relation.create_from(self.runtime_config, node)
 
+    @staticmethod
+    def _manifest_checksum(manifest: Manifest) -> str:
+        """Content checksum of the node-bearing sections of a manifest.
+
+        Guards the selection graph cache against manifests that are mutated in
+        place (same identity, different nodes). Only ids and dbt node checksums
+        are hashed, which is cheap compared to compiling the graph.
+        """
+        h = hashlib.sha256()
+        for node_id in sorted(manifest.nodes):
+            cs = getattr(manifest.nodes[node_id], "checksum", None)
+            h.update(node_id.encode("utf-8"))
+            h.update(b"\x00")
+            h.update(str(getattr(cs, "checksum", "")).encode("utf-8"))
+            h.update(b"\x00")
+        for key in ["sources", "exposures", "metrics", "semantic_models"]:
+            h.update(b"\x01")
+            for unique_id in sorted(getattr(manifest, key, None) or {}):
+                h.update(unique_id.encode("utf-8"))
+                h.update(b"\x00")
+        return h.hexdigest()
+
+    def _get_selection_graph(self):
+        """Return the merged (base + current) manifest and its compiled graph used by ``select_nodes``.
+
+        The result is cached on the identity and checksum of both manifests, so
+        repeated selector evaluation only pays for ``NodeSelector.get_selected``.
+        """
+        manifest_prev = self.previous_state.manifest
+        manifest_curr = self.manifest
+        cache_key = (
+            id(manifest_prev),
+            self._manifest_checksum(manifest_prev),
+            id(manifest_curr),
+            self._manifest_checksum(manifest_curr),
+        )
+        return self._get_selection_graph_cached(cache_key)
+
+    @lru_cache(maxsize=1)
+    def _get_selection_graph_cached(self, cache_key):
+        import dbt.compilation
+        from dbt.compilation import Compiler
+
+        manifest = Manifest()
+        manifest.metadata.adapter_type = self.adapter.type()
+        manifest_prev = self.previous_state.manifest
+        manifest_curr = self.manifest
+
+        manifest.nodes = {**manifest_curr.nodes}
+        # # mark a node is removed if the node id is no in the curr nodes
+        for node_id, node in manifest_prev.nodes.items():
+            if node_id not in manifest.nodes:
+                node_dict = node.to_dict()
+                if "raw_code" in node_dict:
+                    node_dict["raw_code"] = "__removed__"
+                node_class = type(node)
+                removed_node = node_class.from_dict(node_dict)
+                manifest.nodes[node_id] = removed_node
+
+        manifest.macros = {**manifest_prev.macros, **manifest_curr.macros}
+        manifest.sources = {**manifest_prev.sources, **manifest_curr.sources}
+        manifest.exposures = {**manifest_prev.exposures, **manifest_curr.exposures}
+        manifest.metrics = {**manifest_prev.metrics, **manifest_curr.metrics}
+        if hasattr(manifest_prev, "semantic_models"):
+            manifest.semantic_models = {
+                **manifest_prev.semantic_models,
+                **manifest_curr.semantic_models,
+            }
+
+        compiler = Compiler(self.runtime_config)
+        # disable to print compile states
+        tmp_func = dbt.compilation.print_compile_stats
+        dbt.compilation.print_compile_stats = lambda x: None
+        try:
+            graph = compiler.compile(manifest, write=False)
+        finally:
+            dbt.compilation.print_compile_stats = tmp_func
+        return manifest, graph
+
     def select_nodes(
         self,
         select: Optional[str] = None,
@@ -2096,8 +2921,6 @@ class DbtAdapter(BaseAdapter):
         packages: Optional[list[str]] = None,
         view_mode: Optional[Literal["all", "changed_models"]] = None,
     ) -> Set[str]:
-        import dbt.compilation
-        from dbt.compilation import Compiler
         from dbt.graph import (
             NodeSelector,
             SelectionIntersection,
@@ -2132,38 +2955,7 @@ class DbtAdapter(BaseAdapter):
             specs.append(_parse_difference(["1+state:modified+"], None))
         spec = SelectionIntersection(specs)
 
-        manifest = Manifest()
-        manifest.metadata.adapter_type = self.adapter.type()
-        manifest_prev = self.previous_state.manifest
-        manifest_curr = self.manifest
-
-        manifest.nodes = {**manifest_curr.nodes}
-        # # mark a node is removed if the node id is no in the curr nodes
-        for node_id, node in manifest_prev.nodes.items():
-            if node_id not in manifest.nodes:
-                node_dict = node.to_dict()
-                if "raw_code" in node_dict:
-                    node_dict["raw_code"] = "__removed__"
-                node_class = type(node)
-                removed_node = node_class.from_dict(node_dict)
-                manifest.nodes[node_id] = removed_node
-
-        manifest.macros = {**manifest_prev.macros, **manifest_curr.macros}
-        manifest.sources = {**manifest_prev.sources, **manifest_curr.sources}
-        manifest.exposures = {**manifest_prev.exposures, **manifest_curr.exposures}
-        manifest.metrics = {**manifest_prev.metrics, **manifest_curr.metrics}
-        if hasattr(manifest_prev, "semantic_models"):
-            manifest.semantic_models = {
-                **manifest_prev.semantic_models,
-                **manifest_curr.semantic_models,
-            }
-
-        compiler = Compiler(self.runtime_config)
-        # disable to print compile states
-        tmp_func = dbt.compilation.print_compile_stats
-        dbt.compilation.print_compile_stats = lambda x: None
-        graph = compiler.compile(manifest, write=False)
-        dbt.compilation.print_compile_stats = tmp_func
+        manifest, graph = self._get_selection_graph()
         selector = NodeSelector(graph, manifest, previous_state=self.previous_state)
 
         # disable "The selection criterion does not match"
@@ -2173,19 +2965,29 @@ class DbtAdapter(BaseAdapter):
     def export_artifacts(self) -> ArtifactsRoot:
         """
         Export the artifacts from the current state
+
+        The dict of each artifact is memoized until the artifact is replaced or the
+        adapter is refreshed, so repeated saves and syncs reuse it. Callers must not
+        mutate the returned dicts.
         """
         artifacts = ArtifactsRoot()
 
-        def _load_artifact(artifact):
-            return artifact.to_dict() if artifact else None
+        def _load_artifact(slot, artifact):
+            if not artifact:
+                return None
+            entry = self._artifact_dicts.get(slot)
+            if entry is None or entry[0] is not artifact:
+                entry = (artifact, artifact.to_dict())
+                self._artifact_dicts[slot] = entry
+            return entry[1]
 
         artifacts.base = {
-            "manifest": _load_artifact(self.base_manifest),
-            "catalog": _load_artifact(self.base_catalog),
+            "manifest": _load_artifact("base_manifest", self.base_manifest),
+            "catalog": _load_artifact("base_catalog", self.base_catalog),
         }
         artifacts.current = {
-            "manifest": _load_artifact(self.curr_manifest),
-            "catalog": _load_artifact(self.curr_catalog),
+            "manifest": _load_artifact("curr_manifest", self.curr_manifest),
+            "catalog": _load_artifact("curr_catalog", self.curr_catalog),
         }
         return artifacts
 
@@ -2231,10 +3033,38 @@ class DbtAdapter(BaseAdapter):
             else:
                 return new
 
-        self.base_manifest = _select_artifact(self.base_manifest, load_manifest(data=artifacts.base.get("manifest")))
-        self.curr_manifest = _select_artifact(self.curr_manifest, load_manifest(data=artifacts.current.get("manifest")))
-        self.base_catalog = _select_artifact(self.base_catalog, load_catalog(data=artifacts.base.get("catalog")))
-        self.curr_catalog = _select_artifact(self.curr_catalog, load_catalog(data=artifacts.current.get("catalog")))
+        def _remember(slot: str, artifact, data: Optional[dict]):
+            # Export the state's own dict rather than rebuilding it with to_dict(). For a
+            # pruned manifest that keeps the pruned content; for a state container it is
+            # the very object the container read, so the next save copies its bytes.
+            if artifact is not None:
+                self._artifact_dicts[slot] = (artifact, data)
+            return artifact
+
+        def _load_manifest(slot: str, data: Optional[dict]):
+            manifest = load_manifest(
+                data=data,
+                prune=self.prune_artifacts,
+                prune_macros=self.prune_macro_bodies,
+                timing_name=slot,
+            )
+            return _remember(slot, manifest, data)
+
+        def _load_catalog(slot: str, data: Optional[dict]):
+            return _remember(slot, load_catalog(data=data, timing_name=slot), data)
+
+        self.base_manifest = _select_artifact(
+            self.base_manifest, _load_manifest("base_manifest", artifacts.base.get("manifest"))
+        )
+        self.curr_manifest = _select_artifact(
+            self.curr_manifest, _load_manifest("curr_manifest", artifacts.current.get("manifest"))
+        )
+        self.base_catalog = _select_artifact(
+            self.base_catalog, _load_catalog("base_catalog", artifacts.base.get("catalog"))
+        )
+        self.curr_catalog = _select_artifact(
+            self.curr_catalog, _load_catalog("curr_catalog", artifacts.current.get("catalog"))
+        )
 
         self.manifest = as_manifest(self.curr_manifest)
         self.previous_state = previous_state(
@@ -0,0 +1,120 @@
+"""Streaming NDJSON serialization for large lineage payloads.
+
+``/api/info`` and ``/api/cll`` switch to these generators when the request
+sends ``Accept: application/x-ndjson``. Each line is one JSON object with a
+``type``. Nodes, columns and edges go out in chunks of ``STREAM_CHUNK_SIZE``,
+and the last line is an ``end`` record with the counts. Merging the
+``nodes``/``columns``/``edges`` chunks rebuilds the regular JSON response.
+"""
+
+import json
+import typing as t
+
+from recce.models.types import CllData, MergedLineage
+from recce.util.change_classifier import to_v2_change_category
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+STREAM_CHUNK_SIZE = 500
+
+
+def wants_ndjson(headers: t.Mapping[str, str]) -> bool:
+    """True if the request's Accept header asks for an NDJSON stream."""
+    return NDJSON_MEDIA_TYPE in (headers.get("accept") or "")
+
+
+def parse_fields(fields: t.Union[str, t.Iterable[str], None]) -> t.Optional[t.Set[str]]:
+    """Parse a field projection given as a comma-separated string or a list. None means all fields."""
+    if fields is None:
+        return None
+    if isinstance(fields, str):
+        fields = fields.split(",")
+    projection = {f.strip() for f in fields if f.strip()}
+    return projection or None
+
+
+def project(record: dict, fields: t.Optional[t.Set[str]]) -> dict:
+    """Keep only the keys of ``record`` listed in ``fields``."""
+    if fields is None:
+        return record
+    return {k: v for k, v in record.items() if k in fields}
+
+
+def _line(record: dict) -> str:
+    return json.dumps(record, separators=(",", ":"), default=str) + "\n"
+
+
+def _chunks(items: t.Iterable, size: t.Optional[int]) -> t.Iterator[list]:
+    size = size or STREAM_CHUNK_SIZE
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def dump_merged_node(node, fields: t.Optional[t.Set[str]] = None, v2: bool = False) -> dict:
+    """Serialize a MergedNode the way ``/api/info`` does, with optional projection and v2 labels."""
+    data = project(node.model_dump(mode="json", exclude_none=True, by_alias=True), fields)
+    change = data.get("change")
+    if v2 and isinstance(change, dict) and "category" in change:
+        change["category"] = to_v2_change_category(change["category"])
+    return data
+
+
+def stream_merged_lineage(
+    lineage: MergedLineage,
+    info: t.Optional[dict] = None,
+    fields: t.Optional[t.Set[str]] = None,
+    v2: bool = False,
+    chunk_size: t.Optional[int] = None,
+) -> t.Iterator[str]:
+    """Yield ``/api/info`` as NDJSON: info, metadata, node chunks, edge chunks, end."""
+    if info is not None:
+        yield _line({"type": "info", "info": info})
+    yield _line({"type": "metadata", "metadata": lineage.metadata})
+
+    for chunk in _chunks(lineage.nodes.items(), chunk_size):
+        yield _line(
+            {"type": "nodes", "nodes": {node_id: dump_merged_node(node, fields, v2) for node_id, node in chunk}}
+        )
+    for chunk in _chunks(lineage.edges, chunk_size):
+        yield _line({"type": "edges", "edges": [edge.model_dump(mode="json", exclude_none=True) for edge in chunk]})
+
+    yield _line({"type": "end", "counts": {"nodes": len(lineage.nodes), "edges": len(lineage.edges)}})
+
+
+def dump_cll_node(node, fields: t.Optional[t.Set[str]] = None, v2: bool = False) -> dict:
+    """Serialize a CllNode like the ``/api/cll`` response model, with optional projection and v2 labels."""
+    data = project(node.model_dump(mode="json"), fields)
+    if v2 and data.get("change_category") is not None:
+        data["change_category"] = to_v2_change_category(data["change_category"])
+    return data
+
+
+def stream_cll(
+    cll: CllData,
+    fields: t.Optional[t.Set[str]] = None,
+    v2: bool = False,
+    chunk_size: t.Optional[int] = None,
+) -> t.Iterator[str]:
+    """Yield ``/api/cll`` as NDJSON: node, column, parent_map and child_map chunks, then end.
+
+    ``fields`` projects both nodes and columns.
+    """
+    for chunk in _chunks(cll.nodes.items(), chunk_size):
+        yield _line({"type": "nodes", "nodes": {node_id: dump_cll_node(node, fields, v2) for node_id, node in chunk}})
+    for chunk in _chunks(cll.columns.items(), chunk_size):
+        yield _line(
+            {
+                "type": "columns",
+                "columns": {column_id: project(column.model_dump(mode="json"), fields) for column_id, column in chunk},
+            }
+        )
+    for key in ["parent_map", "child_map"]:
+        for chunk in _chunks(getattr(cll, key).items(), chunk_size):
+            yield _line({"type": key, key: {node_id: list(ids) for node_id, ids in chunk}})
+
+    yield _line({"type": "end", "counts": {"nodes": len(cll.nodes), "columns": len(cll.columns)}})
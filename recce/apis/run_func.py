@@ -1,12 +1,17 @@
 import asyncio
+import json
 import logging
 from typing import List, Optional, Tuple
 
+from pydantic import BaseModel
+
 from recce.core import default_context
 from recce.exceptions import DuckDBExternalAccessBlocked, RecceException
 from recce.models import Run, RunDAO, RunType
 from recce.models.types import RunStatus
 from recce.tasks.core import Task
+from recce.util.pydantic_model import pydantic_model_json_dump
+from recce.util.run_cache import get_run_result_cache
 
 running_tasks = {}
 logger = logging.getLogger("uvicorn")
@@ -127,6 +132,74 @@ def create_task(run_type: RunType, params: dict):
     return taskClz(params)
 
 
+# Diff runs whose result depends only on their params and the relations they read
+CACHEABLE_RUN_TYPES = {
+    RunType.ROW_COUNT_DIFF,
+    RunType.TOP_K_DIFF,
+    RunType.HISTOGRAM_DIFF,
+    RunType.PROFILE_DIFF,
+    RunType.VALUE_DIFF,
+}
+
+# Params that change how a run executes but not what it returns
+_RUN_CACHE_IGNORED_PARAMS = {"threads"}
+
+
+def _run_cache_node_names(dbt_adapter, params: dict) -> List[str]:
+    """Resolve the model names a cacheable run reads, mirroring how the tasks resolve them."""
+    if params.get("model"):
+        return [params["model"]]
+
+    if params.get("node_ids") or params.get("node_names"):
+        names = [dbt_adapter.get_node_name_by_id(node_id) for node_id in params.get("node_ids") or []]
+        return [name for name in names if name] + list(params.get("node_names") or [])
+
+    node_ids = dbt_adapter.select_nodes(
+        select=params.get("select"),
+        exclude=params.get("exclude"),
+        packages=params.get("packages"),
+        view_mode=params.get("view_mode"),
+    )
+    names = []
+    for node_id in node_ids:
+        if node_id.startswith("model") or node_id.startswith("snapshot") or node_id.startswith("seed"):
+            name = dbt_adapter.get_node_name_by_id(node_id)
+            if name:
+                names.append(name)
+    return names
+
+
+def _run_cache_key(run_type: RunType, params: Optional[dict]) -> Optional[str]:
+    """Return the result cache key of a run, or None if the run is not cacheable."""
+    if run_type not in CACHEABLE_RUN_TYPES:
+        return None
+
+    cache = get_run_result_cache()
+    context = default_context()
+    if not cache.enabled or context is None or context.adapter_type != "dbt":
+        return None
+
+    from recce import get_version
+
+    params = {k: v for k, v in (params or {}).items() if k not in _RUN_CACHE_IGNORED_PARAMS}
+    fingerprints = {}
+    for name in _run_cache_node_names(context.adapter, params):
+        fingerprints[f"base.{name}"] = context.adapter.get_relation_fingerprint(name, base=True)
+        fingerprints[f"current.{name}"] = context.adapter.get_relation_fingerprint(name, base=False)
+    if not fingerprints:
+        return None
+
+    return cache.make_key(run_type.value, params, fingerprints, get_version())
+
+
+def _dump_run_cache_entry(result, params: Optional[dict]) -> str:
+    if isinstance(result, BaseModel):
+        result = json.loads(pydantic_model_json_dump(result))
+    if params is not None:
+        params = {k: v for k, v in params.items() if k not in _RUN_CACHE_IGNORED_PARAMS}
+    return json.dumps({"result": result, "params": params})
+
+
 def submit_run(type, params, check_id=None, triggered_by=None):
     try:
         run_type = RunType(type)
@@ -229,6 +302,21 @@ def submit_run(type, params, check_id=None, triggered_by=None):
 
     def fn():
         try:
+            try:
+                cache_key = _run_cache_key(run_type, params)
+            except Exception as e:
+                # The cache is an optimization; a failed lookup must not fail the run
+                logger.debug(f"Run {run_type} without the result cache: {e}")
+                cache_key = None
+            if cache_key is not None:
+                cached = get_run_result_cache().get(cache_key)
+                if cached is not None:
+                    entry = json.loads(cached)
+                    # Normalize through Run so the result has the same shape as a freshly executed one
+                    result = Run(type=run_type.value, result=entry["result"]).result
+                    update_run_result(run, result, None, entry["params"])
+                    return result
+
             result = task.execute()
 
             # Extract updated params from task after execution
@@ -256,6 +344,11 @@ def submit_run(type, params, check_id=None, triggered_by=None):
                     updated_params = None
 
             update_run_result(run, result, None, updated_params)
+            if cache_key is not None and result is not None and run.status == RunStatus.FINISHED:
+                try:
+                    get_run_result_cache().put(cache_key, _dump_run_cache_entry(result, updated_params))
+                except (TypeError, ValueError) as e:
+                    logger.debug(f"Skip caching {run_type} result: {e}")
             return result
         except BaseException as e:
             update_run_result(run, None, e, None)
@@ -16,6 +16,7 @@ from recce.state import (
     s3_metadata_headers,
     s3_sse_c_headers,
 )
+from recce.util.cloud.transfer import upload_file
 from recce.util.recce_cloud import PresignedUrlMethod, RecceCloud
 
 
@@ -129,11 +130,11 @@ def upload_artifacts_to_session(target_path: str, session_id: str, token: str, d
 
     # Upload the compressed artifacts (no password needed for session uploads)
     console.print(f'Uploading manifest from path "{manifest_path}"')
-    response = requests.put(presigned_urls["manifest_url"], data=open(manifest_path, "rb").read())
+    response = upload_file(presigned_urls["manifest_url"], manifest_path)
     if response.status_code != 200 and response.status_code != 204:
         raise Exception(response.text)
     console.print(f'Uploading catalog from path "{catalog_path}"')
-    response = requests.put(presigned_urls["catalog_url"], data=open(catalog_path, "rb").read())
+    response = upload_file(presigned_urls["catalog_url"], catalog_path)
     if response.status_code != 200 and response.status_code != 204:
         raise Exception(response.text)
 
@@ -189,7 +190,7 @@ def upload_dbt_artifacts(target_path: str, branch: str, token: str, password: st
         headers["x-amz-tagging"] = urlencode(normalized)
         headers.update(s3_metadata_headers(metadata))
     headers = filter_headers_for_presigned_url(presigned_url, headers)
-    response = requests.put(presigned_url, data=open(compress_file_path, "rb").read(), headers=headers)
+    response = upload_file(presigned_url, compress_file_path, headers=headers)
     if response.status_code not in (200, 204):
         raise Exception({response.text})
 
@@ -330,7 +330,15 @@ def version():
     type=click.STRING,
     envvar="RECCE_SESSION_ID",
 )
-def init(cache_db, **kwargs):
+@click.option(
+    "-j",
+    "--jobs",
+    help="Number of worker processes used to compute column-level lineage for uncached models.",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+)
+def init(cache_db, jobs, **kwargs):
     """
     Pre-compute column-level lineage cache from dbt artifacts.
 
@@ -621,6 +629,7 @@ def init(cache_db, **kwargs):
 
             task = progress.add_task(f"  {env_name}", total=len(node_ids))
 
+            content_keys = {}
             for nid in node_ids:
                 p_list: list = []
                 col_names: list = []
@@ -633,28 +642,45 @@ def init(cache_db, **kwargs):
 
                 checksum = DbtAdapter._get_node_checksum(manifest, nid)
                 parent_checksums = [DbtAdapter._get_node_checksum(manifest, pid) for pid in p_list]
-                content_key = DbtAdapter._make_node_content_key(checksum, parent_checksums, col_names, adapter_type)
-                cached_json = cache.get_node(nid, content_key)
-                if cached_json:
+                content_keys[nid] = DbtAdapter._make_node_content_key(
+                    checksum, parent_checksums, col_names, adapter_type
+                )
+
+            cached_entries = cache.get_nodes(content_keys.items())
+            misses = {}
+            for nid, content_key in content_keys.items():
+                if cached_entries.get(nid):
                     cache_hits += 1
                     success += 1
                     progress.advance(task)
                     continue
+                misses[nid] = content_key
 
+            results, errors = dbt_adapter.get_cll_batch(
+                list(misses),
+                base=is_base,
+                jobs=jobs,
+                on_complete=lambda _: progress.advance(task),
+            )
+            for nid, content_key in misses.items():
+                if nid in errors:
+                    fail += 1
+                    if fail <= 3:
+                        console.print(f"  [dim red]  skip: {nid}: {errors[nid]}[/dim red]")
+                    logger.debug("[recce init] CLL computation failed for %s: %s", nid, errors[nid])
+                    continue
+                cll_data = results.get(nid)
+                if cll_data is None:
+                    fail += 1
+                    continue
                 try:
-                    cll_data = dbt_adapter.get_cll_cached(nid, base=is_base)
-                    if cll_data is None:
-                        fail += 1
-                        progress.advance(task)
-                        continue
                     batch_to_store.append((nid, content_key, DbtAdapter._serialize_cll_data(cll_data)))
                     success += 1
                 except Exception as e:
                     fail += 1
                     if fail <= 3:
                         console.print(f"  [dim red]  skip: {nid}: {e}[/dim red]")
-                    logger.debug("[recce init] CLL computation failed for %s: %s", nid, e)
-                progress.advance(task)
+                    logger.debug("[recce init] CLL serialization failed for %s: %s", nid, e)
 
             if batch_to_store:
                 if not cache.put_nodes_batch(batch_to_store):
@@ -693,7 +719,7 @@ def init(cache_db, **kwargs):
         tmp_fd, tmp_name = tempfile.mkstemp(dir=cll_map_path.parent, suffix=".tmp")
         try:
             with os.fdopen(tmp_fd, "w") as f:
-                json.dump(cll_map_data, f)
+                json.dump(cll_map_data, f, separators=(",", ":"))
             Path(tmp_name).rename(cll_map_path)
         except Exception:
             Path(tmp_name).unlink(missing_ok=True)
@@ -903,6 +929,8 @@ def init(cache_db, **kwargs):
                     # build_full_cll_map reuses its warm entries on subsequent runs —
                     # so Cloud uploads it alongside per_node.db.
                     cll_cache_upload_url = upload_urls.get("cll_cache_url")
+                    # Closing the shared connection checkpoints the WAL into the db file
+                    cache.close()
                     if cll_cache_upload_url and Path(cache_db).is_file():
                         try:
                             with open(cache_db, "rb") as f:
@@ -1218,6 +1246,11 @@ def diff(
     help="Enable inline paired-distribution profiles in the schema view. Implies --new-cll-experience.",
     envvar="RECCE_INLINE_PROFILE",
 )
+@click.option(
+    "--no-run-cache",
+    is_flag=True,
+    help="Re-execute diff runs instead of reusing results from the run result cache (ENABLE_RUN_RESULT_CACHE=1).",
+)
 @click.option(
     "--duckdb-external-access",
     is_flag=True,
@@ -1277,6 +1310,11 @@ def server(host, port, lifetime, idle_timeout=0, state_file=None, **kwargs):
 
     RecceConfig(config_file=kwargs.get("config"))
 
+    if kwargs.pop("no_run_cache", False):
+        from recce.util.run_cache import get_run_result_cache
+
+        get_run_result_cache().bypass = True
+
     kwargs["duckdb_external_access"] = kwargs.get("duckdb_external_access", False) or bool(
         RecceConfig().get("duckdb_external_access", False)
     )
@@ -1445,6 +1483,11 @@ DEFAULT_RECCE_STATE_FILE = "recce_state.json"
 @click.option("--summary", help="Path of the summary markdown file.", type=click.Path())
 @click.option("--skip-query", is_flag=True, help="Skip running the queries for the checks.")
 @click.option("--skip-check", is_flag=True, help="Skip running the checks.")
+@click.option(
+    "--no-run-cache",
+    is_flag=True,
+    help="Re-execute diff runs instead of reusing results from the run result cache (ENABLE_RUN_RESULT_CACHE=1).",
+)
 @click.option(
     "--git-current-branch",
     help="The git branch of the current environment.",
@@ -1511,6 +1554,11 @@ def run(output, **kwargs):
     # Only `recce server` restricts DuckDB external access by default.
     kwargs.setdefault("duckdb_external_access", True)
 
+    if kwargs.pop("no_run_cache", False):
+        from recce.util.run_cache import get_run_result_cache
+
+        get_run_result_cache().bypass = True
+
     patch_derived_args(kwargs)
     # Remove share_url from kwargs to avoid affecting state loader creation
     kwargs.pop("share_url", None)
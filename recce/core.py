@@ -111,20 +111,23 @@ class RecceContext:
     def stop_monitor_base_env(self):
         self.adapter.stop_monitor_base_env()
 
-    def export_state(self) -> RecceState:
+    def export_state_metadata(self, demo: bool = False) -> RecceState:
         """
-        Export the state to a RecceState object.
+        Export the git and pull request info of the state, without runs, checks or artifacts.
+
+        Request handlers that only describe the session use this instead of export_state(),
+        which serializes every artifact.
         """
         state = RecceState()
         state.metadata = RecceStateMetadata()
 
-        # runs & checks & artifacts
-        state.runs = self.runs
-        state.checks = self.checks
-        state.artifacts = self.adapter.export_artifacts()
-
+        if demo:
+            git = GitRepoInfo.from_current_repository()
+            if git:
+                state.git = git
+            state.pull_request = PullRequestInfo(url=os.getenv("RECCE_PR_URL"))
         # git & pull_request. If in review mode, use the review state
-        if self.review_mode:
+        elif self.review_mode:
             state.git = self.state_loader.state.git
             state.pull_request = self.state_loader.state.pull_request
         else:
@@ -136,22 +139,29 @@ class RecceContext:
 
         return state
 
+    def export_state(self) -> RecceState:
+        """
+        Export the state to a RecceState object.
+        """
+        state = self.export_state_metadata()
+
+        # runs & checks & artifacts
+        state.runs = self.runs
+        state.checks = self.checks
+        state.artifacts = self.adapter.export_artifacts()
+
+        return state
+
     def export_demo_state(self) -> RecceState:
         """
         Export the demo state to a RecceState object for the demo sites.
         """
-        state = RecceState()
-        state.metadata = RecceStateMetadata()
+        state = self.export_state_metadata(demo=True)
 
         # runs & checks
         state.runs = self.runs
         state.checks = self.checks
         state.artifacts = self.adapter.export_artifacts()
-        git = GitRepoInfo.from_current_repository()
-        if git:
-            state.git = git
-        pr = PullRequestInfo(url=os.getenv("RECCE_PR_URL"))
-        state.pull_request = pr
 
         return state
 
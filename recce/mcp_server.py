@@ -1163,9 +1163,10 @@ class RecceMCPServer:
                                 "Compare row counts between base and current environments for specified models. "
                                 "Returns structured results with status information for each model.\n\n"
                                 "Response format: {model_name: {base: int|null, curr: int|null, "
-                                "base_meta: {status, message?}, curr_meta: {status, message?}}}\n"
+                                "base_meta: {status, message?, exact?}, curr_meta: {status, message?, exact?}}}\n"
                                 "- base/curr: row count as integer, or null if unavailable\n"
-                                "- base_meta/curr_meta: status details explaining the count value\n\n"
+                                "- base_meta/curr_meta: status details explaining the count value\n"
+                                "- exact: false when the count is an estimate from warehouse table statistics\n\n"
                                 "Status codes (in *_meta.status):\n"
                                 "- 'ok': Row count retrieved successfully\n"
                                 "- 'not_in_manifest': Model not found in dbt manifest\n"
@@ -2539,7 +2540,7 @@ class RecceMCPServer:
         # Add git and pull_request info if state_loader is available
         if context.state_loader:
             try:
-                state = context.export_state()
+                state = context.export_state_metadata()
                 if state.git:
                     result["git"] = state.git.model_dump(mode="json")
                 if state.pull_request:
@@ -1,4 +1,5 @@
 import asyncio
+import hashlib
 import json
 import logging
 import os
@@ -24,7 +25,7 @@ from fastapi import (
 )
 from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, PlainTextResponse
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, ValidationError
 from pytz import utc
@@ -32,9 +33,17 @@ from starlette.middleware.gzip import GZipMiddleware
 from starlette.middleware.sessions import SessionMiddleware
 from starlette.websockets import WebSocketDisconnect
 
-from . import __latest_version__, __version__, event, is_recce_cloud_instance
+from . import __version__, event, is_recce_cloud_instance
 from .apis.check_api import check_router
 from .apis.check_events_api import check_events_router
+from .apis.ndjson_utils import (
+    NDJSON_MEDIA_TYPE,
+    parse_fields,
+    project,
+    stream_cll,
+    stream_merged_lineage,
+    wants_ndjson,
+)
 from .apis.run_api import run_router
 from .config import RecceConfig
 from .connect_to_cloud import (
@@ -48,7 +57,7 @@ from .core import RecceContext, default_context, load_context
 from .event import get_recce_api_token, log_api_event, log_single_env_event
 from .exceptions import RecceException
 from .github import is_github_codespace
-from .models.types import CllData
+from .models.types import CllData, MergedLineage
 from .models.websocket import CloudUserContextMessage
 from .run import load_preset_checks
 from .state import RecceShareStateManager, RecceStateLoader
@@ -58,6 +67,7 @@ from .util.change_classifier import (
     wants_v2_vocabulary,
 )
 from .util.startup_perf import track_timing
+from .util.version_check import get_latest_version
 from .websocket import (
     extract_cloud_user_from_headers,
     get_connection_manager,
@@ -571,6 +581,9 @@ async def disable_cache(request: Request, call_next):
     # disable cache for '/' and '/index.html'
     if request.url.path in ["/", "/index.html"]:
         response.headers["Cache-Control"] = "no-store"
+    # versioned lineage responses may be cached, but must be revalidated with If-None-Match
+    elif "etag" in response.headers and "cache-control" not in response.headers:
+        response.headers["Cache-Control"] = "no-cache"
 
     return response
 
@@ -689,19 +702,84 @@ def _maybe_v2_cll(cll_payload: dict, request: Request) -> dict:
     return cll_payload
 
 
+def _lineage_version(context: RecceContext) -> Optional[str]:
+    adapter = context.adapter if context else None
+    return adapter.get_lineage_version() if adapter is not None else None
+
+
+def _make_etag(*parts) -> str:
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(json.dumps(jsonable_encoder(part), sort_keys=True).encode("utf-8"))
+        h.update(b"\x00")
+    return f'"{h.hexdigest()[:32]}"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags
+
+
+def _dump_json(content) -> bytes:
+    # Same encoding as fastapi's JSONResponse
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+class _PayloadCache:
+    """Pre-serialized response bodies for one lineage version.
+
+    Entries are keyed by the response variant (vocabulary, projection, ...) and
+    all of them are dropped when the version changes.
+    """
+
+    def __init__(self, max_entries: int = 16):
+        self.max_entries = max_entries
+        self.version: Optional[str] = None
+        self._entries: dict = {}
+
+    def get_or_build(self, version: str, key, build) -> bytes:
+        if version != self.version:
+            self.version = version
+            self._entries = {}
+        payload = self._entries.get(key)
+        if payload is None:
+            payload = build()
+            if len(self._entries) >= self.max_entries:
+                self._entries.pop(next(iter(self._entries)))
+            self._entries[key] = payload
+        return payload
+
+    def clear(self) -> None:
+        self.version = None
+        self._entries = {}
+
+
+_lineage_payloads = _PayloadCache()
+_cll_payloads = _PayloadCache()
+
+
 @app.get("/api/info")
-async def get_info(request: Request):
+async def get_info(request: Request, fields: Optional[str] = None):
     """
     Get the information of the current context.
+
+    ``fields`` is a comma-separated projection of the lineage node fields, e.g.
+    ``name,resource_type,change_status`` for a skeleton graph. With
+    ``Accept: application/x-ndjson`` the lineage is streamed in chunks.
+
+    The JSON response carries an ETag derived from the artifacts' content
+    version and the rest of the info, and ``If-None-Match`` hits return 304.
+    The serialized lineage is kept per vocabulary and projection until the
+    artifacts change.
     """
     context = default_context()
     demo = os.environ.get("DEMO", False)
     is_codespace = is_github_codespace()
 
-    if demo:
-        state = context.export_demo_state()
-    else:
-        state = context.export_state()
+    state = context.export_state_metadata(demo=bool(demo))
 
     support_tasks = context.support_tasks()
     if context.state_loader and context.state_loader.state_file:
@@ -710,7 +788,9 @@ async def get_info(request: Request):
         filename = None
 
     state_metadata = context.state_loader.state.metadata if context.state_loader.state else None
-    merged_lineage = context.get_merged_lineage()
+    node_fields = parse_fields(fields)
+    version = _lineage_version(context)
+    merged_lineage = context.get_merged_lineage() if version is None or wants_ndjson(request.headers) else None
 
     try:
         info = {
@@ -719,7 +799,7 @@ async def get_info(request: Request):
             "review_mode": context.review_mode,
             "git": state.git.to_dict() if state.git else None,
             "pull_request": state.pull_request.to_dict() if state.pull_request else None,
-            "lineage": _maybe_v2_lineage(merged_lineage.model_dump(exclude_none=True, by_alias=True), request),
+            "lineage": None,
             "demo": bool(demo),
             "codespace": bool(is_codespace),
             "cloud_mode": context.state_loader.cloud_mode,
@@ -737,7 +817,44 @@ async def get_info(request: Request):
                 "current_env": sqlmesh_adapter.curr_env.name,
             }
 
-        return info
+        if wants_ndjson(request.headers):
+            info.pop("lineage")
+            return StreamingResponse(
+                stream_merged_lineage(
+                    merged_lineage,
+                    info=jsonable_encoder(info),
+                    fields=node_fields,
+                    v2=wants_v2_vocabulary(request.headers),
+                ),
+                media_type=NDJSON_MEDIA_TYPE,
+            )
+
+        def _dump_lineage(lineage: MergedLineage) -> dict:
+            lineage = lineage.model_dump(exclude_none=True, by_alias=True)
+            if node_fields is not None:
+                lineage["nodes"] = {node_id: project(node, node_fields) for node_id, node in lineage["nodes"].items()}
+            return _maybe_v2_lineage(lineage, request)
+
+        if version is None:
+            info["lineage"] = _dump_lineage(merged_lineage)
+            return info
+
+        v2 = wants_v2_vocabulary(request.headers)
+        projection = sorted(node_fields) if node_fields is not None else None
+        info.pop("lineage")
+        info = jsonable_encoder(info)
+        etag = _make_etag(version, v2, projection, info)
+        if _etag_matches(request, etag):
+            return Response(status_code=304, headers={"ETag": etag})
+
+        lineage_bytes = _lineage_payloads.get_or_build(
+            version,
+            (v2, tuple(projection) if projection is not None else None),
+            lambda: _dump_json(jsonable_encoder(_dump_lineage(context.get_merged_lineage()))),
+        )
+        # Splice the pre-serialized lineage into the small info object
+        body = _dump_json(info)[:-1] + b',"lineage":' + lineage_bytes + b"}"
+        return Response(content=body, media_type="application/json", headers={"ETag": etag})
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -750,6 +867,8 @@ class CllIn(BaseModel):
     no_upstream: Optional[bool] = False
     no_downstream: Optional[bool] = False
     full_map: Optional[bool] = False
+    # Projection of the node and column fields, e.g. ["id", "name"] for a skeleton
+    fields: Optional[list[str]] = None
 
 
 class CllOutput(BaseModel):
@@ -757,23 +876,63 @@ class CllOutput(BaseModel):
 
 
 @app.post("/api/cll", response_model=CllOutput)
-async def column_level_lineage_by_node(cll_input: CllIn, request: Request):
+async def column_level_lineage_by_node(cll_input: CllIn, request: Request, response: Response):
     from recce.adapter.dbt_adapter import DbtAdapter
 
     app_state: AppState = app.state
     disable_cll_cache = app_state.flag.get("disable_cll_cache", False) if app_state.flag else False
 
-    dbt_adapter: DbtAdapter = default_context().adapter
-    cll = dbt_adapter.get_cll(
-        node_id=cll_input.node_id,
-        column=cll_input.column,
-        change_analysis=cll_input.change_analysis,
-        no_upstream=cll_input.no_upstream,
-        no_downstream=cll_input.no_downstream,
-        no_cll=cll_input.no_cll,
-        full_map=cll_input.full_map,
-        disable_cll_cache=disable_cll_cache,
-    )
+    context = default_context()
+    fields = parse_fields(cll_input.fields)
+    ndjson = wants_ndjson(request.headers)
+    v2 = wants_v2_vocabulary(request.headers)
+
+    version = _lineage_version(context)
+    etag = None
+    if version is not None:
+        etag = _make_etag(version, cll_input.model_dump(), disable_cll_cache, v2, ndjson)
+        if _etag_matches(request, etag):
+            return Response(status_code=304, headers={"ETag": etag})
+        response.headers["ETag"] = etag
+    headers = {"ETag": etag} if etag else None
+
+    dbt_adapter: DbtAdapter = context.adapter
+
+    def _get_cll() -> CllData:
+        return dbt_adapter.get_cll(
+            node_id=cll_input.node_id,
+            column=cll_input.column,
+            change_analysis=cll_input.change_analysis,
+            no_upstream=cll_input.no_upstream,
+            no_downstream=cll_input.no_downstream,
+            no_cll=cll_input.no_cll,
+            full_map=cll_input.full_map,
+            disable_cll_cache=disable_cll_cache,
+        )
+
+    def _dump_cll(cll: CllData) -> dict:
+        payload = CllOutput(current=cll).model_dump()
+        if fields is not None:
+            for key in ["nodes", "columns"]:
+                payload["current"][key] = {k: project(v, fields) for k, v in payload["current"][key].items()}
+        _maybe_v2_cll(payload["current"], request)
+        return jsonable_encoder(payload)
+
+    # The full map is the large payload that the lineage view reloads, so keep it serialized
+    if version is not None and cll_input.full_map and not ndjson:
+        key = (cll_input.model_dump_json(), disable_cll_cache, v2)
+        body = _cll_payloads.get_or_build(version, key, lambda: _dump_json(_dump_cll(_get_cll())))
+        return Response(content=body, media_type="application/json", headers=headers)
+
+    cll = _get_cll()
+    if ndjson:
+        return StreamingResponse(
+            stream_cll(cll, fields=fields, v2=v2),
+            media_type=NDJSON_MEDIA_TYPE,
+            headers=headers,
+        )
+    if fields is not None:
+        return JSONResponse(content=_dump_cll(cll), headers=headers)
 
     # DRC-3553: opt-in v2 vocabulary. Default path keeps the legacy wire values
     # and the CllOutput response_model contract; only when Accept-Vocabulary: v2
@@ -781,10 +940,8 @@ async def column_level_lineage_by_node(cll_input: CllIn, request: Request):
     # manual model_dump() deliberately matches the default response_model
     # serialization (no exclude_none) so the only difference between the two
     # modes is the change_category labels.
-    if wants_v2_vocabulary(request.headers):
-        payload = CllOutput(current=cll).model_dump()
-        _maybe_v2_cll(payload["current"], request)
-        return JSONResponse(content=jsonable_encoder(payload))
+    if v2:
+        return JSONResponse(content=_dump_cll(cll), headers=headers)
 
     return CllOutput(current=cll)
 
@@ -801,12 +958,19 @@ class SelectNodesOutput(BaseModel):
 
 
 @app.post("/api/select", response_model=SelectNodesOutput)
-async def select_nodes(input: SelectNodesInput):
+async def select_nodes(input: SelectNodesInput, request: Request, response: Response):
     context = default_context()
 
     if context.adapter_type != "dbt":
         raise HTTPException(status_code=400, detail="Only dbt adapter is supported")
 
+    version = _lineage_version(context)
+    if version is not None:
+        etag = _make_etag(version, input.model_dump())
+        if _etag_matches(request, etag):
+            return Response(status_code=304, headers={"ETag": etag})
+        response.headers["ETag"] = etag
+
     try:
         nodes = context.adapter.select_nodes(
             select=input.select,
@@ -1063,7 +1227,7 @@ async def version():
     try:
         return dict(
             version=__version__,
-            latestVersion=__latest_version__,
+            latestVersion=get_latest_version(),
         )
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
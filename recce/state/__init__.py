@@ -8,6 +8,7 @@ from .cloud import (
     s3_sse_c_headers,
 )
 from .const import ErrorMessage
+from .container import StateContainer, is_state_container, write_state_container
 from .local import FileStateLoader
 from .state import (
     ArtifactsRoot,
@@ -28,6 +29,9 @@ __all__ = [
     "CloudStateLoader",
     "FileStateLoader",
     "RecceStateMetadata",
+    "StateContainer",
+    "is_state_container",
+    "write_state_container",
     "filter_headers_for_presigned_url",
     "normalize_s3_metadata",
     "s3_metadata_headers",
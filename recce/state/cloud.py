@@ -1,12 +1,19 @@
 import logging
 import os
 from base64 import b64encode
+from concurrent.futures import ThreadPoolExecutor
 from hashlib import md5, sha256
 from typing import Dict, Optional, Tuple, Union
 from urllib.parse import parse_qs, urlencode, urlparse
 
 from recce.exceptions import RecceException
 from recce.pull_request import PullRequestInfo, fetch_pr_metadata
+from recce.util.cloud.transfer import (
+    download_to_file,
+    open_download,
+    read_json,
+    upload_file,
+)
 from recce.util.io import SupportedFileTypes, file_io_factory
 from recce.util.recce_cloud import PresignedUrlMethod, RecceCloud, RecceCloudException
 from recce.util.startup_perf import track_timing
@@ -238,11 +245,7 @@ class CloudStateLoader(RecceStateLoader):
         """Download state file from presigned URL and convert to RecceState."""
         import tempfile
 
-        import requests
-
-        with tempfile.NamedTemporaryFile() as tmp:
-            response = requests.get(presigned_url, headers=headers)
-
+        with tempfile.NamedTemporaryFile() as tmp, open_download(presigned_url, headers=headers) as response:
             if response.status_code == 404:
                 self.error_message = "The state file is not found in Recce Cloud."
                 return None
@@ -253,8 +256,7 @@ class CloudStateLoader(RecceStateLoader):
                     error_msg += " The password could be wrong."
                 raise RecceException(error_msg)
 
-            with open(tmp.name, "wb") as f:
-                f.write(response.content)
+            download_to_file(response, tmp.name)
 
             return RecceState.from_file(tmp.name, file_type=file_type)
 
@@ -284,14 +286,18 @@ class CloudStateLoader(RecceStateLoader):
         self.org_id = org_id
         self.project_id = project_id
 
-        # 2. Download manifests and catalogs for both session
-        logger.debug(f"Downloading current session artifacts for {self.session_id}")
-        current_artifacts = self._download_session_artifacts(self.recce_cloud, org_id, project_id, self.session_id)
-
-        logger.debug(f"Downloading base session artifacts for project {project_id}")
-        base_artifacts = self._download_base_session_artifacts(
-            self.recce_cloud, org_id, project_id, session_id=self.session_id
-        )
+        # 2. Download manifests and catalogs for both session, concurrently
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="recce-artifact-download") as executor:
+            logger.debug(f"Downloading current session artifacts for {self.session_id}")
+            current_future = executor.submit(
+                self._download_session_artifacts, self.recce_cloud, org_id, project_id, self.session_id
+            )
+            logger.debug(f"Downloading base session artifacts for project {project_id}")
+            base_future = executor.submit(
+                self._download_base_session_artifacts, self.recce_cloud, org_id, project_id, session_id=self.session_id
+            )
+            current_artifacts = current_future.result()
+            base_artifacts = base_future.result()
 
         # 3. Try to download existing recce_state, otherwise create new state
         try:
@@ -317,26 +323,22 @@ class CloudStateLoader(RecceStateLoader):
 
     def _download_session_artifacts(self, recce_cloud, org_id: str, project_id: str, session_id: str) -> dict:
         """Download manifest and catalog for a session, return JSON data directly."""
-        import requests
-
         # Get download URLs
         presigned_urls = recce_cloud.get_download_urls_by_session_id(org_id, project_id, session_id)
 
         artifacts = {}
 
         # Download manifest
-        response = requests.get(presigned_urls["manifest_url"])
-        if response.status_code == 200:
-            artifacts["manifest"] = response.json()
-        else:
-            raise RecceException(f"Failed to download manifest for session {session_id}")
+        with open_download(presigned_urls["manifest_url"]) as response:
+            if response.status_code != 200:
+                raise RecceException(f"Failed to download manifest for session {session_id}")
+            artifacts["manifest"] = read_json(response)
 
         # Download catalog
-        response = requests.get(presigned_urls["catalog_url"])
-        if response.status_code == 200:
-            artifacts["catalog"] = response.json()
-        else:
-            raise RecceException(f"Failed to download catalog for session {session_id}")
+        with open_download(presigned_urls["catalog_url"]) as response:
+            if response.status_code != 200:
+                raise RecceException(f"Failed to download catalog for session {session_id}")
+            artifacts["catalog"] = read_json(response)
 
         return artifacts
 
@@ -364,26 +366,22 @@ class CloudStateLoader(RecceStateLoader):
 
         If session_id is provided, the server resolves PR-specific base if available.
         """
-        import requests
-
         # Get download URLs for base session
         presigned_urls = recce_cloud.get_base_session_download_urls(org_id, project_id, session_id=session_id)
 
         artifacts = {}
 
         # Download manifest
-        response = requests.get(presigned_urls["manifest_url"])
-        if response.status_code == 200:
-            artifacts["manifest"] = response.json()
-        else:
-            raise RecceException(f"Failed to download base session manifest for project {project_id}")
+        with open_download(presigned_urls["manifest_url"]) as response:
+            if response.status_code != 200:
+                raise RecceException(f"Failed to download base session manifest for project {project_id}")
+            artifacts["manifest"] = read_json(response)
 
         # Download catalog
-        response = requests.get(presigned_urls["catalog_url"])
-        if response.status_code == 200:
-            artifacts["catalog"] = response.json()
-        else:
-            raise RecceException(f"Failed to download base session catalog for project {project_id}")
+        with open_download(presigned_urls["catalog_url"]) as response:
+            if response.status_code != 200:
+                raise RecceException(f"Failed to download base session catalog for project {project_id}")
+            artifacts["catalog"] = read_json(response)
 
         return artifacts
 
@@ -510,8 +508,6 @@ class CloudStateLoader(RecceStateLoader):
         """Upload state file to presigned URL."""
         import tempfile
 
-        import requests
-
         # Use provided state or default to self.state
         upload_state = state or self.state
 
@@ -531,8 +527,7 @@ class CloudStateLoader(RecceStateLoader):
             io = file_io_factory(file_type)
             io.write(tmp.name, json_data)
 
-            with open(tmp.name, "rb") as fd:
-                response = requests.put(presigned_url, data=fd.read(), headers=headers)
+            response = upload_file(presigned_url, tmp.name, headers=headers)
 
             if response.status_code not in [200, 204]:
                 self.error_message = response.text
@@ -0,0 +1,254 @@
+"""Chunked, content-addressed state file (state container v2).
+
+The container is a zip archive of separately compressed members::
+
+    index.json                  metadata, git, pull_request and section -> object hash
+    objects/<sha256>.json.gz    the JSON payload of one or more sections
+
+Sections are ``runs``, ``checks`` and ``artifacts/<base|current>/<name>``. Objects are
+addressed by the hash of their uncompressed payload, so identical base and current
+artifacts are stored once. Members are gzip-compressed individually and stored in
+the zip as-is, which lets a save copy the bytes of unchanged sections without
+decoding them. Artifacts are decoded on first access.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import stat
+import tempfile
+import zipfile
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from recce.exceptions import RecceException
+
+from .state import ArtifactsRoot, RecceState
+
+logger = logging.getLogger("uvicorn")
+
+STATE_CONTAINER_VERSION = 2
+STATE_CONTAINER_SUFFIX = ".recce"
+
+_INDEX_MEMBER = "index.json"
+_OBJECT_PREFIX = "objects/"
+_ARTIFACT_PREFIX = "artifacts/"
+
+_UNLOADED = object()
+
+
+def is_state_container(path: str) -> bool:
+    """True if ``path`` is an existing v2 state container."""
+    return os.path.isfile(path) and zipfile.is_zipfile(path)
+
+
+def _object_member(sha: str) -> str:
+    return f"{_OBJECT_PREFIX}{sha}.json.gz"
+
+
+def _dump_section(value: Any) -> Tuple[str, bytes]:
+    payload = json.dumps(value, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(payload).hexdigest(), payload
+
+
+class LazySections(Mapping):
+    """The artifacts of one environment, decoded from the container on first access.
+
+    A read-only mapping whose keys are known up front. Every way of reading it,
+    including ``dict(sections)`` and ``{**sections}``, goes through ``__getitem__``
+    and so loads the sections it returns.
+    """
+
+    def __init__(self, container: "StateContainer", env: str, names: Iterable[str]):
+        self._container = container
+        self._env = env
+        self._values: Dict[str, Any] = {
+            name: None if container.sections.get(self._name(env, name)) is None else _UNLOADED for name in names
+        }
+
+    @staticmethod
+    def _name(env: str, key: str) -> str:
+        return f"{_ARTIFACT_PREFIX}{env}/{key}"
+
+    def section_name(self, key: str) -> str:
+        return self._name(self._env, key)
+
+    def unloaded_hash(self, key: str) -> Optional[str]:
+        """The object hash of ``key`` if it has not been decoded yet, else None."""
+        if self._values.get(key) is not _UNLOADED:
+            return None
+        return self._container.sections[self.section_name(key)]
+
+    def __getitem__(self, key):
+        value = self._values[key]
+        if value is _UNLOADED:
+            value = self._container.read_section(self.section_name(key))
+            self._values[key] = value
+        return value
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __len__(self):
+        return len(self._values)
+
+    def copy(self) -> dict:
+        return dict(self)
+
+    def __repr__(self):
+        return f"LazySections({self._env}, {list(self._values)})"
+
+
+class StateContainer:
+    """Reader of a v2 state container.
+
+    Only the index is read when opening; sections and objects are read on demand.
+    ``known`` remembers which object holds a section value this container was
+    loaded from or written with, so later saves can skip serializing it again.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        try:
+            with zipfile.ZipFile(path) as zf:
+                index = json.loads(zf.read(_INDEX_MEMBER))
+        except (KeyError, zipfile.BadZipFile) as e:
+            raise RecceException(f"Invalid state container '{path}': {e}")
+        if index.get("container_version") != STATE_CONTAINER_VERSION:
+            raise RecceException(f"Unsupported state container version: {index.get('container_version')}")
+        self.index = index
+        self.sections: Dict[str, Optional[str]] = index.get("sections", {})
+        self.known: Dict[str, Tuple[Any, str]] = {}
+
+    def read_object(self, sha: str) -> bytes:
+        """The compressed bytes of an object, as stored in the container."""
+        with zipfile.ZipFile(self.path) as zf:
+            return zf.read(_object_member(sha))
+
+    def read_section(self, name: str) -> Any:
+        sha = self.sections.get(name)
+        if sha is None:
+            return None
+        value = json.loads(gzip.decompress(self.read_object(sha)))
+        if name.startswith(_ARTIFACT_PREFIX):
+            self.known[name] = (value, sha)
+        return value
+
+    def load_state(self) -> RecceState:
+        """Build the state from the index. Runs and checks are decoded now, artifacts lazily."""
+        state = RecceState(
+            metadata=self.index.get("metadata"),
+            runs=self.read_section("runs") or [],
+            checks=self.read_section("checks") or [],
+            git=self.index.get("git"),
+            pull_request=self.index.get("pull_request"),
+        )
+        artifacts = {"base": [], "current": []}
+        for name in self.sections:
+            if name.startswith(_ARTIFACT_PREFIX):
+                env, key = name[len(_ARTIFACT_PREFIX) :].split("/", 1)
+                artifacts.setdefault(env, []).append(key)
+        state.artifacts = ArtifactsRoot.model_construct(
+            base=LazySections(self, "base", artifacts["base"]),
+            current=LazySections(self, "current", artifacts["current"]),
+        )
+        return state
+
+
+def _file_mode(path: str) -> int:
+    """The mode of the existing file at ``path``, or the default mode for a new file under the umask."""
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def write_state_container(path: str, state: RecceState, previous: Optional[StateContainer] = None) -> StateContainer:
+    """Write ``state`` to ``path`` as a v2 container and return the container for the new file.
+
+    Sections that are unchanged since ``previous`` (or since the container already at
+    ``path``) are copied as compressed bytes. Artifacts count as unchanged when they are
+    still undecoded, or are the very objects last read from or written to the container;
+    runs and checks are compared by hash. The file is replaced atomically.
+    """
+    if previous is None and is_state_container(path):
+        try:
+            previous = StateContainer(path)
+        except RecceException as e:
+            logger.debug(f"Ignore the existing state container: {e}")
+
+    sections: Dict[str, Optional[str]] = {}
+    known: Dict[str, Tuple[Any, str]] = {}
+    # object hash -> compressed bytes, or the container to copy it from
+    objects: Dict[str, Any] = {}
+
+    def _add_payload(sha: str, payload: bytes):
+        if sha in objects:
+            return
+        if previous is not None and sha in previous.sections.values():
+            objects[sha] = previous
+        else:
+            objects[sha] = gzip.compress(payload, compresslevel=6)
+
+    state_dict = state.model_dump(mode="json", include={"runs", "checks"}, exclude_none=True)
+    for name in ["runs", "checks"]:
+        sha, payload = _dump_section(state_dict.get(name) or [])
+        _add_payload(sha, payload)
+        sections[name] = sha
+
+    for env in ["base", "current"]:
+        env_sections = getattr(state.artifacts, env) or {}
+        for key in env_sections:
+            name = LazySections._name(env, key)
+            if isinstance(env_sections, LazySections) and env_sections.unloaded_hash(key) is not None:
+                sha = env_sections.unloaded_hash(key)
+                objects.setdefault(sha, env_sections._container)
+                sections[name] = sha
+                continue
+
+            value = env_sections[key]
+            if value is None:
+                sections[name] = None
+                continue
+            cached = previous.known.get(name) if previous is not None else None
+            if cached is not None and cached[0] is value:
+                sha = cached[1]
+                objects.setdefault(sha, previous)
+            else:
+                sha, payload = _dump_section(value)
+                _add_payload(sha, payload)
+            sections[name] = sha
+            known[name] = (value, sha)
+
+    index = {
+        "container_version": STATE_CONTAINER_VERSION,
+        "metadata": state.metadata.model_dump(mode="json") if state.metadata else None,
+        "git": state.git.model_dump(mode="json", exclude_none=True) if state.git else None,
+        "pull_request": state.pull_request.model_dump(mode="json", exclude_none=True) if state.pull_request else None,
+        "sections": sections,
+    }
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".recce_state_", dir=directory)
+    os.close(fd)
+    try:
+        # mkstemp creates the file as 0600; give it the mode a plain write would have
+        os.chmod(tmp_path, _file_mode(path))
+        # Objects are already gzip-compressed, so the zip stores them as-is
+        with zipfile.ZipFile(tmp_path, "w", compression=zipfile.ZIP_STORED) as zf:
+            for sha, source in objects.items():
+                data = source.read_object(sha) if isinstance(source, StateContainer) else source
+                zf.writestr(_object_member(sha), data)
+            zf.writestr(_INDEX_MEMBER, json.dumps(index), compress_type=zipfile.ZIP_DEFLATED)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+    container = StateContainer(path)
+    container.known = known
+    return container
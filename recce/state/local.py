@@ -2,6 +2,7 @@ import logging
 import os
 from typing import Optional, Tuple, Union
 
+from .container import StateContainer, is_state_container
 from .state import RecceState
 from .state_loader import RecceStateLoader
 
@@ -25,7 +26,13 @@ class FileStateLoader(RecceStateLoader):
         return True
 
     def _load_state(self) -> Tuple[RecceState, str]:
-        state = RecceState.from_file(self.state_file) if self.state_file else None
+        state = None
+        if self.state_file and is_state_container(self.state_file):
+            # Keep the container, so the next save can copy the artifacts it still holds
+            self.state_container = StateContainer(self.state_file)
+            state = self.state_container.load_state()
+        elif self.state_file:
+            state = RecceState.from_file(self.state_file)
         state_tag = None
         return state, state_tag
 
@@ -3,9 +3,9 @@
 import json
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Mapping, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_serializer
 
 from recce import get_version
 from recce.exceptions import RecceException
@@ -50,6 +50,11 @@ class ArtifactsRoot(BaseModel):
     base: Dict[str, Optional[dict]] = {}
     current: Dict[str, Optional[dict]] = {}
 
+    @field_serializer("base", "current")
+    def _serialize_artifacts(self, artifacts: Mapping[str, Optional[dict]]):
+        # A state container loads its artifacts lazily, as a read-only mapping rather than a dict
+        return dict(artifacts)
+
 
 class RecceState(BaseModel):
     metadata: Optional[RecceStateMetadata] = None
@@ -85,6 +90,12 @@ class RecceState(BaseModel):
         if not Path(file_path).is_file():
             return None
 
+        if file_type == SupportedFileTypes.FILE:
+            from .container import StateContainer, is_state_container
+
+            if is_state_container(file_path):
+                return StateContainer(file_path).load_state()
+
         io = file_io_factory(file_type)
         json_content = io.read(file_path)
         return RecceState.from_json(json_content)
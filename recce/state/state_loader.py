@@ -9,6 +9,7 @@ from recce.pull_request import fetch_pr_metadata
 
 from ..util.io import SupportedFileTypes, file_io_factory
 from .const import RECCE_API_TOKEN_MISSING
+from .container import STATE_CONTAINER_SUFFIX, is_state_container, write_state_container
 from .state import RecceState
 
 logger = logging.getLogger("uvicorn")
@@ -36,6 +37,7 @@ class RecceStateLoader(ABC):
         self.catalog: Literal["github", "preview", "session"] = "github"
         self.share_id = None
         self.session_id = None
+        self.state_container = None
 
         if self.cloud_mode:
             if self.cloud_options.get("github_token"):
@@ -133,7 +135,18 @@ class RecceStateLoader(ABC):
     def _export_state_to_file(self, file_path: str, file_type: SupportedFileTypes = SupportedFileTypes.FILE) -> str:
         """
         Store the state to a file. Store happens when terminating the server or run instance.
+
+        A path ending with ``.recce``, or an existing v2 state container, is written as a
+        container, which rewrites only the sections that changed since the last save.
         """
+        if file_type == SupportedFileTypes.FILE and (
+            file_path.endswith(STATE_CONTAINER_SUFFIX) or is_state_container(file_path)
+        ):
+            previous = self.state_container
+            if previous is not None and previous.path != file_path:
+                previous = None
+            self.state_container = write_state_container(file_path, self.state, previous=previous)
+            return f"The state file is stored at '{file_path}'"
 
         json_data = self.state.to_json()
         io = file_io_factory(file_type)
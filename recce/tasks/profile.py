@@ -32,7 +32,27 @@ PROFILE_FLOAT_AGGREGATES = {
     "distinct_proportion": DataFrameColumnType.FLOAT,
 }
 
-PROFILE_COLUMN_JINJA_TEMPLATE = r"""
+# Number of columns profiled by one batched `select` (see PROFILE_COLUMNS_JINJA_TEMPLATE).
+PROFILE_COLUMN_BATCH_SIZE = 50
+
+# The output columns of a single-column profile, in select order.
+PROFILE_FIELDS = [
+    "column_name",
+    "data_type",
+    "row_count",
+    "not_null_proportion",
+    "distinct_proportion",
+    "distinct_count",
+    "is_unique",
+    "min",
+    "max",
+    "avg",
+    "median",
+]
+
+# Aggregate expressions for `column_name` / `column_type`. Shared by the
+# per-column and the batched templates so both compute the same profile.
+_PROFILE_AGGREGATES_JINJA = r"""
 {# Conditions -------------------------------------------- #}
 {%- set is_struct = column_type.startswith('struct') -%}
 {%- set is_numeric =
@@ -152,7 +172,9 @@ PROFILE_COLUMN_JINJA_TEMPLATE = r"""
 
 
 {# Main Query -------------------------------------------- #}
+"""
 
+PROFILE_COLUMN_JINJA_TEMPLATE = _PROFILE_AGGREGATES_JINJA + r"""
 select
     '{{ column_name }}' as column_name,
     nullif('{{ column_type }}', '') as data_type,
@@ -168,10 +190,41 @@ select
 from {{ relation }}
 """
 
+# Profile many columns with one scan of the relation. Every column contributes
+# the PROFILE_FIELDS aggregates as `p<index>_<field>`; the caller reads the
+# single result row back positionally and splits it into one row per column.
+PROFILE_COLUMNS_JINJA_TEMPLATE = (
+    r"""
+select
+{%- for column in columns %}
+{%- set column_name = column.name -%}
+{%- set column_type = column.type -%}
+"""
+    + _PROFILE_AGGREGATES_JINJA
+    + r"""
+    '{{ column_name }}' as p{{ loop.index0 }}_column_name,
+    nullif('{{ column_type }}', '') as p{{ loop.index0 }}_data_type,
+    {{ agg_row_count }} as p{{ loop.index0 }}_row_count,
+    {{ agg_not_null_proportion }} as p{{ loop.index0 }}_not_null_proportion,
+    {{ agg_distinct_proportion }} as p{{ loop.index0 }}_distinct_proportion,
+    {{ agg_distinct_count }} as p{{ loop.index0 }}_distinct_count,
+    {{ agg_is_unique }} as p{{ loop.index0 }}_is_unique,
+    {{ agg_min }} as p{{ loop.index0 }}_min,
+    {{ agg_max }} as p{{ loop.index0 }}_max,
+    {{ agg_avg }} as p{{ loop.index0 }}_avg,
+    {{ agg_median }} as p{{ loop.index0 }}_median
+    {%- if not loop.last %},{% endif %}
+{%- endfor %}
+from {{ relation }}
+"""
+)
+
 
 class ProfileParams(BaseModel):
     model: str
     columns: Optional[List[str]] = None
+    # Columns profiled per query. 1 (or less) profiles every column with its own query.
+    column_batch_size: Optional[int] = PROFILE_COLUMN_BATCH_SIZE
 
 
 class ProfileDiffResult(BaseModel):
@@ -221,23 +274,26 @@ class ProfileDiffTask(Task):
             completed = 0
 
             tables: List[agate.Table] = []
-
-            for column in base_columns:
-                self.update_progress(message=f"[Base] Profile column: {column.name}", percentage=completed / total)
-                relation = dbt_adapter.create_relation(model, base=True)
-                response, table = self._profile_column(dbt_adapter, relation, column)
-                tables.append(table)
-                completed = completed + 1
+            relation = dbt_adapter.create_relation(model, base=True)
+            for chunk in self._column_chunks(base_columns):
+                self.update_progress(
+                    message=f"[Base] Profile column: {', '.join(column.name for column in chunk)}",
+                    percentage=completed / total,
+                )
+                tables.extend(self._profile_columns(dbt_adapter, relation, chunk))
+                completed = completed + len(chunk)
                 self.check_cancel()
             base = DataFrame.from_agate(merge_tables(tables)).stamp_column_types(PROFILE_FLOAT_AGGREGATES)
 
             tables: List[agate.Table] = []
-            for column in curr_columns:
-                self.update_progress(message=f"[Current] Profile column: {column.column}", percentage=completed / total)
-                relation = dbt_adapter.create_relation(model, base=False)
-                response, table = self._profile_column(dbt_adapter, relation, column)
-                tables.append(table)
-                completed = completed + 1
+            relation = dbt_adapter.create_relation(model, base=False)
+            for chunk in self._column_chunks(curr_columns):
+                self.update_progress(
+                    message=f"[Current] Profile column: {', '.join(column.column for column in chunk)}",
+                    percentage=completed / total,
+                )
+                tables.extend(self._profile_columns(dbt_adapter, relation, chunk))
+                completed = completed + len(chunk)
                 self.check_cancel()
             current = DataFrame.from_agate(merge_tables(tables)).stamp_column_types(PROFILE_FLOAT_AGGREGATES)
 
@@ -248,6 +304,65 @@ class ProfileDiffTask(Task):
 
             return ProfileDiffResult(base=base, current=current)
 
+    def _column_chunks(self, columns):
+        batch_size = max(self.params.column_batch_size or 1, 1)
+        for i in range(0, len(columns), batch_size):
+            yield columns[i : i + batch_size]
+
+    def _profile_columns(self, dbt_adapter, relation, columns) -> list:
+        """Profile the columns with one query and return one single-row agate table per column.
+
+        If the batched query fails, the chunk is split in half and retried, so only
+        the columns whose aggregates actually fail end up on the per-column path
+        (which surfaces the original error).
+        """
+        if len(columns) == 1:
+            response, table = self._profile_column(dbt_adapter, relation, columns[0])
+            return [table]
+
+        try:
+            response, table = self._profile_column_batch(dbt_adapter, relation, columns)
+        except RecceException:
+            raise
+        except Exception:
+            self.check_cancel()
+            middle = len(columns) // 2
+            return self._profile_columns(dbt_adapter, relation, columns[:middle]) + self._profile_columns(
+                dbt_adapter, relation, columns[middle:]
+            )
+
+        return self._split_batch_table(table, len(columns))
+
+    @staticmethod
+    def _split_batch_table(table, num_columns: int) -> list:
+        import agate
+
+        width = len(PROFILE_FIELDS)
+        row = table.rows[0]
+        tables = []
+        for i in range(num_columns):
+            values = [row[j] for j in range(i * width, (i + 1) * width)]
+            column_types = list(table.column_types[i * width : (i + 1) * width])
+            tables.append(agate.Table([values], PROFILE_FIELDS, column_types))
+        return tables
+
+    def _profile_column_batch(self, dbt_adapter, relation, columns):
+        db_type = dbt_adapter.adapter.type().lower()
+        profile_columns = [dict(name=column.name, type=column.data_type.lower()) for column in columns]
+
+        try:
+            sql = dbt_adapter.generate_sql(
+                PROFILE_COLUMNS_JINJA_TEMPLATE,
+                base=False,  # always false because we use the macro in current manifest
+                context=dict(relation=relation, columns=profile_columns, db_type=db_type),
+            )
+        except Exception as e:
+            raise RecceException(
+                f"Failed to generate SQL for profiling columns: {', '.join(column.name for column in columns)}"
+            ) from e
+
+        return dbt_adapter.execute(sql, fetch=True)
+
     def _profile_column(self, dbt_adapter, relation, column):
         column_name = column.name
         column_type = column.data_type.lower()
@@ -328,12 +443,14 @@ class ProfileTask(ProfileDiffTask):
             completed = 0
 
             tables: List[agate.Table] = []
-            for column in curr_columns:
-                self.update_progress(message=f"[Current] Profile column: {column.column}", percentage=completed / total)
-                relation = dbt_adapter.create_relation(model, base=False)
-                response, table = self._profile_column(dbt_adapter, relation, column)
-                tables.append(table)
-                completed = completed + 1
+            relation = dbt_adapter.create_relation(model, base=False)
+            for chunk in self._column_chunks(curr_columns):
+                self.update_progress(
+                    message=f"[Current] Profile column: {', '.join(column.column for column in chunk)}",
+                    percentage=completed / total,
+                )
+                tables.extend(self._profile_columns(dbt_adapter, relation, chunk))
+                completed = completed + len(chunk)
                 self.check_cancel()
             current = DataFrame.from_agate(merge_tables(tables)).stamp_column_types(PROFILE_FLOAT_AGGREGATES)
             return ProfileResult(current=current)
@@ -1,4 +1,6 @@
 import logging
+import queue
+import threading
 from enum import Enum
 from typing import Any, Dict, List, Literal, Optional, Union
 
@@ -63,10 +65,14 @@ SYNTAX_ERROR_INDICATORS = [
 ]
 
 
+_render_lock = threading.Lock()
+
+
 def _make_row_count_result(
     count: Optional[int] = None,
     status: RowCountStatus = RowCountStatus.OK,
     message: Optional[str] = None,
+    exact: Optional[bool] = None,
 ) -> Dict[str, Any]:
     """Create a structured row count result with status information.
 
@@ -74,16 +80,118 @@ def _make_row_count_result(
         count: The row count value, or None if unavailable
         status: Status code indicating success or reason for failure
         message: Optional human-readable message explaining the status
+        exact: Whether the count is exact (count(*) or exact table metadata) or
+               an estimate from table statistics. Omitted when not applicable.
 
     Returns:
-        Dict with 'count', 'status', and optionally 'message' keys
+        Dict with 'count', 'status', and optionally 'message' and 'exact' keys
     """
     result: Dict[str, Any] = {"count": count, "status": status}
     if message:
         result["message"] = message
+    if exact is not None:
+        result["exact"] = exact
     return result
 
 
+# Batched table statistics per adapter: one query per (database, schema) returning (table_name, row_count).
+# The flag tells whether the warehouse maintains the count exactly or only as an estimate.
+# Views never show up here, and stale or never-analyzed tables are filtered out, so those fall back to count(*).
+_TABLE_STATS_QUERIES = {
+    "duckdb": (
+        "select table_name, estimated_size from duckdb_tables() "
+        "where lower(schema_name) = lower('{schema}'){database_filter}",
+        "lower(database_name) = lower('{database}')",
+        False,
+    ),
+    "postgres": (
+        "select c.relname, c.reltuples::bigint from pg_catalog.pg_class c "
+        "join pg_catalog.pg_namespace n on n.oid = c.relnamespace "
+        "left join pg_catalog.pg_stat_user_tables s on s.relid = c.oid "
+        "where n.nspname = '{schema}' and c.relkind in ('r', 'p') and c.reltuples >= 0 "
+        "and coalesce(s.n_mod_since_analyze, 0) <= c.reltuples * 0.1",
+        None,
+        False,
+    ),
+    "snowflake": (
+        "select table_name, row_count from {database}.information_schema.tables "
+        "where upper(table_schema) = upper('{schema}') and table_type = 'BASE TABLE'",
+        None,
+        True,
+    ),
+    "bigquery": (
+        "select table_id, row_count from `{database}.{schema}.__TABLES__` where type = 1",
+        None,
+        True,
+    ),
+}
+
+ROW_COUNT_METADATA_MATERIALIZATIONS = ("table", "incremental", "snapshot")
+
+
+def _quote_literal(value: str) -> str:
+    return str(value).replace("'", "''")
+
+
+def _query_row_counts_from_metadata(
+    task: Any, dbt_adapter: Any, query_candidates: List[str], envs: List[bool]
+) -> Dict[str, Dict[bool, Dict[str, Any]]]:
+    """Read row counts from warehouse table statistics, batched into one query per schema.
+
+    Only materialized tables are looked up. Models missing from the statistics (views, unknown adapters,
+    stale stats, failed lookups) are left out of the returned ``{model_name: {base: result}}`` so the
+    caller falls back to ``count(*)``. The connection is recorded on ``task.connections`` so ``cancel()``
+    can interrupt a slow statistics query.
+    """
+    stats_query = _TABLE_STATS_QUERIES.get(dbt_adapter.adapter.type())
+    if stats_query is None:
+        return {}
+    sql_template, database_filter, exact = stats_query
+
+    groups: Dict[tuple, List[tuple]] = {}
+    for base in envs:
+        for model_name in query_candidates:
+            node = dbt_adapter.find_node_by_name(model_name, base=base)
+            if node is None or node.resource_type not in ("model", "snapshot"):
+                continue
+            if node.config is None or node.config.materialized not in ROW_COUNT_METADATA_MATERIALIZATIONS:
+                continue
+            relation = dbt_adapter.create_relation(model_name, base=base)
+            if relation is None or not relation.schema or not relation.identifier:
+                continue
+            groups.setdefault((base, relation.database, relation.schema), []).append((model_name, relation))
+
+    results: Dict[str, Dict[bool, Dict[str, Any]]] = {}
+    if not groups:
+        return results
+
+    with dbt_adapter.connection_named("query_table_stats"):
+        task.connections.append(dbt_adapter.get_thread_connection())
+        for (base, database, schema), models in groups.items():
+            task.check_cancel()
+            if database_filter and database:
+                where_database = " and " + database_filter.format(database=_quote_literal(database))
+            else:
+                where_database = ""
+            sql = sql_template.format(database=database, schema=_quote_literal(schema), database_filter=where_database)
+            try:
+                _, table = dbt_adapter.execute(sql, fetch=True)
+            except Exception as e:
+                logger.debug(f"Table statistics unavailable for {database}.{schema}, falling back to count(*): {e}")
+                continue
+
+            counts = {str(row[0]).lower(): row[1] for row in table.rows if row[1] is not None}
+            for model_name, relation in models:
+                count = counts.get(relation.identifier.lower())
+                if count is None:
+                    continue
+                results.setdefault(model_name, {})[base] = _make_row_count_result(
+                    count=int(count), status=RowCountStatus.OK, exact=exact
+                )
+
+    return results
+
+
 def _query_row_count(dbt_adapter: Any, model_name: str, base: bool = False) -> Dict[str, Any]:
     """Query row count for a model with detailed status information.
 
@@ -130,12 +238,14 @@ def _query_row_count(dbt_adapter: Any, model_name: str, base: bool = False) -> D
         )
 
     sql_template = "select count(*) from {{ relation }}"
-    sql = dbt_adapter.generate_sql(sql_template, context=dict(relation=relation))
+    # generate_sql swaps the adapter-wide macro resolver, so keep rendering single-threaded
+    with _render_lock:
+        sql = dbt_adapter.generate_sql(sql_template, context=dict(relation=relation))
 
     try:
         _, table = dbt_adapter.execute(sql, fetch=True)
         count = int(table[0][0]) if table[0][0] is not None else 0
-        return _make_row_count_result(count=count, status=RowCountStatus.OK)
+        return _make_row_count_result(count=count, status=RowCountStatus.OK, exact=True)
     except Exception as e:
         error_msg = str(e).upper()
 
@@ -169,6 +279,100 @@ def _query_row_count(dbt_adapter: Any, model_name: str, base: bool = False) -> D
         raise
 
 
+def _query_row_counts(
+    task: "Task",
+    dbt_adapter: Any,
+    query_candidates: List[str],
+    envs: List[bool],
+    label: str,
+    threads: Optional[int] = None,
+    strategy: Optional[str] = None,
+) -> Dict[str, Dict[bool, Dict[str, Any]]]:
+    """Query row counts for every candidate model in each environment of ``envs`` (``True`` is base).
+
+    With ``threads`` <= 1 the queries run one after another on a single "query" connection. Otherwise
+    up to ``threads`` worker threads each hold their own named dbt connection and pull (model, env)
+    pairs from a shared queue, so the latency is bounded by the slowest worker instead of the sum of
+    all round trips. Progress and cancellation are handled on the calling thread in both modes; the
+    connections in use are recorded on ``task.connections`` so ``cancel()`` can interrupt them.
+
+    With ``strategy="metadata"`` counts are first read from the warehouse table statistics and only
+    the models those do not cover are counted with ``count(*)``.
+
+    Returns ``{model_name: {base: _query_row_count result}}``.
+    """
+    query_candidates = list(dict.fromkeys(query_candidates))
+    results: Dict[str, Dict[bool, Dict[str, Any]]] = {node: {} for node in query_candidates}
+    total = len(query_candidates)
+    if strategy == "metadata" and query_candidates:
+        for node, counts in _query_row_counts_from_metadata(task, dbt_adapter, query_candidates, envs).items():
+            results[node].update(counts)
+        task.check_cancel()
+    jobs = [(node, base) for node in query_candidates for base in envs if base not in results[node]]
+    threads = min(threads or 1, len(jobs))
+
+    if threads <= 1:
+        with dbt_adapter.connection_named("query"):
+            task.connections.append(dbt_adapter.get_thread_connection())
+            for completed, node in enumerate(query_candidates):
+                task.update_progress(message=f"{label}: {node} [{completed}/{total}]", percentage=completed / total)
+                for base in envs:
+                    if base in results[node]:
+                        continue
+                    results[node][base] = _query_row_count(dbt_adapter, node, base=base)
+                    task.check_cancel()
+        return results
+
+    pending: "queue.Queue" = queue.Queue()
+    for job in jobs:
+        pending.put(job)
+    finished: "queue.Queue" = queue.Queue()
+    stop = threading.Event()
+
+    def worker(index: int):
+        try:
+            with dbt_adapter.connection_named(f"query_{index}"):
+                task.connections.append(dbt_adapter.get_thread_connection())
+                while not stop.is_set():
+                    try:
+                        node, base = pending.get_nowait()
+                    except queue.Empty:
+                        return
+                    try:
+                        finished.put((node, base, _query_row_count(dbt_adapter, node, base=base), None))
+                    except Exception as e:
+                        finished.put((node, base, None, e))
+        except Exception as e:
+            # Failed to open or release the connection; surface it instead of hanging the caller
+            finished.put((None, None, None, e))
+
+    workers = [
+        threading.Thread(target=worker, args=(i,), name=f"recce-row-count-{i}", daemon=True) for i in range(threads)
+    ]
+    for w in workers:
+        w.start()
+
+    try:
+        completed = sum(1 for node in query_candidates if len(results[node]) == len(envs))
+        task.update_progress(message=f"{label}: [{completed}/{total}]", percentage=completed / total)
+        for _ in range(len(jobs)):
+            node, base, result, error = finished.get()
+            # A cancelled run closes the connections, so report the cancellation rather than the query error
+            task.check_cancel()
+            if error is not None:
+                raise error
+            results[node][base] = result
+            if len(results[node]) == len(envs):
+                completed += 1
+                task.update_progress(message=f"{label}: {node} [{completed}/{total}]", percentage=completed / total)
+    finally:
+        stop.set()
+        for w in workers:
+            w.join()
+
+    return results
+
+
 def _split_row_count_result(result: Dict[str, Any]) -> tuple:
     """Split a _query_row_count result into (count, meta) for backward-compatible output.
 
@@ -183,6 +387,10 @@ def _split_row_count_result(result: Dict[str, Any]) -> tuple:
 class RowCountParams(BaseModel):
     node_names: Optional[list[str]] = None
     node_ids: Optional[list[str]] = None
+    # Number of concurrent warehouse connections. None or 1 queries the models one at a time.
+    threads: Optional[int] = None
+    # "metadata" reads counts from warehouse table statistics where available, falling back to count(*).
+    strategy: Optional[Literal["count", "metadata"]] = None
 
 
 class RowCountTask(Task, QueryMixin):
@@ -191,7 +399,7 @@ class RowCountTask(Task, QueryMixin):
     def __init__(self, params: dict):
         super().__init__()
         self.params = RowCountParams(**params) if params is not None else RowCountParams()
-        self.connection = None
+        self.connections = []
 
     def execute(self):
         result = {}
@@ -223,28 +431,28 @@ class RowCountTask(Task, QueryMixin):
                 if name:
                     query_candidates.append(name)
 
-        # Query row count for nodes that are not cached
-        with dbt_adapter.connection_named("query"):
-            self.connection = dbt_adapter.get_thread_connection()
-            completed = 0
-            total = len(query_candidates)
-            for node in query_candidates:
-                self.update_progress(message=f"Query: {node} [{completed}/{total}]", percentage=completed / total)
-
-                curr_count, curr_meta = _split_row_count_result(_query_row_count(dbt_adapter, node, base=False))
-                self.check_cancel()
-                result[node] = {
-                    "curr": curr_count,
-                    "curr_meta": curr_meta,
-                }
-                completed += 1
+        row_counts = _query_row_counts(
+            self,
+            dbt_adapter,
+            query_candidates,
+            [False],
+            "Query",
+            threads=self.params.threads,
+            strategy=self.params.strategy,
+        )
+        for node in query_candidates:
+            curr_count, curr_meta = _split_row_count_result(row_counts[node][False])
+            result[node] = {
+                "curr": curr_count,
+                "curr_meta": curr_meta,
+            }
 
         return result
 
     def cancel(self):
         super().cancel()
-        if self.connection:
-            self.close_connection(self.connection)
+        for connection in list(self.connections):
+            self.close_connection(connection)
 
 
 class RowCountDiffParams(BaseModel):
@@ -254,13 +462,17 @@ class RowCountDiffParams(BaseModel):
     exclude: Optional[str] = None
     packages: Optional[list[str]] = None
     view_mode: Optional[Literal["all", "changed_models"]] = None
+    # Number of concurrent warehouse connections. None or 1 queries the models one at a time.
+    threads: Optional[int] = None
+    # "metadata" reads counts from warehouse table statistics where available, falling back to count(*).
+    strategy: Optional[Literal["count", "metadata"]] = None
 
 
 class RowCountDiffTask(Task, QueryMixin):
     def __init__(self, params: dict):
         super().__init__()
         self.params = RowCountDiffParams(**params) if params is not None else RowCountDiffParams()
-        self.connection = None
+        self.connections = []
 
     def execute_dbt(self):
         result = {}
@@ -292,25 +504,24 @@ class RowCountDiffTask(Task, QueryMixin):
                 if name:
                     query_candidates.append(name)
 
-        # Query row count for nodes that are not cached
-        with dbt_adapter.connection_named("query"):
-            self.connection = dbt_adapter.get_thread_connection()
-            completed = 0
-            total = len(query_candidates)
-            for node in query_candidates:
-                self.update_progress(message=f"Diff: {node} [{completed}/{total}]", percentage=completed / total)
-
-                base_count, base_meta = _split_row_count_result(_query_row_count(dbt_adapter, node, base=True))
-                self.check_cancel()
-                curr_count, curr_meta = _split_row_count_result(_query_row_count(dbt_adapter, node, base=False))
-                self.check_cancel()
-                result[node] = {
-                    "base": base_count,
-                    "curr": curr_count,
-                    "base_meta": base_meta,
-                    "curr_meta": curr_meta,
-                }
-                completed += 1
+        row_counts = _query_row_counts(
+            self,
+            dbt_adapter,
+            query_candidates,
+            [True, False],
+            "Diff",
+            threads=self.params.threads,
+            strategy=self.params.strategy,
+        )
+        for node in query_candidates:
+            base_count, base_meta = _split_row_count_result(row_counts[node][True])
+            curr_count, curr_meta = _split_row_count_result(row_counts[node][False])
+            result[node] = {
+                "base": base_count,
+                "curr": curr_count,
+                "base_meta": base_meta,
+                "curr_meta": curr_meta,
+            }
 
         return result
 
@@ -386,12 +597,13 @@ class RowCountDiffTask(Task, QueryMixin):
 
     def cancel(self):
         super().cancel()
-        if self.connection:
-            self.close_connection(self.connection)
+        for connection in list(self.connections):
+            self.close_connection(connection)
 
 
 class RowCountDiffResultDiffer(TaskResultDiffer):
     def _check_result_changed_fn(self, result):
+        # Estimated counts are compared like exact ones; *_meta.exact lets the UI label them approximate
         base = {}
         current = {}
 
@@ -9,11 +9,30 @@ from .core import CheckValidator, Task, TaskResultDiffer
 from .dataframe import DataFrame
 from .utils import normalize_boolean_flag_columns, normalize_keys_to_columns
 
+# Number of columns compared by one join in ValueDiffTask. Each column adds a
+# case expression and four conditional aggregates to the query, so this keeps
+# wide models under dialect limits on select-list size.
+VALUE_DIFF_COLUMN_BATCH_SIZE = 100
+
+# match_status produced by the value diff query -> value diff counter.
+# See https://github.com/dbt-labs/dbt-audit-helper/blob/main/macros/compare_column_values.sql
+VALUE_DIFF_STATE_MAPPINGS = {
+    "perfect match": "matched",
+    "both are null": "matched",
+    "missing from a": "added",
+    "missing from b": "removed",
+    "value is null in a only": "mismatched",
+    "value is null in b only": "mismatched",
+    "values do not match": "mismatched",
+}
+
 
 class ValueDiffParams(BaseModel):
     model: str
     primary_key: Union[str, List[str]]
     columns: Optional[List[str]] = None
+    # Columns compared per join. 1 (or less) runs one join per column.
+    column_batch_size: Optional[int] = VALUE_DIFF_COLUMN_BATCH_SIZE
 
 
 class ValueDiffResult(BaseModel):
@@ -259,65 +278,66 @@ class ValueDiffTask(Task, ValueDiffMixin):
         from aggregated
         """
 
-        for column in columns:
-            self.update_progress(message=f"Diff column: {column}", percentage=completed / len(columns))
-
-            sql = dbt_adapter.generate_sql(
-                sql_template,
-                context=dict(
-                    base_relation=dbt_adapter.create_relation(model, base=True),
-                    curr_relation=dbt_adapter.create_relation(model, base=False),
-                    primary_keys=primary_key if composite else [primary_key],
-                    column_to_compare=column,
-                    a_relation_name="a",
-                    b_relation_name="b",
-                ),
+        batch_size = max(self.params.column_batch_size or 1, 1)
+        if batch_size > 1:
+            self._query_value_diff_batched(
+                dbt_adapter,
+                model,
+                primary_key if composite else [primary_key],
+                columns,
+                column_groups,
+                batch_size,
             )
+        else:
+            for column in columns:
+                self.update_progress(message=f"Diff column: {column}", percentage=completed / len(columns))
+
+                sql = dbt_adapter.generate_sql(
+                    sql_template,
+                    context=dict(
+                        base_relation=dbt_adapter.create_relation(model, base=True),
+                        curr_relation=dbt_adapter.create_relation(model, base=False),
+                        primary_keys=primary_key if composite else [primary_key],
+                        column_to_compare=column,
+                        a_relation_name="a",
+                        b_relation_name="b",
+                    ),
+                )
 
-            _, table = dbt_adapter.execute(sql, fetch=True)
-            if column not in column_groups:
-                column_groups[column] = dict(added=0, removed=0, mismatched=0, matched=0)
-            for row in table.rows:
-                # data example:
-                # ('COLUMN_NAME', 'MATCH_STATUS', 'COUNT_RECORDS', 'PERCENT_OF_TOTAL')
-                # ('EVENT_ID', 'perfect match', 158601510, Decimal('100.00'))
-                column_name, column_state, row_count, total_rate = row
-                if "column_name" == row[0].lower():
-                    # skip header row if database adapter returns column names as data
-                    continue
-
-                # sample data like this:
-                #     https://github.com/dbt-labs/dbt-audit-helper/blob/main/macros/compare_column_values.sql
-                #
-                #     'perfect match'            -> matched
-                #     'both are null'            -> matched
-                #     'missing from a'           -> row added
-                #     'missing from b'           -> row removed
-                #     'value is null in a only'  -> mismatched
-                #     'value is null in b only'  -> mismatched
-                #     'values do not match'      -> mismatched
-                #     'unknown'                  -> this should never happen
-                # end as match_status,
-
-                state_mappings = {
-                    "perfect match": "matched",
-                    "both are null": "matched",
-                    "missing from a": "added",
-                    "missing from b": "removed",
-                    "value is null in a only": "mismatched",
-                    "value is null in b only": "mismatched",
-                    "values do not match": "mismatched",
-                }
-
-                # Use exact matching to update counts
-                action = state_mappings.get(column_state)
-                if action:
-                    column_groups[column_name][action] += row_count
-
-            # Cancel as early as possible
-            self.check_cancel()
-
-            completed = completed + 1
+                _, table = dbt_adapter.execute(sql, fetch=True)
+                if column not in column_groups:
+                    column_groups[column] = dict(added=0, removed=0, mismatched=0, matched=0)
+                for row in table.rows:
+                    # data example:
+                    # ('COLUMN_NAME', 'MATCH_STATUS', 'COUNT_RECORDS', 'PERCENT_OF_TOTAL')
+                    # ('EVENT_ID', 'perfect match', 158601510, Decimal('100.00'))
+                    column_name, column_state, row_count, total_rate = row
+                    if "column_name" == row[0].lower():
+                        # skip header row if database adapter returns column names as data
+                        continue
+
+                    # sample data like this:
+                    #     https://github.com/dbt-labs/dbt-audit-helper/blob/main/macros/compare_column_values.sql
+                    #
+                    #     'perfect match'            -> matched
+                    #     'both are null'            -> matched
+                    #     'missing from a'           -> row added
+                    #     'missing from b'           -> row removed
+                    #     'value is null in a only'  -> mismatched
+                    #     'value is null in b only'  -> mismatched
+                    #     'values do not match'      -> mismatched
+                    #     'unknown'                  -> this should never happen
+                    # end as match_status,
+
+                    # Use exact matching to update counts
+                    action = VALUE_DIFF_STATE_MAPPINGS.get(column_state)
+                    if action:
+                        column_groups[column_name][action] += row_count
+
+                # Cancel as early as possible
+                self.check_cancel()
+
+                completed = completed + 1
 
         first = list(column_groups.values())[0]
         added = first["added"]
@@ -356,6 +376,116 @@ class ValueDiffTask(Task, ValueDiffMixin):
             data=DataFrame.from_agate(table),
         )
 
+    def _query_value_diff_batched(
+        self,
+        dbt_adapter,
+        model: str,
+        primary_keys: List[str],
+        columns: List[str],
+        column_groups: dict,
+        batch_size: int,
+    ):
+        """
+        Compare many columns per query: the surrogate key is hashed and the relations are joined once per
+        chunk of `batch_size` columns, and every column's match_status is counted with conditional
+        aggregation. Fills `column_groups` with the same counters as the per-column query.
+        """
+        sql_template = r"""
+        {%- set default_null_value = "_recce_surrogate_key_null_" -%}
+        {%- set fields = [] -%}
+
+        {%- for field in primary_keys -%}
+            {%- do fields.append(
+                "coalesce(cast(" ~ adapter.quote(field) ~ " as " ~ dbt.type_string() ~ "), '" ~ default_null_value  ~"')"
+            ) -%}
+
+            {%- if not loop.last %}
+                {%- do fields.append("'-'") -%}
+            {%- endif -%}
+        {%- endfor -%}
+
+        {%- set _pk = dbt.hash(dbt.concat(fields)) -%}
+
+        with a_query as (
+            select {{ _pk }} as _pk, * from {{ base_relation }}
+        ),
+
+        b_query as (
+            select {{ _pk }} as _pk, * from {{ curr_relation }}
+        ),
+
+        joined as (
+            select
+                coalesce(a_query._pk, b_query._pk) as _pk
+            {%- for column_to_compare in columns_to_compare %}
+                {%- set _quoted_col = adapter.quote(column_to_compare) %},
+                case
+                    when a_query.{{ _quoted_col }} = b_query.{{ _quoted_col }} then 'perfect match'
+                    when a_query.{{ _quoted_col }} is null and b_query.{{ _quoted_col }} is null then 'both are null'
+                    when a_query._pk is null then 'missing from {{ a_relation_name }}'
+                    when b_query._pk is null then 'missing from {{ b_relation_name }}'
+                    when a_query.{{ _quoted_col }} is null then 'value is null in {{ a_relation_name }} only'
+                    when b_query.{{ _quoted_col }} is null then 'value is null in {{ b_relation_name }} only'
+                    when a_query.{{ _quoted_col }} != b_query.{{ _quoted_col }} then 'values do not match'
+                    else 'unknown' -- this should never happen
+                end as match_status_{{ loop.index0 }}
+            {%- endfor %}
+            from a_query
+            full outer join b_query on a_query._pk = b_query._pk
+        )
+
+        select
+        {%- for column_to_compare in columns_to_compare %}
+            {%- set column_index = loop.index0 %}
+            {%- for action, states in actions %}
+            sum(case when match_status_{{ column_index }} in ('{{ states | join("', '") }}') then 1 else 0 end)
+                as {{ action }}_{{ column_index }}
+            {%- if not loop.last %},{% endif %}
+            {%- endfor %}
+            {%- if not loop.last %},{% endif %}
+        {%- endfor %}
+        from joined
+        """
+
+        actions = []
+        for action in ["added", "removed", "mismatched", "matched"]:
+            states = [state for state, mapped in VALUE_DIFF_STATE_MAPPINGS.items() if mapped == action]
+            actions.append((action, states))
+
+        completed = 0
+        for i in range(0, len(columns), batch_size):
+            chunk = columns[i : i + batch_size]
+            self.update_progress(message=f"Diff column: {', '.join(chunk)}", percentage=completed / len(columns))
+
+            sql = dbt_adapter.generate_sql(
+                sql_template,
+                context=dict(
+                    base_relation=dbt_adapter.create_relation(model, base=True),
+                    curr_relation=dbt_adapter.create_relation(model, base=False),
+                    primary_keys=primary_keys,
+                    columns_to_compare=chunk,
+                    actions=actions,
+                    a_relation_name="a",
+                    b_relation_name="b",
+                ),
+            )
+
+            _, table = dbt_adapter.execute(sql, fetch=True)
+            # The aggregates are read back by position: dialects differ in the case of the result column names.
+            row = table.rows[0] if len(table.rows) > 0 else [None] * (len(chunk) * len(actions))
+            for column_index, column in enumerate(chunk):
+                counts = column_groups.setdefault(column, dict(added=0, removed=0, mismatched=0, matched=0))
+                if column.lower() == "column_name":
+                    # Same as the per-column query, which drops its rows as a header row
+                    continue
+                for action_index, (action, _) in enumerate(actions):
+                    counts[action] += int(row[column_index * len(actions) + action_index] or 0)
+
+            # Cancel as early as possible
+            self.check_cancel()
+
+            completed = completed + len(chunk)
+
     def execute(self):
         dbt_adapter = default_context().adapter
 
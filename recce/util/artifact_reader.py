@@ -0,0 +1,150 @@
+"""Read path for dbt ``manifest.json`` / ``catalog.json``.
+
+When ``orjson`` is installed, the file is memory-mapped and parsed straight from the
+mapping, instead of being read into a ``str`` first as dbt's
+``read_and_check_versions`` does. ``orjson`` is optional; without it the standard
+library parses the file as text, which costs the same memory as dbt's own reader.
+
+``prune_manifest`` drops manifest content recce never reads, for modes that do not
+need it. The parse time and the size of the pruned content are recorded on the
+startup tracker as ``<name>_parse`` and ``<name>_skipped``.
+"""
+
+import json
+import mmap
+import os
+import pickle
+import time
+from typing import Dict, Optional, Set, Tuple
+
+from recce.util.startup_perf import get_startup_tracker
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+# Doc blocks and disabled nodes; recce renders neither
+UNUSED_MANIFEST_SECTIONS = ("docs", "disabled")
+
+
+def loads_json(data: bytes):
+    """Parse JSON bytes, with ``orjson`` when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps_size(value) -> int:
+    if orjson is not None:
+        return len(orjson.dumps(value))
+    return len(json.dumps(value, separators=(",", ":")))
+
+
+def _read_mapped(path: str) -> dict:
+    with open(path, "rb") as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # An empty file cannot be mapped
+            return orjson.loads(f.read())
+        with mapped, memoryview(mapped) as view:
+            return orjson.loads(view)
+
+
+def read_json_artifact(path: str, timing_name: Optional[str] = None) -> dict:
+    """Parse a JSON artifact, from a memory map of ``path`` with ``orjson``. Raises ``ValueError`` on invalid JSON."""
+    start = time.perf_counter_ns()
+    if orjson is not None:
+        data = _read_mapped(path)
+    else:
+        # Decoding as text avoids holding a bytes copy next to the str json.loads would build
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+    if timing_name and (tracker := get_startup_tracker()):
+        tracker.record_timing(f"{timing_name}_parse", (time.perf_counter_ns() - start) / 1_000_000)
+    return data
+
+
+def _used_macros(data: dict) -> Set[str]:
+    """Macros the manifest's resources depend on, directly or through other macros."""
+    macros = data.get("macros") or {}
+    pending = []
+    for key in ["nodes", "exposures", "metrics", "semantic_models", "saved_queries", "unit_tests"]:
+        for resource in (data.get(key) or {}).values():
+            pending.extend(((resource or {}).get("depends_on") or {}).get("macros") or [])
+
+    used = set()
+    while pending:
+        macro_id = pending.pop()
+        if macro_id in used:
+            continue
+        used.add(macro_id)
+        pending.extend(((macros.get(macro_id) or {}).get("depends_on") or {}).get("macros") or [])
+    return used
+
+
+def prune_manifest(data: dict, macro_bodies: bool = False, timing_name: Optional[str] = None) -> dict:
+    """Return a shallow copy of a manifest dict without the content recce never reads.
+
+    Drops ``UNUSED_MANIFEST_SECTIONS``. With ``macro_bodies``, also blanks the SQL of
+    macros no resource depends on; only for modes that never run queries, since the
+    adapter's own macros are among them. ``data`` itself is not modified.
+    """
+    pruned = dict(data)
+    removed = []
+    for key in UNUSED_MANIFEST_SECTIONS:
+        if pruned.get(key):
+            removed.append(pruned[key])
+            pruned[key] = {}
+
+    if macro_bodies and data.get("macros"):
+        used = _used_macros(data)
+        macros = {}
+        for macro_id, macro in data["macros"].items():
+            if macro_id not in used and macro.get("macro_sql"):
+                removed.append(macro["macro_sql"])
+                macro = {**macro, "macro_sql": ""}
+            macros[macro_id] = macro
+        pruned["macros"] = macros
+
+    if timing_name and (tracker := get_startup_tracker()):
+        tracker.set_artifact_size(f"{timing_name}_skipped", _dumps_size(removed))
+    return pruned
+
+
+def load_artifact_worker(artifact: str, path: str) -> Tuple[Optional[bytes], Dict[str, float]]:
+    """Process pool entry point: load a ``manifest`` or ``catalog`` file and return it pickled.
+
+    Rebuilding the artifact from the pickle is much cheaper than from the JSON, so the
+    parent only pays for that. Also returns the worker's ``parse``, ``construct`` and
+    ``pickle`` timings in ms. Raises on an incompatible schema version; the caller then
+    loads the file in-process to surface the proper error.
+    """
+    # Only the artifact schemas, to keep the worker's startup imports small
+    if artifact == "manifest":
+        from dbt.contracts.graph.manifest import WritableManifest as artifact_cls
+    else:
+        from dbt.contracts.results import CatalogArtifact as artifact_cls
+
+    if not os.path.isfile(path):
+        return None, {}
+
+    timings = {}
+    start = time.perf_counter_ns()
+    data = read_json_artifact(path)
+    timings["parse"] = (time.perf_counter_ns() - start) / 1_000_000
+
+    found = (data.get("metadata") or {}).get("dbt_schema_version")
+    if found and not artifact_cls.is_compatible_version(found):
+        raise ValueError(f"Incompatible {artifact} schema version: {found}")
+
+    start = time.perf_counter_ns()
+    result = artifact_cls.upgrade_schema_version(data)
+    timings["construct"] = (time.perf_counter_ns() - start) / 1_000_000
+
+    start = time.perf_counter_ns()
+    payload = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+    timings["pickle"] = (time.perf_counter_ns() - start) / 1_000_000
+    return payload, timings
@@ -2,10 +2,10 @@ from typing import Any, Optional
 
 import sqlglot.expressions as exp
 from pydantic import BaseModel, Field
-from sqlglot import parse_one
 from sqlglot.errors import SqlglotError
 
 from recce.models.types import CllData
+from recce.util.ast_cache import parse_sql
 
 
 class JoinInfo(BaseModel):
@@ -118,7 +118,7 @@ def _top_level_selects(tree: exp.Expression) -> list[exp.Select]:
 
 def analyze_sql(compiled_sql: str, dialect: Optional[str] = None) -> SqlStructure:
     try:
-        tree = parse_one(compiled_sql, dialect=dialect)
+        tree = parse_sql(compiled_sql, dialect=dialect, copy=False)
     except SqlglotError:
         return SqlStructure(unparseable=True)
 
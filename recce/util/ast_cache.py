@@ -0,0 +1,130 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+import sqlglot.expressions as exp
+from sqlglot import parse_one
+from sqlglot.optimizer.qualify import qualify
+
+_DEFAULT_MAXSIZE = 256
+
+AstKey = Tuple[str, str, str]
+
+
+class AstCache:
+    """Size-bounded LRU cache of parsed (and optionally qualified) sqlglot trees.
+
+    Keyed by (dialect, sql hash, schema hash). An entry with an empty schema
+    hash is the plain ``parse_one`` result; entries with a schema hash hold the
+    ``qualify``-ed tree for that schema. Parse errors are not cached.
+
+    Cached trees are shared. ``get_or_parse`` and ``get_or_qualify`` hand out a
+    copy unless the caller passes ``copy=False`` and promises not to mutate it.
+    """
+
+    def __init__(self, maxsize: int = _DEFAULT_MAXSIZE):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[AstKey, exp.Expression]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(sql: str, dialect=None, schema: Optional[dict] = None) -> AstKey:
+        if dialect is None:
+            dialect_key = ""
+        elif isinstance(dialect, str):
+            dialect_key = dialect.lower()
+        else:
+            dialect_key = (dialect if isinstance(dialect, type) else type(dialect)).__name__.lower()
+        sql_hash = hashlib.sha256(sql.encode("utf-8")).hexdigest()
+        if schema is None:
+            schema_hash = ""
+        else:
+            schema_hash = hashlib.sha256(json.dumps(schema, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+        return dialect_key, sql_hash, schema_hash
+
+    def _get(self, key: AstKey) -> Optional[exp.Expression]:
+        with self._lock:
+            tree = self._entries.get(key)
+            if tree is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return tree
+
+    def _put(self, key: AstKey, tree: exp.Expression) -> None:
+        with self._lock:
+            self._entries[key] = tree
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def get_or_parse(self, sql: str, dialect=None, copy: bool = True) -> exp.Expression:
+        """``parse_one(sql, dialect=dialect)`` through the cache. Parse errors propagate."""
+        key = self.make_key(sql, dialect)
+        tree = self._get(key)
+        if tree is None:
+            tree = parse_one(sql, dialect=dialect)
+            self._put(key, tree)
+        return tree.copy() if copy else tree
+
+    def get_or_qualify(
+        self, sql: str, schema: Optional[dict] = None, dialect=None, copy: bool = True, strict: bool = True
+    ) -> exp.Expression:
+        """``qualify(parse_one(sql), schema=schema)`` through the cache.
+
+        Parse errors propagate. Qualify errors propagate too, unless ``strict`` is
+        False: then the tree as far as ``qualify`` got before failing is returned
+        (and cached), the same as running ``qualify`` in place and ignoring the error.
+        A ``None`` schema is cached apart from the plain parse, since ``qualify``
+        still rewrites the tree without one.
+        """
+        key = self.make_key(sql, dialect, schema or {})
+        partial_key = key[:2] + (key[2] + ":partial",)
+        tree = self._get(key)
+        if tree is None and not strict:
+            tree = self._get(partial_key)
+        if tree is None:
+            # qualify rewrites in place, so it works on a copy of the cached parse
+            tree = self.get_or_parse(sql, dialect=dialect)
+            try:
+                tree = qualify(tree, schema=schema, dialect=dialect)
+            except Exception:
+                if strict:
+                    raise
+                self._put(partial_key, tree)
+            else:
+                self._put(key, tree)
+        return tree.copy() if copy else tree
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_ast_cache = AstCache()
+
+
+def get_ast_cache() -> AstCache:
+    return _ast_cache
+
+
+def parse_sql(sql: str, dialect=None, copy: bool = True) -> exp.Expression:
+    """Parse ``sql`` through the shared AST cache."""
+    return _ast_cache.get_or_parse(sql, dialect=dialect, copy=copy)
+
+
+def qualify_sql(
+    sql: str, schema: Optional[dict] = None, dialect=None, copy: bool = True, strict: bool = True
+) -> exp.Expression:
+    """Parse and qualify ``sql`` against ``schema`` through the shared AST cache."""
+    return _ast_cache.get_or_qualify(sql, schema=schema, dialect=dialect, copy=copy, strict=strict)
@@ -1,12 +1,11 @@
 import time
 from dataclasses import dataclass
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 import sqlglot.expressions as exp
-from sqlglot import Dialect, parse_one
+from sqlglot import Dialect
 from sqlglot.errors import SqlglotError
 from sqlglot.optimizer import Scope, traverse_scope
-from sqlglot.optimizer.qualify import qualify
 
 from recce.models.types import (  # noqa: F401  (re-exported for callers importing from this module)
     CHANGE_CATEGORY_ALIASES,
@@ -16,6 +15,7 @@ from recce.models.types import (  # noqa: F401  (re-exported for callers importi
     normalize_change_category,
     to_v2_change_category,
 )
+from recce.util.ast_cache import parse_sql, qualify_sql
 
 CHANGE_CATEGORY_UNKNOWN = NodeChange(category="unknown")
 CHANGE_CATEGORY_BREAKING = NodeChange(category="breaking")
@@ -382,14 +382,11 @@ def parse_change_category(
         dialect = Dialect.get(dialect)
 
         def _parse(sql, schema):
-            exp = parse_one(sql, dialect=dialect)
+            # Scopes are only compared below, so the trees are shared with the AST cache
             if schema:
-                try:
-                    exp = qualify(exp, schema=schema, dialect=dialect)
-                except Exception:
-                    # cannot optimize, skip it.
-                    pass
-            return exp
+                # If it cannot be fully optimized, go on with what qualify managed
+                return qualify_sql(sql, schema=schema, dialect=dialect, copy=False, strict=False)
+            return parse_sql(sql, dialect=dialect, copy=False)
 
         old_exp = _parse(old_sql, old_schema)
         new_exp = _parse(new_sql, new_schema)
@@ -437,3 +434,21 @@ def parse_change_category(
             return result
 
     return result
+
+
+def change_category_worker(
+    old_sql, new_sql, old_schema=None, new_schema=None, dialect=None
+) -> Tuple[NodeChange, Dict[str, int]]:
+    """Process-pool entry point for ``parse_change_category()``.
+
+    Returns the change together with the error counters of the worker's own
+    ``BreakingPerformanceTracking``, so the caller can aggregate them.
+    """
+    perf_tracking = BreakingPerformanceTracking()
+    change = parse_change_category(
+        old_sql, new_sql, old_schema=old_schema, new_schema=new_schema, dialect=dialect, perf_tracking=perf_tracking
+    )
+    return change, {
+        "sqlglot_error_nodes": perf_tracking.sqlglot_error_nodes,
+        "other_error_nodes": perf_tracking.other_error_nodes,
+    }
@@ -2,19 +2,21 @@ import hashlib
 import logging
 import os
 import sqlite3
+import threading
 import time
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 import sqlglot.expressions as exp
-from sqlglot import Dialect, parse_one
+from sqlglot import Dialect
 from sqlglot.errors import OptimizeError, SqlglotError
 from sqlglot.optimizer import Scope, traverse_scope
-from sqlglot.optimizer.qualify import qualify
 
 from recce.exceptions import RecceException
 from recce.models.types import CllColumn, CllColumnDep
+from recce.util.ast_cache import parse_sql, qualify_sql
 
 logger = logging.getLogger("recce")
 
@@ -24,8 +26,10 @@ CllResult = Tuple[
 ]
 
 _DEFAULT_DB_PATH = os.path.join(os.path.expanduser("~"), ".recce", "cll_cache.db")
-_CACHE_SCHEMA_VERSION = 3
+_CACHE_SCHEMA_VERSION = 4
 _DEFAULT_TTL_SECONDS = 7 * 24 * 3600  # 7 days
+# Stay well below SQLITE_MAX_VARIABLE_NUMBER (999 on older SQLite builds)
+_BULK_READ_CHUNK_SIZE = 500
 
 
 class CllCache:
@@ -40,6 +44,9 @@ class CllCache:
     - TTL eviction: entries not accessed within ``ttl_seconds`` are deleted.
       Eviction is not automatic; callers must invoke ``evict_stale()`` explicitly.
     - Single file at ``~/.recce/cll_cache.db`` (configurable).
+    - One connection per process, reused across calls and guarded by a lock.
+      ``get_nodes()`` reads many entries in one query and touches their
+      ``last_accessed`` in a single write.
     """
 
     def __init__(
@@ -49,6 +56,9 @@ class CllCache:
     ):
         self._db_path: Optional[str] = None
         self._ttl_seconds = ttl_seconds
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_pid: Optional[int] = None
+        self._lock = threading.Lock()
         if db_path:
             self._db_path = db_path
             Path(db_path).parent.mkdir(parents=True, exist_ok=True)
@@ -71,10 +81,29 @@ class CllCache:
                 (str(_CACHE_SCHEMA_VERSION),),
             )
 
-    def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self._db_path, timeout=10)
-        conn.execute("PRAGMA journal_mode=WAL")
-        return conn
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Yield the shared connection inside a transaction.
+
+        The connection is opened lazily and reopened after a fork, since a
+        SQLite handle must not be used from a child process.
+        """
+        with self._lock:
+            if self._conn is None or self._conn_pid != os.getpid():
+                conn = sqlite3.connect(self._db_path, timeout=10, check_same_thread=False)
+                conn.execute("PRAGMA journal_mode=WAL")
+                self._conn = conn
+                self._conn_pid = os.getpid()
+            with self._conn:
+                yield self._conn
+
+    def close(self) -> None:
+        """Close the shared connection. The next call reopens it."""
+        with self._lock:
+            if self._conn is not None and self._conn_pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+            self._conn_pid = None
 
     def evict_stale(self) -> int:
         """Delete entries not accessed within the TTL. Returns count of deleted rows.
@@ -125,21 +154,42 @@ class CllCache:
         On hit, updates ``last_accessed`` timestamp (for TTL eviction).
         Returns JSON string or None.
         """
+        return self.get_nodes([(node_id, content_key)]).get(node_id)
+
+    def get_nodes(self, entries: Iterable[Tuple[str, str]]) -> Dict[str, str]:
+        """Bulk-read cached CllData JSON for many nodes.
+
+        Each entry: (node_id, content_key). Returns a dict of node_id to JSON
+        string for the hits only. ``last_accessed`` of all hits is updated in
+        one write after the reads.
+        """
         if not self._db_path:
-            return None
-        key = self.make_node_key(node_id, content_key)
+            return {}
+        key_to_node = {self.make_node_key(node_id, content_key): node_id for node_id, content_key in entries}
+        if not key_to_node:
+            return {}
+        keys = list(key_to_node)
+        result = {}
         try:
             with self._connect() as conn:
-                row = conn.execute("SELECT value FROM cll_node_cache WHERE key = ?", (key,)).fetchone()
-                if row:
-                    conn.execute(
+                for i in range(0, len(keys), _BULK_READ_CHUNK_SIZE):
+                    chunk = keys[i : i + _BULK_READ_CHUNK_SIZE]
+                    placeholders = ",".join("?" * len(chunk))
+                    rows = conn.execute(
+                        f"SELECT key, value FROM cll_node_cache WHERE key IN ({placeholders})", chunk
+                    ).fetchall()
+                    for key, value in rows:
+                        result[key] = value
+                if result:
+                    now = time.time()
+                    conn.executemany(
                         "UPDATE cll_node_cache SET last_accessed = ? WHERE key = ?",
-                        (time.time(), key),
+                        [(now, key) for key in result],
                     )
-                    return row[0]
         except Exception as e:
-            logger.debug("[cll cache] get_node failed for %s: %s", node_id, e)
-        return None
+            logger.debug("[cll cache] get_nodes failed for %d entries: %s", len(keys), e)
+            return {}
+        return {key_to_node[key]: value for key, value in result.items()}
 
     def put_node(self, node_id: str, content_key: str, value_json: str) -> None:
         """Store a per-node CllData JSON entry."""
@@ -213,8 +263,10 @@ def get_cll_cache() -> CllCache:
 
 
 def set_cll_cache(cache: CllCache) -> None:
-    """Replace the module-level CLL cache instance."""
+    """Replace the module-level CLL cache instance, closing the previous one."""
     global _cll_cache
+    if _cll_cache is not cache:
+        _cll_cache.close()
     _cll_cache = cache
 
 
@@ -623,12 +675,13 @@ def cll(sql, schema=None, dialect=None) -> CllResult:
     dialect = Dialect.get(dialect) if dialect is not None else None
 
     try:
-        expression = parse_one(sql, dialect=dialect)
+        parse_sql(sql, dialect=dialect, copy=False)
     except SqlglotError as e:
         raise RecceException(f"Failed to parse SQL: {str(e)}")
 
+    # The qualified tree is only read below, so it is shared with the AST cache
     try:
-        expression = qualify(expression, schema=schema, dialect=dialect)
+        expression = qualify_sql(sql, schema=schema, dialect=dialect, copy=False)
     except OptimizeError as e:
         raise RecceException(f"Failed to optimize SQL: {str(e)}")
     except SqlglotError as e:
@@ -650,3 +703,19 @@ def cll(sql, schema=None, dialect=None) -> CllResult:
     if result is None:
         raise RecceException("Failed to extract CLL from SQL")
     return result
+
+
+def cll_worker(sql, schema=None, dialect=None) -> Tuple[str, Optional[CllResult]]:
+    """Process-pool entry point for ``cll()``.
+
+    Returns ``(status, result)`` instead of raising, so failures never have to be
+    pickled across the process boundary. ``status`` is ``"ok"``, ``"sqlglot_error"``
+    when sqlglot cannot handle the SQL, or ``"other_error"`` for any other failure;
+    the result is None unless the status is ``"ok"``.
+    """
+    try:
+        return "ok", cll(sql, schema=schema, dialect=dialect)
+    except RecceException:
+        return "sqlglot_error", None
+    except Exception:
+        return "other_error", None
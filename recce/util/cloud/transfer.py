@@ -0,0 +1,88 @@
+"""
+Transfer of artifacts and state files through presigned URLs.
+
+All transfers share one pooled ``requests.Session``, so the downloads of a cloud
+session reuse their connections and can run concurrently. Downloads are read from
+the raw stream, decoding any gzip content-encoding on the way: files are written to
+disk chunk by chunk, and JSON bodies are buffered once as bytes and parsed from
+there, without the extra ``response.content`` / ``response.text`` copies. Uploads
+send the open file.
+"""
+
+import shutil
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from recce.util.artifact_reader import loads_json
+
+# Base and current manifests and catalogs, plus the state file
+_POOL_SIZE = 8
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def get_transfer_session() -> requests.Session:
+    """The pooled session used for presigned URL transfers."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=_POOL_SIZE, pool_maxsize=_POOL_SIZE)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+    return _session
+
+
+def _download_headers(presigned_url: str, headers: Optional[Dict[str, str]]) -> Dict[str, str]:
+    from recce.state.cloud import get_signed_headers
+
+    headers = dict(headers or {})
+    # A signed Accept-Encoding must be sent as signed, so only ask for gzip when it is not
+    if "accept-encoding" not in get_signed_headers(presigned_url):
+        headers.setdefault("Accept-Encoding", "gzip")
+    return headers
+
+
+@contextmanager
+def open_download(presigned_url: str, headers: Optional[Dict[str, str]] = None) -> Iterator[requests.Response]:
+    """Start a streamed GET of a presigned URL.
+
+    The caller checks the status code, then reads the body with ``read_json`` or
+    ``download_to_file``. A gzip content-encoding is decoded while reading.
+    """
+    response = get_transfer_session().get(presigned_url, headers=_download_headers(presigned_url, headers), stream=True)
+    try:
+        response.raw.decode_content = True
+        yield response
+    finally:
+        response.close()
+
+
+def read_json(response: requests.Response) -> Any:
+    """Parse the JSON body of a streamed response.
+
+    The decoded body is read into memory once before parsing; neither parser can
+    consume it incrementally.
+    """
+    return loads_json(response.raw.read())
+
+
+def download_to_file(response: requests.Response, path: str):
+    """Write the body of a streamed response to ``path``."""
+    with open(path, "wb") as f:
+        shutil.copyfileobj(response.raw, f)
+
+
+def upload_file(presigned_url: str, path: str, headers: Optional[Dict[str, str]] = None) -> requests.Response:
+    """PUT the file at ``path`` to a presigned URL, streamed from disk.
+
+    The body is sent with its Content-Length rather than chunked, as presigned PUTs require.
+    """
+    with open(path, "rb") as f:
+        return get_transfer_session().put(presigned_url, data=f, headers=headers)
@@ -1,4 +1,4 @@
-from typing import Dict, Iterable, Set, Tuple
+from typing import Dict, Iterable, List, Set, Tuple
 
 from recce.models.types import CllColumn, CllNode
 
@@ -39,6 +39,64 @@ def find_downstream(node_ids: Iterable, child_map):
     return downstream
 
 
+class LineageIndex:
+    """Integer-encoded adjacency lists of a lineage graph.
+
+    Built once from a ``parent_map`` so that repeated upstream/downstream
+    queries walk lists of ints instead of hashing string ids at every step.
+    ``upstream()`` and ``downstream()`` return the same sets as
+    ``find_upstream()`` and ``find_downstream()``.
+    """
+
+    def __init__(self, parent_map: Dict[str, Iterable[str]]):
+        self.parent_map = parent_map
+        self._ids: List[str] = []
+        self._index: Dict[str, int] = {}
+        parents: List[List[int]] = []
+        children: List[List[int]] = []
+
+        def intern(node_id: str) -> int:
+            i = self._index.get(node_id)
+            if i is None:
+                i = self._index[node_id] = len(self._ids)
+                self._ids.append(node_id)
+                parents.append([])
+                children.append([])
+            return i
+
+        for node_id, node_parents in parent_map.items():
+            i = intern(node_id)
+            for parent in node_parents:
+                p = intern(parent)
+                parents[i].append(p)
+                children[p].append(i)
+
+        self._parents = [tuple(p) for p in parents]
+        self._children = [tuple(c) for c in children]
+
+    def __contains__(self, node_id: str) -> bool:
+        return node_id in self._index
+
+    def _walk(self, node_ids: Iterable[str], adjacency: List[Tuple[int, ...]]) -> Set[str]:
+        seen = bytearray(len(self._ids))
+        stack = [self._index[n] for n in node_ids if n in self._index]
+        reached = []
+        while stack:
+            for nxt in adjacency[stack.pop()]:
+                if not seen[nxt]:
+                    seen[nxt] = 1
+                    reached.append(nxt)
+                    stack.append(nxt)
+        ids = self._ids
+        return {ids[i] for i in reached}
+
+    def upstream(self, node_ids: Iterable[str]) -> Set[str]:
+        return self._walk(node_ids, self._parents)
+
+    def downstream(self, node_ids: Iterable[str]) -> Set[str]:
+        return self._walk(node_ids, self._children)
+
+
 def find_column_dependencies(node_column_id: str, parent_map: Dict, child_map: Dict) -> Tuple[Set, Set]:
     upstream_cols = find_upstream([node_column_id], parent_map)
     downstream_cols = find_downstream([node_column_id], child_map)
@@ -0,0 +1,170 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+logger = logging.getLogger("recce")
+
+_DEFAULT_DB_PATH = os.path.join(os.path.expanduser("~"), ".recce", "run_result_cache.db")
+_CACHE_SCHEMA_VERSION = 1
+_DEFAULT_TTL_SECONDS = 24 * 3600  # 1 day
+
+
+class RunResultCache:
+    """Diff run results cache backed by SQLite.
+
+    Stores the serialized result of a diff run keyed by the run type, the
+    normalized params, the Recce version (which pins the SQL the task
+    generates) and a fingerprint of every relation the run reads. A rebuilt
+    or modified model changes its fingerprint, so unchanged checks are served
+    from disk after a server restart or in a repeated ``recce run``.
+
+    - SQLite with WAL mode for concurrent readers.
+    - TTL eviction: entries older than ``ttl_seconds`` are never served, and
+      ``evict_stale()`` deletes them. The TTL bounds how long a change made
+      outside dbt (which no fingerprint can see) may go unnoticed.
+    - Single file at ``~/.recce/run_result_cache.db`` (configurable).
+    - ``bypass`` skips lookups but still stores fresh results.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        ttl_seconds: int = _DEFAULT_TTL_SECONDS,
+        bypass: bool = False,
+    ):
+        self._db_path: Optional[str] = None
+        self._ttl_seconds = ttl_seconds
+        self.bypass = bypass
+        if db_path:
+            self._db_path = db_path
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+            self._init_db()
+
+    @property
+    def enabled(self) -> bool:
+        return self._db_path is not None
+
+    def _init_db(self) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS run_result_cache ("
+                "  key TEXT PRIMARY KEY,"
+                "  value TEXT NOT NULL,"
+                "  created_at REAL NOT NULL"
+                ")"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self._db_path, timeout=10)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    @staticmethod
+    def make_key(run_type: str, params: Optional[dict], fingerprints: Dict[str, str], code_version: str) -> str:
+        """Build a cache key from the run type, normalized params and relation fingerprints.
+
+        Params with a ``None`` value are dropped so that omitted and explicit
+        defaults hit the same entry.
+        """
+        normalized = {k: v for k, v in (params or {}).items() if v is not None}
+        h = hashlib.sha256()
+        for part in (
+            str(_CACHE_SCHEMA_VERSION),
+            code_version,
+            str(run_type),
+            json.dumps(normalized, sort_keys=True, default=str),
+            json.dumps(fingerprints, sort_keys=True),
+        ):
+            h.update(part.encode("utf-8"))
+            h.update(b"\x00")
+        return h.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Get a cached result JSON. Returns None on miss, expiry or bypass."""
+        if not self._db_path or self.bypass:
+            return None
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT value FROM run_result_cache WHERE key = ? AND created_at >= ?",
+                    (key, time.time() - self._ttl_seconds),
+                ).fetchone()
+                if row:
+                    return row[0]
+        except Exception as e:
+            logger.debug("[run cache] get failed: %s", e)
+        return None
+
+    def put(self, key: str, value_json: str) -> None:
+        """Store a result JSON entry."""
+        if not self._db_path:
+            return
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO run_result_cache (key, value, created_at) VALUES (?, ?, ?)",
+                    (key, value_json, time.time()),
+                )
+        except Exception as e:
+            logger.debug("[run cache] put failed: %s", e)
+
+    def evict_stale(self) -> int:
+        """Delete entries older than the TTL. Returns count of deleted rows."""
+        if not self._db_path:
+            return 0
+        try:
+            with self._connect() as conn:
+                return conn.execute(
+                    "DELETE FROM run_result_cache WHERE created_at < ?",
+                    (time.time() - self._ttl_seconds,),
+                ).rowcount
+        except Exception as e:
+            logger.warning("[run cache] evict_stale failed: %s", e, exc_info=True)
+            return 0
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Return count of entries in the SQLite cache."""
+        if not self._db_path:
+            return {"entries": 0}
+        try:
+            with self._connect() as conn:
+                count = conn.execute("SELECT COUNT(*) FROM run_result_cache").fetchone()[0]
+            return {"entries": count}
+        except Exception:
+            return {"entries": 0}
+
+
+def _init_run_result_cache() -> RunResultCache:
+    """Initialize the module-level run result cache.
+
+    Off by default. Enable with ENABLE_RUN_RESULT_CACHE=1 to persist diff
+    results in SQLite (~/.recce/run_result_cache.db). Set RUN_RESULT_CACHE_DB
+    to override the default path and RUN_RESULT_CACHE_TTL (seconds) to
+    override the TTL.
+    """
+    if os.environ.get("ENABLE_RUN_RESULT_CACHE", "0") != "1":
+        return RunResultCache()
+    db_path = os.environ.get("RUN_RESULT_CACHE_DB", _DEFAULT_DB_PATH)
+    ttl_seconds = int(os.environ.get("RUN_RESULT_CACHE_TTL", _DEFAULT_TTL_SECONDS))
+    cache = RunResultCache(db_path=db_path, ttl_seconds=ttl_seconds)
+    cache.evict_stale()
+    return cache
+
+
+_run_result_cache = _init_run_result_cache()
+
+
+def get_run_result_cache() -> RunResultCache:
+    return _run_result_cache
+
+
+def set_run_result_cache(cache: RunResultCache) -> None:
+    """Replace the module-level run result cache instance."""
+    global _run_result_cache
+    _run_result_cache = cache
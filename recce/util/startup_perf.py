@@ -78,13 +78,15 @@ def clear_startup_tracker():
     _startup_tracker = None
 
 
-def track_timing(timing_name: str = None, *, record_size: bool = False):
+def track_timing(timing_name: str = None, *, record_size: bool = False, pass_name: bool = False):
     """
     Decorator factory to track timing for any operation.
 
     Args:
         timing_name: Name for the timing. If None, expects 'timing_name' kwarg at call time.
         record_size: If True, record file size from 'path' kwarg.
+        pass_name: If True, pass the timing name on to the function as the 'timing_name' kwarg,
+            for functions that record finer-grained timings of their own.
 
     Usage:
         # Name at decoration time
@@ -108,6 +110,9 @@ def track_timing(timing_name: str = None, *, record_size: bool = False):
             if name is None:
                 name = kwargs.pop("timing_name", None)
 
+            if pass_name:
+                kwargs["timing_name"] = name
+
             path = kwargs.get("path") or (args[0] if args else None)
 
             start = time.perf_counter_ns()
@@ -0,0 +1,97 @@
+"""
+Non-blocking check for a newer Recce release on PyPI.
+
+The latest version is cached on disk. Readers only ever look at the cache; when it is missing or older
+than the TTL, a daemon thread refreshes it in the background so the next invocation sees the result.
+A failed fetch is cached too, so offline machines retry at most once per TTL.
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Optional
+
+from packaging.version import InvalidVersion, Version
+
+_DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".recce", ".latest_version.json")
+_DEFAULT_TTL_SECONDS = 24 * 60 * 60
+
+_refresh_lock = threading.Lock()
+_refresh_thread: Optional[threading.Thread] = None
+
+
+def _cache_path() -> str:
+    return os.environ.get("RECCE_VERSION_CHECK_CACHE", _DEFAULT_CACHE_PATH)
+
+
+def _read_cache() -> Optional[dict]:
+    try:
+        with open(_cache_path(), "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or not isinstance(data.get("checked_at"), (int, float)):
+        return None
+    return data
+
+
+def _write_cache(latest_version: Optional[str]) -> None:
+    path = _cache_path()
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": latest_version, "checked_at": time.time()}, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+def _refresh() -> None:
+    from recce import fetch_latest_version
+
+    _write_cache(fetch_latest_version())
+
+
+def refresh_in_background() -> Optional[threading.Thread]:
+    """Start a daemon thread that refreshes the cached latest version, unless one is already running."""
+    global _refresh_thread
+
+    with _refresh_lock:
+        if _refresh_thread is not None and _refresh_thread.is_alive():
+            return _refresh_thread
+        _refresh_thread = threading.Thread(target=_refresh, name="recce-version-check", daemon=True)
+        _refresh_thread.start()
+        return _refresh_thread
+
+
+def get_latest_version(refresh: bool = True) -> str:
+    """
+    Return the latest released version known to the disk cache, falling back to the installed version.
+
+    Never blocks on the network. If ``refresh`` is set and the cache is missing or stale, a background
+    refresh is started for the benefit of later calls.
+    """
+    from recce import get_version
+
+    current_version = get_version()
+    if "dev" in current_version:
+        # Dev builds never report an update
+        return current_version
+
+    cache = _read_cache()
+    if refresh and (cache is None or time.time() - cache["checked_at"] > _DEFAULT_TTL_SECONDS):
+        refresh_in_background()
+
+    latest_version = cache.get("version") if cache else None
+    return latest_version or current_version
+
+
+def is_recce_outdated(refresh: bool = True) -> bool:
+    from recce import get_version
+
+    try:
+        return Version(get_version()) < Version(get_latest_version(refresh=refresh))
+    except InvalidVersion:
+        return False
@@ -1,6 +1,16 @@
+from unittest.mock import patch
+
+from dbt.contracts.files import FileHash
+
 from recce.adapter.dbt_adapter import DbtAdapter
 from recce.models.types import CllData
-from recce.util.lineage import build_column_key
+from recce.util.cll import CllCache, get_cll_cache, set_cll_cache
+from recce.util.lineage import (
+    build_column_key,
+    filter_dependency_maps,
+    find_downstream,
+    find_upstream,
+)
 
 
 def assert_parent_map(result: CllData, node_or_column_id, parents):
@@ -359,6 +369,141 @@ def test_cll_with_compiled_code_multiple_parents(dbt_test_helper):
     assert_column(result, "model.model3", "a", transformation_type="passthrough", parents=[("model.model1", "a")])
 
 
+def test_get_cll_batch_in_worker_processes(dbt_test_helper):
+    """get_cll_batch with jobs > 1 parses in worker processes and matches the in-process result."""
+    dbt_test_helper.create_model(
+        "model1", unique_id="model.model1", curr_sql="select 1 as id, 2 as a", curr_columns={"id": "int", "a": "int"}
+    )
+    dbt_test_helper.create_model(
+        "model2",
+        unique_id="model.model2",
+        curr_sql='select id, a + 1 as b from {{ ref("model1") }}',
+        curr_columns={"id": "int", "b": "int"},
+        depends_on=["model.model1"],
+    )
+    dbt_test_helper.create_model(
+        "model3",
+        unique_id="model.model3",
+        curr_sql="select this is not sql",
+        curr_columns={"c": "int"},
+        depends_on=["model.model2"],
+    )
+    adapter: DbtAdapter = dbt_test_helper.context.adapter
+    _set_compiled_code(adapter, "model.model2", 'select id, a + 1 as b from "main"."model1"')
+    _set_compiled_code(adapter, "model.model3", "select this is not sql")
+
+    node_ids = ["model.model1", "model.model2", "model.model3", "model.missing"]
+    completed = []
+    with patch("recce.adapter.dbt_adapter.log_performance") as mock_log:
+        results, errors = adapter.get_cll_batch(node_ids, jobs=2, on_complete=completed.append)
+
+    assert errors == {}
+    metrics = mock_log.call_args.args[1]
+    assert metrics["total_nodes"] == 3
+    assert metrics["sqlglot_error_nodes"] == 1
+    assert metrics["other_error_nodes"] == 0
+    assert sorted(completed) == sorted(node_ids)
+    assert results["model.missing"] is None
+    for node_id in ["model.model1", "model.model2", "model.model3"]:
+        adapter.get_cll_cached.cache_clear()
+        assert results[node_id] == adapter.get_cll_cached(node_id)
+    assert_column(
+        results["model.model2"], "model.model2", "b", transformation_type="derived", parents=[("model.model1", "a")]
+    )
+    assert_column(results["model.model3"], "model.model3", "c", transformation_type="unknown", parents=[])
+
+
+def _create_modified_models(dbt_test_helper):
+    dbt_test_helper.create_model(
+        "model1",
+        unique_id="model.model1",
+        curr_sql="select 1 as C, 2 as d",
+        base_sql="select 1 as C",
+        curr_columns={"C": "int", "d": "int"},
+        base_columns={"C": "int"},
+    )
+    dbt_test_helper.create_model(
+        "model2",
+        unique_id="model.model2",
+        curr_sql='select C from {{ ref("model1") }} where C > 0',
+        base_sql='select C from {{ ref("model1") }}',
+        curr_columns={"C": "int"},
+        base_columns={"C": "int"},
+        depends_on=["model.model1"],
+    )
+    dbt_test_helper.create_model(
+        "model3",
+        unique_id="model.model3",
+        curr_sql="select e from (",
+        base_sql="select 1 as e",
+        curr_columns={"e": "int"},
+        base_columns={"e": "int"},
+    )
+
+
+def _reset_change_analysis(adapter: DbtAdapter):
+    adapter._get_lineage_diff_cached.cache_clear()
+    adapter.get_change_analysis_cached.cache_clear()
+
+
+def test_classify_modified_nodes_in_worker_processes(dbt_test_helper):
+    """classify_modified_nodes with jobs > 1 matches the per-node classification."""
+    _create_modified_models(dbt_test_helper)
+    adapter: DbtAdapter = dbt_test_helper.context.adapter
+
+    expected = {
+        nid: adapter.get_change_analysis_cached(nid).change for nid in ["model.model1", "model.model2", "model.model3"]
+    }
+    assert expected["model.model1"].category == "non_breaking"
+    assert expected["model.model1"].columns == {"d": "added"}
+    assert expected["model.model2"].category == "breaking"
+    assert expected["model.model3"].category == "unknown"
+
+    _reset_change_analysis(adapter)
+    result = adapter.classify_modified_nodes(jobs=2)
+    assert {nid: node_diff.change for nid, node_diff in result.items()} == expected
+    assert adapter.get_change_analysis_cached("model.model2") is result["model.model2"]
+    # Already classified nodes are skipped
+    assert adapter.classify_modified_nodes() == {}
+
+
+def test_classify_modified_nodes_bad_node_is_unknown(dbt_test_helper):
+    """A node whose schema cannot be built is classified as unknown without failing the batch."""
+    _create_modified_models(dbt_test_helper)
+    adapter: DbtAdapter = dbt_test_helper.context.adapter
+    get_schema = adapter._get_change_analysis_schema
+
+    def fail_for_model2(lineage, node_id):
+        if node_id == "model.model2":
+            raise KeyError(node_id)
+        return get_schema(lineage, node_id)
+
+    with patch.object(adapter, "_get_change_analysis_schema", side_effect=fail_for_model2):
+        result = adapter.classify_modified_nodes()
+    assert result["model.model2"].change.category == "unknown"
+    assert result["model.model1"].change.category == "non_breaking"
+
+
+def test_classify_modified_nodes_persists_in_cll_cache(dbt_test_helper, tmp_path):
+    """Re-opening the same diff serves the classification from the CLL cache without parsing."""
+    _create_modified_models(dbt_test_helper)
+    adapter: DbtAdapter = dbt_test_helper.context.adapter
+
+    previous_cache = get_cll_cache()
+    set_cll_cache(CllCache(db_path=str(tmp_path / "cll_cache.db")))
+    try:
+        first = {nid: d.change for nid, d in adapter.classify_modified_nodes().items()}
+        assert first["model.model1"].columns == {"d": "added"}
+
+        _reset_change_analysis(adapter)
+        with patch("recce.adapter.dbt_adapter.parse_change_category") as parse:
+            second = {nid: d.change for nid, d in adapter.classify_modified_nodes().items()}
+        assert parse.call_count == 0
+        assert second == first
+    finally:
+        set_cll_cache(previous_cache)
+
+
 def test_cll_with_compiled_code_alias_collision_falls_back(dbt_test_helper):
     """When two parent nodes have the same alias, fall back to Jinja rendering."""
 
@@ -1377,6 +1522,201 @@ def test_build_full_cll_map_with_changes(dbt_test_helper):
     assert len(full_map.nodes) == 3
 
 
+def test_build_full_cll_map_incremental(dbt_test_helper):
+    """After a reload, only changed nodes and their dependents are recomputed."""
+    dbt_test_helper.create_model(
+        "model1",
+        unique_id="model.model1",
+        curr_sql="select 1 as c",
+        base_sql="select 1 as c --- non-breaking",
+        curr_columns={"c": "int"},
+        base_columns={"c": "int"},
+    )
+    dbt_test_helper.create_model(
+        "model2",
+        unique_id="model.model2",
+        curr_sql='select c, 2025 as y from {{ ref("model1") }}',
+        base_sql='select c, 2025 as y from {{ ref("model1") }}',
+        curr_columns={"c": "int", "y": "int"},
+        base_columns={"c": "int", "y": "int"},
+        depends_on=["model.model1"],
+    )
+    dbt_test_helper.create_model(
+        "model3",
+        unique_id="model.model3",
+        curr_sql='select c from {{ ref("model2") }} where y < 2025',
+        base_sql='select c from {{ ref("model2") }} where y < 2025',
+        curr_columns={"c": "int"},
+        base_columns={"c": "int"},
+        depends_on=["model.model2"],
+    )
+    dbt_test_helper.create_model(
+        "model4",
+        unique_id="model.model4",
+        curr_sql='select c from {{ ref("model1") }}',
+        base_sql='select c from {{ ref("model1") }}',
+        curr_columns={"c": "int"},
+        base_columns={"c": "int"},
+        depends_on=["model.model1"],
+    )
+
+    adapter: DbtAdapter = dbt_test_helper.context.adapter
+    first = adapter.build_full_cll_map()
+    assert first.nodes["model.model1"].change_status == "modified"
+
+    # Modify model2 in place, then invalidate the way refresh() does for the current manifest
+    model2 = adapter.curr_manifest.nodes["model.model2"]
+    model2.raw_code = 'select c + 1 as c, 2025 as y from {{ ref("model1") }}'
+    model2.checksum = FileHash(name="sha256", checksum="changed")
+    adapter.get_cll_cached.cache_clear()
+    adapter.get_change_analysis_cached.cache_clear()
+    adapter._full_cll_map = None
+
+    cache = get_cll_cache()
+    requested = []
+    get_nodes = cache.get_nodes
+
+    def spy_get_nodes(entries):
+        entries = list(entries)
+        requested.extend(node_id for node_id, _ in entries)
+        return get_nodes(entries)
+
+    with patch.object(cache, "get_nodes", spy_get_nodes):
+        incremental = adapter.build_full_cll_map()
+    assert set(requested) == {"model.model2", "model.model3"}
+
+    assert incremental.nodes["model.model1"].change_status == "modified"
+    assert incremental.nodes["model.model1"] is not first.nodes["model.model1"]
+    assert incremental.columns["model.model2_c"].transformation_type == "derived"
+    assert first.columns["model.model2_c"].transformation_type == "passthrough"
+
+    # Same result as a build from scratch
+    adapter._full_cll_map = None
+    adapter._full_cll_parts = {}
+    scratch = adapter.build_full_cll_map()
+    assert incremental.model_dump() == scratch.model_dump()
+
+
+def test_get_cll_column_index_matches_slice(dbt_test_helper):
+    """Column queries served from the full-map index match filtering the node-level slice."""
+    dbt_test_helper.create_model(
+        "model1",
+        unique_id="model.model1",
+        curr_sql="select 1 as c, 2 as d",
+        base_sql="select 1 as c",
+        curr_columns={"c": "int", "d": "int"},
+        base_columns={"c": "int"},
+    )
+    dbt_test_helper.create_model(
+        "model2",
+        unique_id="model.model2",
+        curr_sql='select c, d + 1 as e from {{ ref("model1") }} where d > 0',
+        base_sql='select c, 1 as e from {{ ref("model1") }}',
+        curr_columns={"c": "int", "e": "int"},
+        base_columns={"c": "int", "e": "int"},
+        depends_on=["model.model1"],
+    )
+    dbt_test_helper.create_model(
+        "model3",
+        unique_id="model.model3",
+        curr_sql='select c, e from {{ ref("model2") }}',
+        base_sql='select c, e from {{ ref("model2") }}',
+        curr_columns={"c": "int", "e": "int"},
+        base_columns={"c": "int", "e": "int"},
+        depends_on=["model.model2"],
+    )
+    dbt_test_helper.create_model(
+        "model4",
+        unique_id="model.model4",
+        curr_sql='select d from {{ ref("model1") }}',
+        base_sql='select d from {{ ref("model1") }}',
+        curr_columns={"d": "int"},
+        base_columns={"d": "int"},
+        depends_on=["model.model1"],
+    )
+    adapter: DbtAdapter = dbt_test_helper.context.adapter
+
+    for node_id, column in [
+        ("model.model1", "c"),
+        ("model.model1", "d"),
+        ("model.model2", "e"),
+        ("model.model3", "e"),
+        ("model.model4", "d"),
+    ]:
+        for change_analysis in [False, True]:
+            for no_upstream, no_downstream in [(False, False), (True, False), (False, True)]:
+                kwargs = dict(
+                    node_id=node_id,
+                    column=column,
+                    change_analysis=change_analysis,
+                    no_upstream=no_upstream,
+                    no_downstream=no_downstream,
+                )
+                result = adapter.get_cll(**kwargs)
+
+                # What get_cll's generic filter step does with the unfiltered slice
+                sliced = adapter.get_cll(**kwargs, no_filter=True)
+                anchor = f"{node_id}_{column}"
+                ids = {anchor}
+                if not no_upstream:
+                    ids |= find_upstream([anchor], sliced.parent_map)
+                if not no_downstream:
+                    ids |= find_downstream([anchor], sliced.child_map)
+                parent_map, child_map = filter_dependency_maps(sliced.parent_map, sliced.child_map, ids)
+
+                assert set(result.nodes) == {k for k in sliced.nodes if k in ids}
+                assert set(result.columns) == {k for k in sliced.columns if k in ids}
+                for k, col in result.columns.items():
+                    assert col.model_dump() == sliced.columns[k].model_dump()
+                assert result.parent_map == parent_map
+                assert {k: v for k, v in result.child_map.items() if v} == {k: v for k, v in child_map.items() if v}
+
+
+def test_get_cll_does_not_mutate_full_map(dbt_test_helper):
+    """Slicing the full map masks change fields and filters columns without touching the shared map."""
+    dbt_test_helper.create_model(
+        "model1",
+        unique_id="model.model1",
+        curr_sql="select 1 as c, 2 as d",
+        base_sql="select 1 as c",
+        curr_columns={"c": "int", "d": "int"},
+        base_columns={"c": "int"},
+    )
+    dbt_test_helper.create_model(
+        "model2",
+        unique_id="model.model2",
+        curr_sql='select c from {{ ref("model1") }}',
+        base_sql='select c from {{ ref("model1") }}',
+        curr_columns={"c": "int"},
+        base_columns={"c": "int"},
+        depends_on=["model.model1"],
+    )
+
+    adapter: DbtAdapter = dbt_test_helper.context.adapter
+    full_map = adapter.build_full_cll_map()
+    assert full_map.nodes["model.model1"].change_status == "modified"
+    assert full_map.columns["model.model1_d"].change_status == "added"
+
+    result = adapter.get_cll(node_id="model.model2", change_analysis=False)
+    assert set(result.nodes["model.model1"].columns) == {"c"}
+    assert result.nodes["model.model1"].change_status is None
+    assert all(c.change_status is None for c in result.columns.values())
+
+    result = adapter.get_cll(node_id="model.model1", change_analysis=False, no_filter=True)
+    assert result.columns["model.model1_d"].change_status is None
+    assert result.nodes["model.model1"].columns["d"].change_status is None
+
+    # The shared full map is unchanged
+    assert adapter.build_full_cll_map() is full_map
+    assert full_map.nodes["model.model1"].change_status == "modified"
+    assert set(full_map.nodes["model.model1"].columns) == {"c", "d"}
+    assert full_map.columns["model.model1_d"].change_status == "added"
+
+    result = adapter.get_cll(node_id="model.model1", change_analysis=True)
+    assert result.nodes["model.model1"].change_status == "modified"
+    assert result.columns["model.model1_d"].change_status == "added"
+
+
 def test_get_cll_uses_full_map_for_unchanged_model(dbt_test_helper, disable_cll_cache):
     """get_cll should return data for unchanged models (served from full map)."""
     # model1 is changed
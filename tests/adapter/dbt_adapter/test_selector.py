@@ -203,3 +203,27 @@ def test_select_with_pacakage_mode_include_exclude(dbt_test_helper):
     assert len(node_ids) == 4
     node_ids = adapter.select_nodes(select="+customers_5")
     assert len(node_ids) == 4
+
+
+def test_select_reuses_compiled_graph(dbt_test_helper):
+    csv_data_curr = """
+        customer_id,name,age
+        1,Alice,30
+        """
+
+    csv_data_base = """
+        customer_id,name,age
+        1,Alice,35
+        """
+
+    dbt_test_helper.create_model("customers_1", csv_data_base, csv_data_curr)
+    adapter: DbtAdapter = dbt_test_helper.context.adapter
+
+    manifest, graph = adapter._get_selection_graph()
+    assert len(adapter.select_nodes("state:modified")) == 1
+    assert adapter._get_selection_graph() == (manifest, graph)
+
+    # Mutating the manifests in place changes the checksum and rebuilds the graph
+    dbt_test_helper.create_model("customers_2", csv_data_base, csv_data_base, depends_on=["customers_1"])
+    assert adapter._get_selection_graph()[1] is not graph
+    assert len(adapter.select_nodes("state:modified+")) == 2
@@ -269,6 +269,27 @@ class TestSubmitRunParamsPropagation:
         if warning is not None:
             assert any(warning in message for message in logs.output)
 
+    @pytest.mark.asyncio
+    async def test_run_cache_key_error_does_not_fail_run(self, mock_context, mock_task_class):
+        """A failure while building the result cache key runs the task without the cache."""
+        from recce.apis.run_func import submit_run
+        from recce.models.types import RunStatus
+
+        params = {"model": "customers", "primary_key": ["customer_id"]}
+        with (
+            patch("recce.apis.run_func.create_task") as mock_create_task,
+            patch("recce.apis.run_func._run_cache_key", side_effect=RuntimeError("relation not found")),
+            patch("recce.apis.run_func.get_run_result_cache") as mock_get_cache,
+        ):
+            mock_create_task.return_value = mock_task_class(params)
+
+            run, future = submit_run(type="value_diff", params=params.copy())
+            await asyncio.wrap_future(future)
+
+        assert run.status == RunStatus.FINISHED
+        assert run.result == {"diff": {"columns": [], "data": []}}
+        mock_get_cache.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_triggered_by_propagates_to_run(self, mock_context, mock_task_class):
         """Test that triggered_by parameter is set on the created Run object."""
@@ -1,3 +1,5 @@
+import io
+import json
 import unittest
 from unittest.mock import Mock, patch
 
@@ -9,6 +11,17 @@ from recce.state.const import (
 )
 
 
+def _artifact_response(url, **kwargs):
+    """A streamed 200 response for a mocked artifact URL, e.g. 'base_manifest_data' for http://base_manifest.url"""
+    name = url.split("//", 1)[1].split(".", 1)[0]
+    if not name.startswith("base_"):
+        name = f"current_{name}"
+    response = Mock()
+    response.status_code = 200
+    response.raw = io.BytesIO(json.dumps(f"{name}_data").encode())
+    return response
+
+
 class TestCloudStateLoader(unittest.TestCase):
 
     def test_init_with_defaults(self):
@@ -91,7 +104,7 @@ class TestCloudStateLoader(unittest.TestCase):
         self.assertFalse(loader.verify())
         self.assertEqual(loader.error_message, "No share ID is provided for the preview catalog.")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_load_state_from_github_success(self, mock_get):
         # Setup
         mock_pr_info = Mock()
@@ -111,7 +124,7 @@ class TestCloudStateLoader(unittest.TestCase):
         # Mock HTTP response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.content = b'{"runs": [], "checks": []}'
+        mock_response.raw = io.BytesIO(b'{"runs": [], "checks": []}')
         mock_get.return_value = mock_response
 
         # Mock RecceState.from_file
@@ -126,7 +139,7 @@ class TestCloudStateLoader(unittest.TestCase):
             mock_get.assert_called_once()
             loader.recce_cloud.get_presigned_url_by_github_repo.assert_called_once()
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_load_state_from_preview_success(self, mock_get):
         # Setup
         loader = CloudStateLoader(cloud_options={"api_token": "token", "share_id": "test_share"})
@@ -140,7 +153,7 @@ class TestCloudStateLoader(unittest.TestCase):
         # Mock HTTP response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.content = b'{"runs": [], "checks": []}'
+        mock_response.raw = io.BytesIO(b'{"runs": [], "checks": []}')
         mock_get.return_value = mock_response
 
         # Mock RecceState.from_file
@@ -154,7 +167,7 @@ class TestCloudStateLoader(unittest.TestCase):
             self.assertIsNone(result_etag)  # Preview doesn't use etag
             loader.recce_cloud.get_presigned_url_by_share_id.assert_called_once()
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_load_state_from_preview_404_error(self, mock_get):
         # Setup
         loader = CloudStateLoader(cloud_options={"api_token": "token", "share_id": "test_share"})
@@ -176,7 +189,7 @@ class TestCloudStateLoader(unittest.TestCase):
         self.assertIsNone(result_etag)
         self.assertEqual(loader.error_message, "The state file is not found in Recce Cloud.")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_load_state_from_preview_auth_error(self, mock_get):
         # Setup
         loader = CloudStateLoader(cloud_options={"api_token": "token", "share_id": "test_share"})
@@ -199,7 +212,7 @@ class TestCloudStateLoader(unittest.TestCase):
         self.assertIn("401 Failed to download", str(cm.exception))
 
     @patch("recce.state.cloud.CheckDAO")
-    @patch("requests.put")
+    @patch("requests.Session.put")
     def test_export_state_to_github_success(self, mock_put, mock_check_dao):
         # Setup
         mock_pr_info = Mock()
@@ -234,7 +247,7 @@ class TestCloudStateLoader(unittest.TestCase):
         mock_put.assert_called_once()
         loader.recce_cloud.get_presigned_url_by_github_repo.assert_called_once()
 
-    @patch("requests.put")
+    @patch("requests.Session.put")
     def test_export_state_to_preview_success(self, mock_put):
         # Setup
         loader = CloudStateLoader(cloud_options={"api_token": "token", "share_id": "test_share"})
@@ -257,7 +270,7 @@ class TestCloudStateLoader(unittest.TestCase):
         self.assertIsNone(result_etag)  # Preview doesn't use etag
         loader.recce_cloud.get_presigned_url_by_share_id.assert_called_once()
 
-    @patch("requests.put")
+    @patch("requests.Session.put")
     def test_export_state_to_preview_failure(self, mock_put):
         # Setup
         loader = CloudStateLoader(cloud_options={"api_token": "token", "share_id": "test_share"})
@@ -391,7 +404,7 @@ class TestCloudStateLoader(unittest.TestCase):
         self.assertFalse(loader.verify())
         self.assertEqual(loader.error_message, "No session ID is provided for the session catalog.")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_load_state_from_session_success_with_existing_state(self, mock_get):
         # Setup
         loader = CloudStateLoader(cloud_options={"api_token": "token", "session_id": "test_session"})
@@ -417,27 +430,17 @@ class TestCloudStateLoader(unittest.TestCase):
         mock_base_urls = {"manifest_url": "http://base_manifest.url", "catalog_url": "http://base_catalog.url"}
         loader.recce_cloud.get_base_session_download_urls.return_value = mock_base_urls
 
-        # Mock HTTP responses for artifacts
-        mock_response_200 = Mock()
-        mock_response_200.status_code = 200
-        mock_response_200.json.side_effect = [
-            "current_manifest_data",  # current manifest
-            "current_catalog_data",  # current catalog
-            "base_manifest_data",  # base manifest
-            "base_catalog_data",  # base catalog
-        ]
-
         # Mock HTTP response for recce_state
         mock_state_response = Mock()
         mock_state_response.status_code = 200
-        mock_state_response.content = b'{"runs": [{"id": "test"}], "checks": [{"id": "test"}]}'
+        mock_state_response.raw = io.BytesIO(b'{"runs": [{"id": "test"}], "checks": [{"id": "test"}]}')
 
         # Set up the mock_get to return different responses for different URLs
         def side_effect(url, **kwargs):
             if "recce_state" in url:
                 return mock_state_response
             else:
-                return mock_response_200
+                return _artifact_response(url)
 
         mock_get.side_effect = side_effect
 
@@ -461,7 +464,7 @@ class TestCloudStateLoader(unittest.TestCase):
                 result_state.artifacts.base, {"manifest": "base_manifest_data", "catalog": "base_catalog_data"}
             )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_load_state_from_session_no_existing_state(self, mock_get):
         # Setup
         loader = CloudStateLoader(cloud_options={"api_token": "token", "session_id": "test_session"})
@@ -483,16 +486,8 @@ class TestCloudStateLoader(unittest.TestCase):
         mock_base_urls = {"manifest_url": "http://base_manifest.url", "catalog_url": "http://base_catalog.url"}
         loader.recce_cloud.get_base_session_download_urls.return_value = mock_base_urls
 
-        # Mock HTTP responses for artifacts
-        mock_response_200 = Mock()
-        mock_response_200.status_code = 200
-        mock_response_200.json.side_effect = [
-            "current_manifest_data",
-            "current_catalog_data",
-            "base_manifest_data",
-            "base_catalog_data",
-        ]
-        mock_get.return_value = mock_response_200
+        # Mock HTTP responses for artifacts; base and current are downloaded concurrently
+        mock_get.side_effect = _artifact_response
 
         # Mock RecceState constructor for empty state
         with patch("recce.state.cloud.RecceState") as mock_recce_state_class:
@@ -545,7 +540,7 @@ class TestCloudStateLoader(unittest.TestCase):
 
         self.assertEqual(str(cm.exception), "Session test_session does not belong to a valid organization or project.")
 
-    @patch("requests.put")
+    @patch("requests.Session.put")
     def test_export_state_to_session_success(self, mock_put):
         # Setup
         loader = CloudStateLoader(cloud_options={"api_token": "token", "session_id": "test_session"})
@@ -630,7 +625,7 @@ class TestCloudStateLoader(unittest.TestCase):
 
         self.assertEqual(str(cm.exception), "No recce_state_url found for session test_session")
 
-    @patch("requests.put")
+    @patch("requests.Session.put")
     def test_export_state_to_session_upload_failure(self, mock_put):
         # Setup
         loader = CloudStateLoader(cloud_options={"api_token": "token", "session_id": "test_session"})
@@ -708,7 +703,7 @@ class TestCloudStateLoader(unittest.TestCase):
             loader.recce_cloud, "org1", "proj1", session_id="test_session"
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_download_base_session_artifacts_passes_session_id(self, mock_get):
         """Verify _download_base_session_artifacts passes session_id to get_base_session_download_urls."""
         loader = CloudStateLoader(cloud_options={"api_token": "token", "session_id": "test_session"})
@@ -720,16 +715,13 @@ class TestCloudStateLoader(unittest.TestCase):
             "catalog_url": "http://base_catalog.url",
         }
 
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.side_effect = ["base_manifest_data", "base_catalog_data"]
-        mock_get.return_value = mock_response
+        mock_get.side_effect = _artifact_response
 
         loader._download_base_session_artifacts(mock_cloud, "org1", "proj1", session_id="test_session")
 
         mock_cloud.get_base_session_download_urls.assert_called_once_with("org1", "proj1", session_id="test_session")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_download_base_session_artifacts_without_session_id(self, mock_get):
         """Verify _download_base_session_artifacts works without session_id (backward compat)."""
         loader = CloudStateLoader(cloud_options={"api_token": "token", "session_id": "test_session"})
@@ -741,10 +733,7 @@ class TestCloudStateLoader(unittest.TestCase):
             "catalog_url": "http://base_catalog.url",
         }
 
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.side_effect = ["base_manifest_data", "base_catalog_data"]
-        mock_get.return_value = mock_response
+        mock_get.side_effect = _artifact_response
 
         loader._download_base_session_artifacts(mock_cloud, "org1", "proj1")
 
@@ -846,7 +835,7 @@ class TestS3HeaderHelpers(unittest.TestCase):
 class TestUploadIncludesMetaHeaders(unittest.TestCase):
 
     @patch("recce.state.cloud.CheckDAO")
-    @patch("requests.put")
+    @patch("requests.Session.put")
     def test_export_state_to_github_sends_meta_headers(self, mock_put, mock_check_dao):
         """Verify _upload_state_to_url includes x-amz-meta-* headers when metadata is provided."""
         mock_pr_info = Mock()
@@ -1042,7 +1031,7 @@ class TestRecceCloudStateManagerUploadFiltersHeaders(unittest.TestCase):
 class TestUploadDbtArtifactsFiltersHeaders(unittest.TestCase):
     """Verify upload_dbt_artifacts applies filter_headers_for_presigned_url."""
 
-    @patch("recce.artifact.requests.put")
+    @patch("requests.Session.put")
     @patch("recce.artifact.RecceCloud")
     @patch("recce.artifact.commit_hash_from_branch", return_value="abc123")
     @patch("recce.artifact.hosting_repo", return_value="owner/repo")
@@ -0,0 +1,146 @@
+import json
+import os
+import stat
+import tempfile
+import unittest
+import zipfile
+from unittest.mock import patch
+
+from recce.models import Check, Run, RunType
+from recce.state import (
+    ArtifactsRoot,
+    FileStateLoader,
+    RecceState,
+    StateContainer,
+    is_state_container,
+    write_state_container,
+)
+from recce.state.container import _dump_section
+
+
+class TestStateContainer(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "state.recce")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _make_state(self) -> RecceState:
+        run = Run(type=RunType.QUERY, params=dict(sql_template="select 1"))
+        check = Check(name="check 1", description="desc", type=run.type, params=run.params)
+        manifest = {"metadata": {"generated_at": "2024-01-01T00:00:00Z"}, "nodes": {"model.a": {"name": "a"}}}
+        return RecceState(
+            runs=[run],
+            checks=[check],
+            artifacts=ArtifactsRoot(
+                base={"manifest": manifest, "catalog": None},
+                current={"manifest": json.loads(json.dumps(manifest)), "catalog": {"nodes": {}}},
+            ),
+        )
+
+    def test_round_trip(self):
+        state = self._make_state()
+        write_state_container(self.path, state)
+
+        self.assertTrue(is_state_container(self.path))
+        loaded = RecceState.from_file(self.path)
+        self.assertEqual(loaded.runs[0].run_id, state.runs[0].run_id)
+        self.assertEqual(loaded.checks[0].check_id, state.checks[0].check_id)
+        self.assertEqual(loaded.artifacts.base.get("manifest"), state.artifacts.base["manifest"])
+        self.assertIsNone(loaded.artifacts.base.get("catalog"))
+        self.assertEqual(json.loads(loaded.to_json()), json.loads(state.to_json()))
+
+    def test_identical_artifacts_are_stored_once(self):
+        write_state_container(self.path, self._make_state())
+
+        container = StateContainer(self.path)
+        sections = container.sections
+        self.assertEqual(sections["artifacts/base/manifest"], sections["artifacts/current/manifest"])
+        with zipfile.ZipFile(self.path) as zf:
+            objects = [name for name in zf.namelist() if name.startswith("objects/")]
+        # runs, checks, one manifest, current catalog
+        self.assertEqual(len(objects), 4)
+
+    def test_artifacts_are_loaded_lazily(self):
+        write_state_container(self.path, self._make_state())
+        state = RecceState.from_file(self.path)
+
+        with patch.object(StateContainer, "read_section", wraps=state.artifacts.base._container.read_section) as read:
+            self.assertEqual(sorted(state.artifacts.current), ["catalog", "manifest"])
+            read.assert_not_called()
+            state.artifacts.current["catalog"]
+            read.assert_called_once_with("artifacts/current/catalog")
+
+    def test_lazy_sections_convert_to_loaded_dicts(self):
+        state = self._make_state()
+        write_state_container(self.path, state)
+        loaded = RecceState.from_file(self.path)
+
+        expected = state.artifacts.current
+        self.assertEqual(dict(loaded.artifacts.current), expected)
+        self.assertEqual({**RecceState.from_file(self.path).artifacts.current}, expected)
+        self.assertEqual(
+            json.loads(json.dumps(dict(RecceState.from_file(self.path).artifacts.base))),
+            {
+                "manifest": state.artifacts.base["manifest"],
+                "catalog": None,
+            },
+        )
+
+    def test_save_rewrites_only_changed_sections(self):
+        loader = FileStateLoader(state_file=self.path, initial_state=self._make_state())
+        loader.export()
+        self.assertIsNotNone(loader.state_container)
+
+        # Same artifact objects and a new check: only the checks section is serialized again
+        loader.state.checks.append(Check(name="check 2", description="", type=RunType.QUERY))
+        with patch("recce.state.container._dump_section", wraps=_dump_section) as dump:
+            loader.export()
+        self.assertEqual(dump.call_count, 2)  # runs and checks
+
+        loaded = FileStateLoader(state_file=self.path).load()
+        self.assertEqual(len(loaded.checks), 2)
+
+        # The loader keeps the container it loaded from. Saving through a context is covered
+        # by test_state_container_save_copies_imported_artifacts in tests/test_core.py
+        loader = FileStateLoader(state_file=self.path)
+        loader.load()
+        self.assertEqual(loader.state_container.path, self.path)
+
+        # A loaded state saves its undecoded artifacts without decoding them
+        loader = FileStateLoader(state_file=self.path)
+        loader.load()
+        with patch.object(StateContainer, "read_section") as read:
+            loader.export()
+        read.assert_not_called()
+        self.assertEqual(
+            RecceState.from_file(self.path).artifacts.current["catalog"],
+            {"nodes": {}},
+        )
+
+    def test_file_mode(self):
+        umask = os.umask(0o022)
+        try:
+            write_state_container(self.path, self._make_state())
+            self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o644)
+
+            # A save keeps the mode of the file it replaces
+            os.chmod(self.path, 0o640)
+            write_state_container(self.path, self._make_state())
+            self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o640)
+        finally:
+            os.umask(umask)
+
+    def test_json_state_file_is_unchanged(self):
+        json_path = os.path.join(self.temp_dir.name, "state.json")
+        loader = FileStateLoader(state_file=json_path, initial_state=self._make_state())
+        loader.export()
+
+        self.assertFalse(is_state_container(json_path))
+        with open(json_path) as f:
+            self.assertEqual(len(json.load(f)["runs"]), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,7 +3,10 @@ from jinja2 import Template
 from sqlglot import parse_one
 
 from recce.tasks import ProfileDiffTask, ProfileTask
-from recce.tasks.profile import PROFILE_COLUMN_JINJA_TEMPLATE
+from recce.tasks.profile import (
+    PROFILE_COLUMN_JINJA_TEMPLATE,
+    PROFILE_COLUMNS_JINJA_TEMPLATE,
+)
 
 csv_data_curr = """
         customer_id,name,age
@@ -99,6 +102,46 @@ def test_profile_diff_both_empty(dbt_test_helper):
     assert len(run_result.current.data) == 3
 
 
+def test_profile_diff_batched_matches_per_column(dbt_test_helper):
+    dbt_test_helper.create_model("customers", csv_data_base, csv_data_curr)
+    batched = ProfileDiffTask(dict(model="customers")).execute()
+    per_column = ProfileDiffTask(dict(model="customers", column_batch_size=1)).execute()
+
+    assert batched.base.data == per_column.base.data
+    assert batched.current.data == per_column.current.data
+    assert [c.name for c in batched.current.columns] == [c.name for c in per_column.current.columns]
+
+
+def test_profile_diff_batch_chunks_and_fallback(dbt_test_helper):
+    dbt_test_helper.create_model("customers", csv_data_base, csv_data_curr)
+    task = ProfileDiffTask(dict(model="customers", column_batch_size=2))
+
+    batch_calls = []
+    single_calls = []
+    original_batch = task._profile_column_batch
+    original_single = task._profile_column
+
+    def profile_column_batch(dbt_adapter, relation, columns):
+        batch_calls.append([c.name for c in columns])
+        if "name" in [c.name for c in columns]:
+            raise Exception("aggregate failed")
+        return original_batch(dbt_adapter, relation, columns)
+
+    def profile_column(dbt_adapter, relation, column):
+        single_calls.append(column.name)
+        return original_single(dbt_adapter, relation, column)
+
+    task._profile_column_batch = profile_column_batch
+    task._profile_column = profile_column
+    run_result = task.execute()
+
+    assert len(run_result.base.data) == 3
+    assert len(run_result.current.data) == 3
+    # Chunks of two columns; the failing chunk is split and retried per column.
+    assert batch_calls == [["customer_id", "name"], ["customer_id", "name"]]
+    assert single_calls == ["customer_id", "name", "age", "customer_id", "name", "age"]
+
+
 def test_validator():
     from recce.tasks.profile import ProfileCheckValidator
 
@@ -516,3 +559,14 @@ def test_profile_column_jinja_template():
             sql = Template(PROFILE_COLUMN_JINJA_TEMPLATE).render(context)
             dialect = db_type if db_type != "sqlserver" else "tsql"
             parse_one(sql, read=dialect)
+
+        context = {
+            "columns": [dict(name=f"profile_column_{i}", type=t) for i, t in enumerate(column_types)],
+            "db_type": db_type,
+            "relation": "test_table",
+            "adapter": DummyAdapter(),
+            "dbt": DummyDbt(),
+        }
+        sql = Template(PROFILE_COLUMNS_JINJA_TEMPLATE).render(context)
+        dialect = db_type if db_type != "sqlserver" else "tsql"
+        parse_one(sql, read=dialect)
@@ -310,6 +310,107 @@ def test_row_count_task(dbt_test_helper):
     assert run_result["customers"]["curr_meta"]["status"] == RowCountStatus.OK
 
 
+def test_row_count_diff_concurrent(dbt_test_helper):
+    """threads > 1 queries on several named connections and returns the same result as the sequential path."""
+    for i in range(5):
+        base = "customer_id\n" + "".join(f"{n}\n" for n in range(i))
+        curr = "customer_id\n" + "".join(f"{n}\n" for n in range(i + 1))
+        dbt_test_helper.create_model(f"model_{i}", base, curr, unique_id=f"model.model_{i}")
+    node_names = [f"model_{i}" for i in range(5)] + ["missing"]
+
+    sequential = RowCountDiffTask(dict(node_names=node_names)).execute()
+
+    task = RowCountDiffTask(dict(node_names=node_names, threads=3))
+    progress = []
+    task.progress_listener = lambda message=None, percentage=None: progress.append(percentage)
+    concurrent = task.execute()
+
+    assert concurrent == sequential
+    assert concurrent["model_4"]["base"] == 4
+    assert concurrent["model_4"]["curr"] == 5
+    assert concurrent["missing"]["base_meta"]["status"] == RowCountStatus.NOT_IN_MANIFEST
+    assert len(task.connections) == 3
+    assert progress[-1] == 1
+
+    task = RowCountTask(dict(node_names=node_names, threads=2))
+    run_result = task.execute()
+    assert {name: r["curr"] for name, r in run_result.items()} == {name: r["curr"] for name, r in sequential.items()}
+
+
+def test_row_count_diff_concurrent_cancel(dbt_test_helper):
+    from recce.exceptions import RecceCancelException
+
+    for i in range(4):
+        dbt_test_helper.create_model(f"model_{i}", "id\n1\n", "id\n1\n", unique_id=f"model.model_{i}")
+
+    task = RowCountDiffTask(dict(node_names=[f"model_{i}" for i in range(4)], threads=2))
+
+    def cancel_on_first_progress(message=None, percentage=None):
+        if percentage:
+            task.cancel()
+
+    task.progress_listener = cancel_on_first_progress
+    with pytest.raises(RecceCancelException):
+        task.execute()
+
+
+def test_row_count_diff_metadata_strategy(dbt_test_helper):
+    """The metadata strategy reads DuckDB table stats and falls back to count(*) for views."""
+    dbt_test_helper.create_model("customers", "id\n1\n2\n", "id\n1\n2\n3\n", unique_id="model.customers")
+
+    def as_view(node_dict):
+        node_dict["config"]["materialized"] = "view"
+
+    dbt_test_helper.create_model(
+        "customers_view", base_sql="select 1", curr_sql="select 1", unique_id="model.customers_view", patch_func=as_view
+    )
+    adapter = dbt_test_helper.context.adapter
+    with adapter.connection_named("create view"):
+        for schema in [dbt_test_helper.base_schema, dbt_test_helper.curr_schema]:
+            adapter.execute(f"CREATE VIEW {schema}.customers_view AS SELECT * FROM {schema}.customers")
+
+    task = RowCountDiffTask(dict(node_names=["customers", "customers_view", "missing"], strategy="metadata"))
+    run_result = task.execute()
+
+    assert run_result["customers"]["base"] == 2
+    assert run_result["customers"]["curr"] == 3
+    assert run_result["customers"]["base_meta"]["exact"] is False
+    assert run_result["customers"]["curr_meta"]["exact"] is False
+    assert run_result["customers_view"]["base"] == 2
+    assert run_result["customers_view"]["curr"] == 3
+    assert run_result["customers_view"]["curr_meta"]["exact"] is True
+    assert run_result["missing"]["curr_meta"]["status"] == RowCountStatus.NOT_IN_MANIFEST
+    # The statistics lookup and the count(*) fallback both register their connection for cancel()
+    assert len(task.connections) == 2
+
+    task = RowCountTask(dict(node_names=["customers"], strategy="metadata", threads=2))
+    assert task.execute()["customers"]["curr"] == 3
+
+
+def test_row_count_diff_result_differ_estimated_counts():
+    """Estimated counts never hide a change; the result keeps meta.exact to label them approximate."""
+    from unittest.mock import MagicMock
+
+    def differ_for(base, curr, exact):
+        mock_run = MagicMock()
+        mock_run.params = {"node_names": ["model_a"]}
+        mock_run.result = {
+            "model_a": {
+                "base": base,
+                "curr": curr,
+                "base_meta": {"status": RowCountStatus.OK, "exact": exact},
+                "curr_meta": {"status": RowCountStatus.OK, "exact": True},
+            }
+        }
+        return RowCountDiffResultDiffer(mock_run)
+
+    differ = differ_for(100000, 99100, exact=False)
+    assert differ.changes is not None
+    assert differ.run.result["model_a"]["base_meta"]["exact"] is False
+    assert differ_for(100000, 100500, exact=True).changes is not None
+    assert differ_for(100000, 100000, exact=False).changes is None
+
+
 def test_query_row_count_unsupported_resource_type():
     """Test _query_row_count result format for unsupported resource type (e.g., source)."""
     # Create a mock result for unsupported resource type
@@ -440,3 +541,63 @@ def test_split_row_count_result():
     assert meta["status"] == RowCountStatus.TABLE_NOT_FOUND
     assert meta["message"] == "Table not found"
     assert "count" not in meta  # count must be stripped from meta
+
+
+def test_row_count_diff_result_cache(dbt_test_helper, tmp_path):
+    import asyncio
+    from unittest.mock import patch
+
+    from recce.apis.run_func import submit_run
+    from recce.tasks import rowcount
+    from recce.util.run_cache import (
+        RunResultCache,
+        get_run_result_cache,
+        set_run_result_cache,
+    )
+
+    csv_data_base = """
+        customer_id,name,age
+        1,Alice,35
+        2,Bob,25
+        """
+    csv_data_curr = """
+        customer_id,name,age
+        1,Alice,30
+        2,Bob,25
+        3,Charlie,35
+        """
+    dbt_test_helper.create_model("customers", csv_data_base, csv_data_curr, unique_id="model.customers")
+
+    async def run_row_count_diff():
+        run, future = submit_run("row_count_diff", params={"node_names": ["customers"]})
+        await future
+        return run
+
+    original_cache = get_run_result_cache()
+    set_run_result_cache(RunResultCache(db_path=str(tmp_path / "run_cache.db")))
+    try:
+        run = asyncio.run(run_row_count_diff())
+        assert run.result["customers"]["base"] == 2
+        assert run.result["customers"]["curr"] == 3
+
+        # Nothing changed: served from the cache without querying the warehouse
+        with patch.object(rowcount, "_query_row_counts") as mock_query:
+            cached_run = asyncio.run(run_row_count_diff())
+        mock_query.assert_not_called()
+        assert cached_run.status == run.status
+        assert cached_run.result["customers"]["base"] == 2
+        assert cached_run.result["customers"]["curr"] == 3
+
+        # A changed model gets a new fingerprint
+        dbt_test_helper.context.adapter.curr_manifest.nodes["model.customers"].checksum.checksum = "changed"
+        with patch.object(rowcount, "_query_row_counts", wraps=rowcount._query_row_counts) as mock_query:
+            asyncio.run(run_row_count_diff())
+        mock_query.assert_called_once()
+
+        # Bypass re-executes the run
+        get_run_result_cache().bypass = True
+        with patch.object(rowcount, "_query_row_counts", wraps=rowcount._query_row_counts) as mock_query:
+            asyncio.run(run_row_count_diff())
+        mock_query.assert_called_once()
+    finally:
+        set_run_result_cache(original_cache)
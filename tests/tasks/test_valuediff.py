@@ -319,6 +319,51 @@ def test_value_diff_with_nulls(dbt_test_helper):
     assert len(run_result.data) >= 2
 
 
+@pytest.mark.parametrize("primary_key", [["customer_id"], ["customer_id", "name"]])
+def test_value_diff_batched_matches_per_column(dbt_test_helper, primary_key):
+    """The one-join, multi-column query must produce the same result as one join per column."""
+    csv_data_base = """
+        customer_id,name,age,city
+        1,Alice,30,NYC
+        2,Bob,,LA
+        3,Charlie,35,
+        4,Dave,40,SF
+        """
+
+    csv_data_curr = """
+        customer_id,name,age,city
+        1,Alice,31,NYC
+        2,Bob,25,LA
+        3,Charlie,35,
+        5,Eve,22,NYC
+        """
+
+    dbt_test_helper.create_model("customers_batched", csv_data_base, csv_data_curr)
+
+    captured_sqls = []
+    real_execute = dbt_test_helper.adapter.execute
+
+    def capture_execute(sql, *args, **kwargs):
+        captured_sqls.append(sql)
+        return real_execute(sql, *args, **kwargs)
+
+    results = {}
+    for batch_size in [1, 2, 100]:
+        captured_sqls.clear()
+        params = {"model": "customers_batched", "primary_key": primary_key, "column_batch_size": batch_size}
+        with patch.object(dbt_test_helper.adapter, "execute", side_effect=capture_execute):
+            results[batch_size] = ValueDiffTask(params).execute()
+        joins = [sql for sql in captured_sqls if "full outer join" in sql]
+        assert len(joins) == -(-4 // batch_size)
+
+    for batch_size in [2, 100]:
+        assert results[batch_size].summary == results[1].summary
+        assert results[batch_size].data.data == results[1].data.data
+
+    assert results[1].summary.added == 1
+    assert results[1].summary.removed == 1
+
+
 def test_value_diff_skips_column_named_column_name(dbt_test_helper):
     """Test that a column literally named 'column_name' is skipped without aborting.
 
@@ -335,7 +380,7 @@ def test_value_diff_skips_column_named_column_name(dbt_test_helper):
     csv_data_curr = """
         id,column_name,value
         1,foo,100
-        2,bar,300
+        2,baz,300
         """
 
     dbt_test_helper.create_model("tricky_col", csv_data_base, csv_data_curr)
@@ -349,6 +394,12 @@ def test_value_diff_skips_column_named_column_name(dbt_test_helper):
     assert run_result.summary.added == 0
     assert run_result.summary.removed == 0
 
+    # The batched query applies the same guard, so both paths agree
+    per_column = ValueDiffTask({**params, "column_batch_size": 1}).execute()
+    batched = ValueDiffTask({**params, "column_batch_size": 100}).execute()
+    assert batched.summary == per_column.summary
+    assert batched.data.data == per_column.data.data
+
 
 # Note: Empty table tests (test_value_diff_empty_base, test_value_diff_empty_current)
 # are skipped because DuckDB cannot infer column types from empty CSVs (headers only),
@@ -789,3 +840,50 @@ def test_value_diff_detail_snowflake_composite_primary_key(dbt_test_helper):
         "DRC-3464 cycle 1: quoted lowercase '\"order_id\"' found in _verify_primary_key SQL — "
         "ValueDiffDetailTask execute() must normalise composite PK before _verify_primary_key."
     )
+
+
+def test_value_diff_result_cache(dbt_test_helper, tmp_path):
+    import asyncio
+    import json
+
+    from recce.apis.run_func import submit_run
+    from recce.models import Run
+    from recce.util.pydantic_model import pydantic_model_json_dump
+    from recce.util.run_cache import (
+        RunResultCache,
+        get_run_result_cache,
+        set_run_result_cache,
+    )
+
+    csv_data_curr = """
+        customer_id,name,age
+        1,Alice,30
+        2,Bob,25
+        """
+    csv_data_base = """
+        customer_id,name,age
+        1,Alice,35
+        2,Bob,25
+        """
+    dbt_test_helper.create_model("customers", csv_data_base, csv_data_curr)
+
+    async def run_value_diff():
+        run, future = submit_run("value_diff", params={"model": "customers", "primary_key": ["customer_id"]})
+        result = await future
+        return run, result
+
+    original_cache = get_run_result_cache()
+    set_run_result_cache(RunResultCache(db_path=str(tmp_path / "run_cache.db")))
+    try:
+        run, _ = asyncio.run(run_value_diff())
+        with patch.object(ValueDiffTask, "execute") as mock_execute:
+            cached_run, cached_result = asyncio.run(run_value_diff())
+        mock_execute.assert_not_called()
+
+        # Same shape as a run reloaded from a state file
+        expected = Run(type="value_diff", result=json.loads(pydantic_model_json_dump(run.result))).result
+        assert cached_result == expected
+        assert cached_run.result == expected
+        assert cached_run.params["primary_key"] == ["customer_id"]
+    finally:
+        set_run_result_cache(original_cache)
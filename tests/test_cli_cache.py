@@ -1,12 +1,14 @@
 import os
 import sqlite3
 import tempfile
+from functools import partial
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 from click.testing import CliRunner
 
+from recce.adapter.dbt_adapter import DbtAdapter
 from recce.cli import cli
 from recce.util.cll import CllCache
 
@@ -51,6 +53,8 @@ def _make_mock_adapter(nodes: dict, base_manifest=None, curr_catalog=None, base_
     adapter.curr_catalog = curr_catalog
     adapter.base_catalog = base_catalog
     adapter.adapter.type.return_value = "duckdb"
+    # Run the real batch driver so it dispatches to the mocked get_cll_cached
+    adapter.get_cll_batch = partial(DbtAdapter.get_cll_batch, adapter)
     return adapter
 
 
@@ -14,6 +14,7 @@ Covers:
 from __future__ import annotations
 
 import tempfile
+from functools import partial
 from pathlib import Path
 from typing import Optional
 from unittest.mock import MagicMock, patch
@@ -21,6 +22,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 from click.testing import CliRunner
 
+from recce.adapter.dbt_adapter import DbtAdapter
 from recce.cli import cli
 
 # ---------------------------------------------------------------------------
@@ -66,6 +68,8 @@ def _make_mock_adapter(nodes: dict, curr_catalog=None, base_catalog=None):
     adapter.curr_catalog = curr_catalog
     adapter.base_catalog = base_catalog
     adapter.adapter.type.return_value = "duckdb"
+    # `recce init` computes CLL through get_cll_batch, which delegates to the mocked get_cll_cached
+    adapter.get_cll_batch = partial(DbtAdapter.get_cll_batch, adapter)
     return adapter
 
 
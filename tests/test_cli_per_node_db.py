@@ -22,6 +22,7 @@ import random
 import sqlite3
 import tempfile
 import time
+from functools import partial
 from pathlib import Path
 from typing import Optional
 from unittest.mock import MagicMock, patch
@@ -29,6 +30,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 from click.testing import CliRunner
 
+from recce.adapter.dbt_adapter import DbtAdapter
 from recce.cli import cli
 from recce.util.cll import CllCache
 from recce.util.per_node_db import (
@@ -83,6 +85,8 @@ def _make_mock_adapter(nodes: dict, curr_catalog=None, base_catalog=None):
     adapter.curr_catalog = curr_catalog
     adapter.base_catalog = base_catalog
     adapter.adapter.type.return_value = "duckdb"
+    # `recce init` computes CLL through get_cll_batch, which delegates to the mocked get_cll_cached
+    adapter.get_cll_batch = partial(DbtAdapter.get_cll_batch, adapter)
     return adapter
 
 
@@ -275,3 +275,81 @@ def test_get_merged_lineage_cached(dbt_test_helper):
     # 3. Invalidation: clearing the cache yields a freshly-built instance.
     adapter._get_merged_lineage_cached.cache_clear()
     assert adapter.get_merged_lineage() is not merged
+
+
+def test_export_state_metadata(dbt_test_helper):
+    from unittest.mock import patch
+
+    context = dbt_test_helper.context
+    context.state_loader = FileStateLoader()
+    with patch.object(context.adapter, "export_artifacts") as export_artifacts:
+        state = context.export_state_metadata()
+    export_artifacts.assert_not_called()
+    assert state.metadata is not None
+    assert state.runs == [] and state.checks == []
+
+    full = context.export_state()
+    assert full.git == state.git
+    assert full.artifacts.current["manifest"] is not None
+
+
+def test_export_artifacts_memoized(dbt_test_helper):
+    dbt_test_helper.create_model("model1", "select 1 as a", "select 1 as a")
+    adapter = dbt_test_helper.adapter
+
+    artifacts = adapter.export_artifacts()
+    again = adapter.export_artifacts()
+    assert again.current["manifest"] is artifacts.current["manifest"]
+    assert again.base["catalog"] is artifacts.base["catalog"]
+    assert artifacts.current["manifest"] == adapter.curr_manifest.to_dict()
+
+    # Replacing an artifact only re-serializes that one
+    adapter.curr_manifest = adapter.curr_manifest.from_dict(adapter.curr_manifest.to_dict())
+    replaced = adapter.export_artifacts()
+    assert replaced.current["manifest"] is not artifacts.current["manifest"]
+    assert replaced.base["manifest"] is artifacts.base["manifest"]
+
+    adapter._artifact_dicts.clear()
+    assert adapter.export_artifacts().base["manifest"] is not artifacts.base["manifest"]
+
+
+def test_import_pruned_artifacts_exports_original(dbt_test_helper):
+    import json
+
+    with open(os.path.join(current_dir, "manifest.json"), "r") as f:
+        manifest = json.load(f)
+
+    adapter = dbt_test_helper.adapter
+    adapter.prune_artifacts = True
+    artifacts = ArtifactsRoot(base=dict(manifest=manifest), current=dict(manifest=manifest))
+    adapter.import_artifacts(artifacts, merge=False)
+
+    assert len(adapter.curr_manifest.docs) == 0
+    assert len(artifacts.current["manifest"]["docs"]) > 0
+    assert adapter.export_artifacts().current["manifest"] is artifacts.current["manifest"]
+
+
+def test_state_container_save_copies_imported_artifacts(dbt_test_helper):
+    from unittest.mock import patch
+
+    from recce.state.container import _dump_section
+
+    dbt_test_helper.create_model("model1", "select 1 as a", "select 1 as a")
+    context = dbt_test_helper.context
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        state_file = os.path.join(tmp_dir, "state.recce")
+        context.state_loader = FileStateLoader(state_file=state_file)
+        context.state_loader.export(context.export_state())
+
+        # A new review session imports the container into the adapter, then saves it back
+        adapter = context.adapter
+        adapter.base_manifest = adapter.curr_manifest = adapter.base_catalog = adapter.curr_catalog = None
+        context.state_loader = FileStateLoader(state_file=state_file)
+        state = context.state_loader.load()
+        assert all(state.artifacts.current[name] is not None for name in ["manifest", "catalog"])
+        context.import_state(state)
+        with patch("recce.state.container._dump_section", wraps=_dump_section) as dump:
+            context.state_loader.export(context.export_state())
+        assert dump.call_count == 2  # runs and checks; every artifact is copied as is
+
+        assert RecceState.from_file(state_file).artifacts.current["catalog"] == state.artifacts.current["catalog"]
@@ -46,6 +46,43 @@ class TestAdapterLineage(TestCase):
         assert lineage is not None
         assert len(lineage["nodes"]["model.jaffle_shop.orders"]["columns"]) == 9
 
+    def test_lineage_matches_serialized_manifest(self):
+        dbt_adapter = DbtAdapter(curr_manifest=self.manifest, curr_catalog=self.catalog)
+        lineage = dbt_adapter.get_lineage()
+        manifest_dict = self.manifest.to_dict()
+
+        for unique_id, node in lineage["nodes"].items():
+            resource = manifest_dict["nodes"].get(unique_id) or manifest_dict["sources"][unique_id]
+            for key in ["name", "resource_type", "package_name", "config", "checksum", "raw_code", "schema"]:
+                if key in node:
+                    assert node[key] == resource[key], f"{unique_id}.{key}"
+        orders = lineage["nodes"]["model.jaffle_shop.orders"]
+        assert orders["resource_type"] == "model"
+        assert orders["primary_key"] == "order_id"
+        for node_id, parents in lineage["parent_map"].items():
+            assert set(parents) <= set(manifest_dict["parent_map"][node_id])
+
+    def test_name_index_matches_manifest_scan(self):
+        dbt_adapter = DbtAdapter(curr_manifest=self.manifest, base_manifest=self.manifest)
+        index = dbt_adapter._get_name_index(self.manifest)
+        assert dbt_adapter._get_name_index(self.manifest) is index
+
+        for node in self.manifest.nodes.values():
+            first = next(n for n in self.manifest.nodes.values() if n.name == node.name)
+            assert dbt_adapter.find_node_by_name(node.name) is first
+            assert index.find_node(node.name, node.package_name) is first
+        assert index.find_node("orders", "other_package") is None
+        assert dbt_adapter.find_node_by_name("no_such_model") is None
+
+        for source in self.manifest.sources.values():
+            assert index.find_source(source.source_name, source.name) is source
+        assert index.find_source("no_such_source", "orders") is None
+
+        expected = {}
+        for unique_id, node in self.manifest.nodes.items():
+            expected[node.name] = unique_id
+        assert dbt_adapter.build_name_to_unique_id_index() == expected
+
 
 class TestFusionManifestFailLoud(TestCase):
     """A v20 (dbt v2 / Fusion) artifact must fail loud with a Recce-branded message."""
@@ -113,3 +150,46 @@ class TestFusionManifestFailLoud(TestCase):
                     loader(path=path)
             finally:
                 os.unlink(path)
+
+
+class TestLoadArtifactsInProcesses(TestCase):
+    def test_load_artifacts_in_processes(self):
+        from recce.util.startup_perf import (
+            StartupPerfTracker,
+            clear_startup_tracker,
+            set_startup_tracker,
+        )
+
+        tracker = StartupPerfTracker()
+        set_startup_tracker(tracker)
+        try:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                fusion_catalog = os.path.join(tmp_dir, "catalog.json")
+                with open(fusion_catalog, "w") as f:
+                    json.dump(_fusion_artifact("catalog"), f)
+                paths = {
+                    "curr_manifest": os.path.join(current_dir, "manifest.json"),
+                    "curr_catalog": os.path.join(current_dir, "catalog.json"),
+                    "base_catalog": os.path.join(tmp_dir, "missing.json"),
+                }
+                artifacts, manifest, prev_state = DbtAdapter._load_artifacts_in_processes(paths, lambda: "state")
+
+                # A worker failure is retried in-process, which raises the real error
+                with pytest.raises(UnsupportedDbtSchemaError):
+                    DbtAdapter._load_artifacts_in_processes({"base_catalog": fusion_catalog}, lambda: None)
+        finally:
+            clear_startup_tracker()
+
+        expected = load_manifest(path=paths["curr_manifest"])
+        # Not the metadata: dbt fills a missing invocation_started_at with the process start time
+        assert artifacts["curr_manifest"].to_dict()["nodes"] == expected.to_dict()["nodes"]
+        assert (
+            artifacts["curr_catalog"].to_dict()["nodes"] == load_catalog(path=paths["curr_catalog"]).to_dict()["nodes"]
+        )
+        assert artifacts["base_catalog"] is None
+        assert set(manifest.nodes) == set(expected.nodes)
+        assert prev_state == "state"
+        for phase in ["", "_parse", "_construct", "_pickle", "_unpickle"]:
+            assert f"curr_manifest{phase}" in tracker.timings
+        assert "as_manifest" in tracker.timings
+        assert tracker.artifact_sizes["curr_manifest"] == os.path.getsize(paths["curr_manifest"])
@@ -1415,7 +1415,7 @@ class TestRecceMCPServer:
         mock_state = MagicMock()
         mock_state.git = mock_git
         mock_state.pull_request = mock_pr
-        mock_context.export_state.return_value = mock_state
+        mock_context.export_state_metadata.return_value = mock_state
         mock_context.state_loader = MagicMock()  # non-None to trigger the branch
 
         result = await server._tool_get_server_info({})
@@ -1425,13 +1425,13 @@ class TestRecceMCPServer:
 
     @pytest.mark.asyncio
     async def test_tool_get_server_info_state_loader_error(self, mcp_server):
-        """Test get_server_info handles export_state errors gracefully"""
+        """Test get_server_info handles export_state_metadata errors gracefully"""
         server, mock_context = mcp_server
         mock_context.adapter_type = "dbt"
         mock_context.review_mode = False
         mock_context.support_tasks.return_value = {}
         mock_context.state_loader = MagicMock()
-        mock_context.export_state.side_effect = Exception("git error")
+        mock_context.export_state_metadata.side_effect = Exception("git error")
 
         result = await server._tool_get_server_info({})
 
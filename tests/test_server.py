@@ -6,7 +6,7 @@ import pytest
 from fastapi.testclient import TestClient
 
 from recce.core import default_context
-from recce.server import app
+from recce.server import _cll_payloads, _lineage_payloads, app
 
 # noinspection PyUnresolvedReferences
 from tests.adapter.dbt_adapter.conftest import dbt_test_helper  # noqa: F401
@@ -31,6 +31,8 @@ def init_app_state():
     yield
     # Cleanup after test
     app.state.last_activity = None
+    _lineage_payloads.clear()
+    _cll_payloads.clear()
 
 
 def test_health():
@@ -398,3 +400,201 @@ class TestV2VocabularyEndpoints:
         assert set(v2.json()["current"].keys()) == set(legacy.json()["current"].keys())
         for node_id, legacy_node in legacy_nodes.items():
             assert set(v2_nodes[node_id].keys()) == set(legacy_node.keys()), node_id
+
+
+class TestStreamingLineageEndpoints:
+    """NDJSON streaming and field projection for /api/info and /api/cll."""
+
+    @staticmethod
+    def _records(response):
+        import json
+
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        return [json.loads(line) for line in response.text.splitlines()]
+
+    def test_api_info_ndjson_rebuilds_lineage(self, dbt_test_helper):
+        from unittest.mock import patch
+
+        from recce.apis import ndjson_utils
+        from recce.models.types import MergedEdge, MergedLineage, MergedNode, NodeChange
+        from recce.state import FileStateLoader
+
+        context = default_context()
+        context.state_loader = FileStateLoader()
+        nodes = {
+            f"model.m{i}": MergedNode(name=f"m{i}", resource_type="model", schema="main", tags=["t"]) for i in range(5)
+        }
+        nodes["model.m0"].change_status = "modified"
+        nodes["model.m0"].change = NodeChange(category="breaking")
+        edges = [MergedEdge(source=f"model.m{i}", target=f"model.m{i + 1}") for i in range(4)]
+        lineage = MergedLineage(nodes=nodes, edges=edges, metadata={"base": {}, "current": {}})
+
+        client = TestClient(app)
+        with (
+            patch.object(context, "get_merged_lineage", return_value=lineage),
+            patch.object(ndjson_utils, "STREAM_CHUNK_SIZE", 2),
+        ):
+            expected = client.get("/api/info").json()
+            streamed = client.get("/api/info", headers={"Accept": "application/x-ndjson"})
+            skeleton = client.get(
+                "/api/info",
+                params={"fields": "name,change_status"},
+                headers={"Accept": "application/x-ndjson", "Accept-Vocabulary": "v2"},
+            )
+            projected = client.get("/api/info", params={"fields": "name,change"})
+
+        records = self._records(streamed)
+        assert [r["type"] for r in records] == ["info", "metadata", "nodes", "nodes", "nodes", "edges", "edges", "end"]
+        expected_lineage = expected.pop("lineage")
+        assert records[0]["info"] == expected
+        rebuilt = {"nodes": {}, "edges": [], "metadata": records[1]["metadata"]}
+        for record in records:
+            if record["type"] == "nodes":
+                rebuilt["nodes"].update(record["nodes"])
+            elif record["type"] == "edges":
+                rebuilt["edges"].extend(record["edges"])
+        assert rebuilt == expected_lineage
+        assert records[-1]["counts"] == {"nodes": 5, "edges": 4}
+
+        skeleton_nodes = {}
+        for record in self._records(skeleton):
+            if record["type"] == "nodes":
+                skeleton_nodes.update(record["nodes"])
+        assert skeleton_nodes["model.m0"] == {"name": "m0", "change_status": "modified"}
+        assert skeleton_nodes["model.m1"] == {"name": "m1"}
+
+        projected_nodes = projected.json()["lineage"]["nodes"]
+        assert projected_nodes["model.m0"] == {"name": "m0", "change": {"category": "breaking"}}
+        assert projected.json()["lineage"]["edges"] == expected_lineage["edges"]
+
+    def test_api_cll_ndjson_and_projection(self, dbt_test_helper):
+        from unittest.mock import patch
+
+        from recce.models.types import CllColumn, CllData, CllNode
+
+        context = default_context()
+        column = CllColumn(id="model.m1_a", table_id="model.m1", name="a", type="int", transformation_type="source")
+        cll_data = CllData(
+            nodes={
+                "model.m1": CllNode(
+                    id="model.m1",
+                    name="m1",
+                    package_name="jaffle_shop",
+                    resource_type="model",
+                    change_category="breaking",
+                    columns={"a": column},
+                ),
+                "model.m2": CllNode(id="model.m2", name="m2", package_name="jaffle_shop", resource_type="model"),
+            },
+            columns={"model.m1_a": column},
+            parent_map={"model.m2": {"model.m1"}, "model.m1_a": set()},
+        )
+
+        had_flag = hasattr(app.state, "flag")
+        old_flag = getattr(app.state, "flag", None)
+        app.state.flag = {}
+        try:
+            client = TestClient(app)
+            with patch.object(context.adapter, "get_cll", return_value=cll_data):
+                expected = client.post("/api/cll", json={}).json()["current"]
+                streamed = client.post(
+                    "/api/cll", json={}, headers={"Accept": "application/x-ndjson", "Accept-Vocabulary": "v2"}
+                )
+                projected = client.post("/api/cll", json={"fields": ["id", "name"]})
+        finally:
+            if had_flag:
+                app.state.flag = old_flag
+            else:
+                del app.state.flag
+
+        records = self._records(streamed)
+        rebuilt = {"nodes": {}, "columns": {}, "parent_map": {}, "child_map": {}}
+        for record in records[:-1]:
+            rebuilt[record["type"]].update(record[record["type"]])
+        assert records[-1] == {"type": "end", "counts": {"nodes": 2, "columns": 1}}
+        assert rebuilt["nodes"]["model.m1"]["change_category"] == "model_wide"
+        rebuilt["nodes"]["model.m1"]["change_category"] = "breaking"
+        assert rebuilt == expected
+
+        current = projected.json()["current"]
+        assert current["nodes"] == {
+            "model.m1": {"id": "model.m1", "name": "m1"},
+            "model.m2": {"id": "model.m2", "name": "m2"},
+        }
+        assert current["columns"] == {"model.m1_a": {"id": "model.m1_a", "name": "a"}}
+        assert current["parent_map"] == expected["parent_map"]
+
+
+class TestLineageETag:
+    """ETag revalidation for /api/info, /api/cll and /api/select."""
+
+    def test_api_info_not_modified(self, dbt_test_helper):
+        from unittest.mock import patch
+
+        from recce.state import FileStateLoader
+
+        context = default_context()
+        context.state_loader = FileStateLoader()
+        dbt_test_helper.create_model("customers", curr_sql="select 1 as id", base_sql="select 1 as id")
+
+        client = TestClient(app)
+        response = client.get("/api/info")
+        etag = response.headers["ETag"]
+        assert response.headers["Cache-Control"] == "no-cache"
+        assert "customers" in response.json()["lineage"]["nodes"]
+
+        with patch.object(context, "get_merged_lineage") as get_merged_lineage:
+            not_modified = client.get("/api/info", headers={"If-None-Match": etag})
+            cached = client.get("/api/info")
+        v2 = client.get("/api/info", headers={"Accept-Vocabulary": "v2"})
+        assert not_modified.status_code == 304
+        assert not_modified.headers["ETag"] == etag
+        assert not_modified.content == b""
+        assert cached.json() == response.json()
+        assert v2.headers["ETag"] != etag
+        # Served from the pre-serialized buffers of the first request
+        get_merged_lineage.assert_not_called()
+
+        with patch.object(context.adapter, "get_lineage_version", return_value="other"):
+            changed = client.get("/api/info", headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.headers["ETag"] != etag
+
+    def test_api_cll_and_select_not_modified(self, dbt_test_helper):
+        from unittest.mock import patch
+
+        context = default_context()
+        dbt_test_helper.create_model("customers", curr_sql="select 1 as id", base_sql="select 1 as id")
+
+        had_flag = hasattr(app.state, "flag")
+        old_flag = getattr(app.state, "flag", None)
+        app.state.flag = {}
+        try:
+            client = TestClient(app)
+            full_map = client.post("/api/cll", json={"full_map": True})
+            etag = full_map.headers["ETag"]
+            with patch.object(context.adapter, "get_cll") as get_cll:
+                not_modified = client.post("/api/cll", json={"full_map": True}, headers={"If-None-Match": f"W/{etag}"})
+                cached = client.post("/api/cll", json={"full_map": True})
+            get_cll.assert_not_called()
+            by_node = client.post("/api/cll", json={"node_id": "customers"})
+        finally:
+            if had_flag:
+                app.state.flag = old_flag
+            else:
+                del app.state.flag
+
+        assert not_modified.status_code == 304
+        assert cached.json() == full_map.json()
+        assert "customers" in full_map.json()["current"]["nodes"]
+        assert by_node.headers["ETag"] != etag
+
+        selected = client.post("/api/select", json={"select": "customers"})
+        assert selected.json() == {"nodes": ["customers"]}
+        select_etag = selected.headers["ETag"]
+        assert (
+            client.post("/api/select", json={"select": "customers"}, headers={"If-None-Match": select_etag}).status_code
+            == 304
+        )
+        other = client.post("/api/select", json={"select": "orders"}, headers={"If-None-Match": select_etag})
+        assert other.status_code == 200
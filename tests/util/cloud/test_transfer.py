@@ -0,0 +1,113 @@
+"""
+Tests for recce.util.cloud.transfer module.
+
+These tests run the transfers against a local HTTP server standing in for the
+presigned URL endpoints.
+"""
+
+import gzip
+import json
+import os
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from recce.util.cloud.transfer import (
+    download_to_file,
+    get_transfer_session,
+    open_download,
+    read_json,
+    upload_file,
+)
+
+PAYLOAD = {"nodes": {f"model.{i}": {"name": str(i)} for i in range(100)}}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self.server.requests.append(dict(self.headers))
+        if self.path.startswith("/missing"):
+            self.send_response(404)
+            self.end_headers()
+            return
+        body = json.dumps(PAYLOAD).encode()
+        self.send_response(200)
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_PUT(self):
+        self.server.requests.append(dict(self.headers))
+        self.server.uploaded = self.rfile.read(int(self.headers["Content-Length"]))
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+
+class TestTransfer(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.server.requests = []
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_session_is_shared(self):
+        self.assertIs(get_transfer_session(), get_transfer_session())
+
+    def test_read_json_decodes_gzip(self):
+        with open_download(f"{self.url}/manifest.json") as response:
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.headers["Content-Encoding"], "gzip")
+            self.assertEqual(read_json(response), PAYLOAD)
+        self.assertEqual(self.server.requests[0]["Accept-Encoding"], "gzip")
+
+    def test_signed_accept_encoding_is_not_overridden(self):
+        url = f"{self.url}/manifest.json?X-Amz-SignedHeaders=accept-encoding%3Bhost"
+        with open_download(url, headers={"Accept-Encoding": "identity"}) as response:
+            self.assertNotIn("Content-Encoding", response.headers)
+            self.assertEqual(read_json(response), PAYLOAD)
+        self.assertEqual(self.server.requests[0]["Accept-Encoding"], "identity")
+
+    def test_download_to_file(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "state.json")
+            with open_download(f"{self.url}/state.json", headers={"x-test": "1"}) as response:
+                download_to_file(response, path)
+            with open(path) as f:
+                self.assertEqual(json.load(f), PAYLOAD)
+        self.assertEqual(self.server.requests[0]["x-test"], "1")
+
+    def test_download_not_found(self):
+        with open_download(f"{self.url}/missing") as response:
+            self.assertEqual(response.status_code, 404)
+
+    def test_upload_file(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "manifest.json")
+            with open(path, "w") as f:
+                json.dump(PAYLOAD, f)
+
+            response = upload_file(f"{self.url}/manifest.json", path, headers={"x-amz-meta-a": "1"})
+
+            self.assertEqual(response.status_code, 200)
+            with open(path, "rb") as f:
+                self.assertEqual(self.server.uploaded, f.read())
+        headers = self.server.requests[0]
+        self.assertEqual(int(headers["Content-Length"]), len(self.server.uploaded))
+        self.assertNotIn("Transfer-Encoding", headers)
+        self.assertEqual(headers["x-amz-meta-a"], "1")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import json
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from recce.util import artifact_reader
+from recce.util.artifact_reader import prune_manifest, read_json_artifact
+from recce.util.startup_perf import (
+    StartupPerfTracker,
+    clear_startup_tracker,
+    set_startup_tracker,
+)
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+manifest_path = os.path.join(current_dir, "..", "manifest.json")
+
+
+class TestArtifactReader(unittest.TestCase):
+    def setUp(self):
+        self.tracker = StartupPerfTracker()
+        set_startup_tracker(self.tracker)
+
+    def tearDown(self):
+        clear_startup_tracker()
+
+    def test_read_json_artifact(self):
+        with open(manifest_path) as f:
+            expected = json.load(f)
+        assert read_json_artifact(manifest_path, timing_name="curr_manifest") == expected
+        assert "curr_manifest_parse" in self.tracker.timings
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            empty = os.path.join(tmp_dir, "manifest.json")
+            open(empty, "w").close()
+            with self.assertRaises(ValueError):
+                read_json_artifact(empty)
+
+    def test_read_json_artifact_from_memory_map(self):
+        with open(manifest_path) as f:
+            expected = json.load(f)
+        # Stands in for orjson, which parses the mapped buffer without a bytes copy
+        parser = SimpleNamespace(loads=lambda buffer: json.loads(bytes(buffer)))
+        with patch.object(artifact_reader, "orjson", parser):
+            assert read_json_artifact(manifest_path) == expected
+
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                empty = os.path.join(tmp_dir, "manifest.json")
+                open(empty, "w").close()
+                with self.assertRaises(ValueError):
+                    read_json_artifact(empty)
+
+    def test_prune_manifest(self):
+        data = read_json_artifact(manifest_path)
+        node_macros = {m for node in data["nodes"].values() for m in node["depends_on"]["macros"]}
+        assert data["docs"] and node_macros
+
+        pruned = prune_manifest(data, timing_name="base_manifest")
+        assert pruned["docs"] == {} and pruned["disabled"] == {}
+        assert pruned["macros"] is data["macros"]
+        assert self.tracker.artifact_sizes["base_manifest_skipped"] > 0
+        # The input is left untouched
+        assert data["docs"]
+
+        pruned = prune_manifest(data, macro_bodies=True)
+        kept = {macro_id for macro_id, macro in pruned["macros"].items() if macro["macro_sql"]}
+        assert node_macros <= kept
+        assert len(kept) < len(data["macros"])
+        assert all(macro["macro_sql"] for macro in data["macros"].values() if macro.get("macro_sql") is not None)
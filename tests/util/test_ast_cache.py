@@ -0,0 +1,68 @@
+import unittest
+
+import sqlglot.expressions as exp
+from sqlglot.errors import OptimizeError, ParseError
+
+from recce.util.ast_cache import AstCache
+
+
+class TestAstCache(unittest.TestCase):
+    def test_parse_is_cached_and_copied(self):
+        cache = AstCache()
+        first = cache.get_or_parse("select a from t", dialect="duckdb")
+        second = cache.get_or_parse("select a from t", dialect="duckdb")
+        assert cache.misses == 1 and cache.hits == 1
+        assert first == second
+        assert first is not second
+
+        # Mutating a copy does not leak into the cache
+        first.find(exp.Column).replace(exp.column("b"))
+        assert cache.get_or_parse("select a from t", dialect="duckdb").sql() == "SELECT a FROM t"
+
+        shared = cache.get_or_parse("select a from t", dialect="duckdb", copy=False)
+        assert shared is cache.get_or_parse("select a from t", dialect="duckdb", copy=False)
+
+    def test_key_covers_dialect_and_schema(self):
+        cache = AstCache()
+        cache.get_or_parse("select a from t")
+        cache.get_or_parse("select a from t", dialect="duckdb")
+        cache.get_or_qualify("select * from t", schema={"t": {"a": "int"}})
+        cache.get_or_qualify("select * from t", schema={"t": {"a": "int", "b": "int"}})
+        # Two parses, plus one parse and two qualified trees for the second query
+        assert len(cache) == 5
+
+        tree = cache.get_or_qualify("select * from t", schema={"t": {"a": "int", "b": "int"}})
+        assert [c.name for c in tree.find_all(exp.Column)] == ["a", "b"]
+
+    def test_lru_eviction(self):
+        cache = AstCache(maxsize=2)
+        cache.get_or_parse("select 1")
+        cache.get_or_parse("select 2")
+        cache.get_or_parse("select 1")
+        cache.get_or_parse("select 3")
+        assert len(cache) == 2
+        assert cache.make_key("select 2") not in cache._entries
+        assert cache.make_key("select 1") in cache._entries
+
+    def test_parse_error_not_cached(self):
+        cache = AstCache()
+        for _ in range(2):
+            with self.assertRaises(ParseError):
+                cache.get_or_parse("select from (")
+        assert len(cache) == 0
+
+    def test_non_strict_qualify_keeps_partial_tree(self):
+        cache = AstCache()
+        schema = {"t": {"a": "int"}, "u": {"a": "int"}}
+        sql = "select a from t join u on t.a = u.a"
+        with self.assertRaises(OptimizeError):
+            cache.get_or_qualify(sql, schema=schema)
+
+        tree = cache.get_or_qualify(sql, schema=schema, strict=False)
+        assert tree.sql() == 'SELECT "a" AS "a" FROM "t" AS "t" JOIN "u" AS "u" ON "t"."a" = "u"."a"'
+        assert cache.get_or_qualify(sql, schema=schema, strict=False, copy=False) is cache.get_or_qualify(
+            sql, schema=schema, strict=False, copy=False
+        )
+        # A strict caller still gets the error rather than the partial tree
+        with self.assertRaises(OptimizeError):
+            cache.get_or_qualify(sql, schema=schema)
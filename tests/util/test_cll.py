@@ -1,7 +1,8 @@
 import unittest
 from typing import List, Tuple
+from unittest.mock import patch
 
-from recce.util.cll import CllResult, cll
+from recce.util.cll import CllResult, cll, cll_worker
 
 
 def assert_model(result: CllResult, depends_on: List[Tuple[str, str]]):
@@ -966,3 +967,13 @@ class ColumnLevelLineageTest(unittest.TestCase):
         assert m2c == [], f"unexpected m2c deps: {[(d.node, d.column) for d in m2c]}"
         for name in ("id", "month", "rev"):
             assert_column(result, name, "passthrough", [("u", name)])
+
+    def test_cll_worker_status(self):
+        status, result = cll_worker("select a from t1", schema={"t1": {"a": "int"}})
+        assert status == "ok"
+        assert_column(result, "a", "passthrough", [("t1", "a")])
+
+        assert cll_worker("select this is not sql") == ("sqlglot_error", None)
+
+        with patch("recce.util.cll.cll", side_effect=KeyError("a")):
+            assert cll_worker("select 1") == ("other_error", None)
@@ -91,6 +91,62 @@ class TestCllCacheSQLiteLayer(unittest.TestCase):
                 assert cache.get_node(node_id, content_key) == expected_json
             assert cache.stats["entries"] == 3
 
+    def test_bulk_get(self):
+        """get_nodes returns hits only and touches them in one write."""
+        from recce.util.cll import CllCache
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = os.path.join(tmpdir, "cll_cache.db")
+            cache = CllCache(db_path=db_path)
+            cache.put_nodes_batch([(f"model.n{i}", f"k{i}", f'{{"n": {i}}}') for i in range(1200)])
+
+            old_time = time.time() - 3600
+            conn = sqlite3.connect(db_path)
+            conn.execute("UPDATE cll_node_cache SET last_accessed = ?", (old_time,))
+            conn.commit()
+            conn.close()
+
+            # More keys than fit in one IN (...) chunk, plus a miss and a stale content key
+            requested = [(f"model.n{i}", f"k{i}") for i in range(1100)]
+            requested += [("model.missing", "k"), ("model.n1100", "other")]
+            result = cache.get_nodes(requested)
+
+            assert len(result) == 1100
+            assert result["model.n0"] == '{"n": 0}'
+            assert result["model.n1099"] == '{"n": 1099}'
+            assert "model.missing" not in result
+            assert "model.n1100" not in result
+
+            conn = sqlite3.connect(db_path)
+            touched = conn.execute(
+                "SELECT COUNT(*) FROM cll_node_cache WHERE last_accessed > ?", (old_time + 3000,)
+            ).fetchone()[0]
+            conn.close()
+            assert touched == 1100
+
+    def test_bulk_get_empty_and_disabled(self):
+        from recce.util.cll import CllCache
+
+        assert CllCache().get_nodes([("model.n", "k1")]) == {}
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = CllCache(db_path=os.path.join(tmpdir, "cll_cache.db"))
+            assert cache.get_nodes([]) == {}
+
+    def test_reuses_connection_and_reopens_after_close(self):
+        from recce.util.cll import CllCache
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = CllCache(db_path=os.path.join(tmpdir, "cll_cache.db"))
+            cache.put_node("model.n", "k1", '{"data": 1}')
+            conn = cache._conn
+            assert cache.get_node("model.n", "k1") == '{"data": 1}'
+            assert cache._conn is conn
+
+            cache.close()
+            assert cache._conn is None
+            assert cache.get_node("model.n", "k1") == '{"data": 1}'
+            cache.close()
+
     def test_ttl_eviction_removes_stale(self):
         """Entries with last_accessed older than TTL are evicted."""
         from recce.util.cll import CllCache
@@ -517,15 +573,77 @@ class TestSerializationRoundTrip(unittest.TestCase):
             },
             parent_map={},
         )
+        json_str = self._serialize(original)
+
+        # The encoded rows have no slot for change_status or change_category
+        from recce.adapter.dbt_adapter import DbtAdapter
+
+        assert json.loads(json_str) == {
+            "v": DbtAdapter._CLL_ENCODING_VERSION,
+            "ids": ["model.a", "model.a_x"],
+            "column_rows": [[1, 0, "x", None, "passthrough", []]],
+            "nodes": [[0, 0, "a", "p", "model", None, None, []]],
+            "columns": [[1, 0]],
+            "parent_map": [],
+        }
+
+        restored = self._deserialize(json_str)
+        assert restored.model_dump() == {
+            "nodes": {
+                "model.a": {
+                    "id": "model.a",
+                    "name": "a",
+                    "package_name": "p",
+                    "resource_type": "model",
+                    "source_name": None,
+                    "change_status": None,
+                    "change_category": None,
+                    "columns": {},
+                    "impacted": None,
+                }
+            },
+            "columns": {
+                "model.a_x": {
+                    "id": "model.a_x",
+                    "table_id": "model.a",
+                    "name": "x",
+                    "type": None,
+                    "transformation_type": "passthrough",
+                    "change_status": None,
+                    "depends_on": [],
+                }
+            },
+            "parent_map": {},
+            "child_map": {},
+        }
+
+    def test_shared_columns_stored_once(self):
+        """A column shared by node.columns and columns is encoded once and shared again on load."""
+        col = CllColumn(id="model.a_x", table_id="model.a", name="x", transformation_type="passthrough")
+        node = CllNode(id="model.a", name="a", package_name="p", resource_type="model", columns={"x": col})
+        original = CllData(nodes={"model.a": node}, columns={"model.a_x": col}, parent_map={"model.a_x": set()})
+
         json_str = self._serialize(original)
         raw = json.loads(json_str)
+        assert len(raw["column_rows"]) == 1
+        assert raw["ids"].count("model.a") == 1
+
+        restored = self._deserialize(json_str)
+        assert restored.nodes["model.a"].columns["x"] is restored.columns["model.a_x"]
+        assert restored.model_dump() == original.model_dump()
+
+    def test_smaller_than_model_dump_json(self):
+        original = self._make_sample_cll_data()
+        for c_id, c in original.columns.items():
+            original.nodes[c.table_id].columns[c.name] = c
+        assert len(self._serialize(original)) < len(json.dumps(original.model_dump(mode="json"))) / 2
 
-        # Serialized JSON should not contain change_status or change_category
-        for node_data in raw.get("nodes", {}).values():
-            assert "change_status" not in node_data, "change_status leaked into serialized node"
-            assert "change_category" not in node_data, "change_category leaked into serialized node"
-        for col_data in raw.get("columns", {}).values():
-            assert "change_status" not in col_data, "change_status leaked into serialized column"
+    def test_unknown_encoding_version_raises(self):
+        """Rows in another encoding fail to decode so build_full_cll_map recomputes them."""
+        raw = json.loads(self._serialize(self._make_sample_cll_data()))
+        raw["v"] = 0
+        with self.assertRaises(ValueError):
+            self._deserialize(json.dumps(raw))
 
     def test_all_transformation_types_preserved(self):
         """Every valid transformation_type survives the round-trip."""
@@ -1148,12 +1266,29 @@ class TestCllCacheErrorPaths(unittest.TestCase):
         )
 
         json_str = DbtAdapter._serialize_cll_data(data)
-        parsed = json.loads(json_str)
 
         # change_status and change_category should be excluded
-        assert "change_status" not in parsed["nodes"]["model.a"]
-        assert "change_category" not in parsed["nodes"]["model.a"]
-        assert "change_status" not in parsed["columns"]["model.a_c"]
+        assert json.loads(json_str) == {
+            "v": DbtAdapter._CLL_ENCODING_VERSION,
+            "ids": ["model.a", "model.a_c"],
+            "column_rows": [[1, -1, "c", None, "unknown", []]],
+            "nodes": [[0, 0, "a", "p", "model", None, None, []]],
+            "columns": [[1, 0]],
+            "parent_map": [],
+        }
+        restored = DbtAdapter._deserialize_cll_data(json_str)
+        assert restored.nodes["model.a"].model_dump(include={"change_status", "change_category"}) == {
+            "change_status": None,
+            "change_category": None,
+        }
+        assert restored.columns["model.a_c"].model_dump(exclude={"depends_on"}) == {
+            "id": "model.a_c",
+            "table_id": None,
+            "name": "c",
+            "type": None,
+            "transformation_type": "unknown",
+            "change_status": None,
+        }
 
 
 if __name__ == "__main__":
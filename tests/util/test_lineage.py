@@ -1,4 +1,4 @@
-from recce.util.lineage import find_downstream, find_upstream
+from recce.util.lineage import LineageIndex, find_downstream, find_upstream
 
 
 class TestFindUpstreamDownstream:
@@ -120,3 +120,32 @@ class TestFindUpstreamDownstream:
         # Cross-component queries should find nothing
         upstream_cross = find_upstream(["a1"], {"a2": ["b2"]})
         assert upstream_cross == set()
+
+
+class TestLineageIndex:
+    def test_matches_find_upstream_downstream(self):
+        parent_map = {
+            "a": ["b", "c"],
+            "b": ["d"],
+            "c": ["d"],
+            "e": ["a"],
+            "x": ["y"],
+            # cycle
+            "p": ["q"],
+            "q": ["p"],
+        }
+        child_map = {}
+        for node_id, parents in parent_map.items():
+            for parent in parents:
+                child_map.setdefault(parent, []).append(node_id)
+
+        index = LineageIndex(parent_map)
+        for node_ids in [["a"], ["d"], ["b", "x"], ["p"], ["missing"], []]:
+            assert index.upstream(node_ids) == find_upstream(node_ids, parent_map)
+            assert index.downstream(node_ids) == find_downstream(node_ids, child_map)
+
+    def test_contains(self):
+        index = LineageIndex({"a": ["b"]})
+        assert "a" in index
+        assert "b" in index
+        assert "c" not in index
@@ -0,0 +1,65 @@
+import time
+from unittest.mock import patch
+
+from recce.util.run_cache import RunResultCache
+
+
+def test_put_and_get(tmp_path):
+    cache = RunResultCache(db_path=str(tmp_path / "run_cache.db"))
+    assert cache.enabled
+    key = RunResultCache.make_key("row_count_diff", {"node_names": ["customers"]}, {"current.customers": "a"}, "1.0")
+
+    assert cache.get(key) is None
+    cache.put(key, '{"result": {}}')
+    assert cache.get(key) == '{"result": {}}'
+    assert cache.stats == {"entries": 1}
+
+
+def test_make_key():
+    fingerprints = {"base.customers": "a", "current.customers": "b"}
+    key = RunResultCache.make_key("top_k_diff", {"model": "customers", "column_name": "id"}, fingerprints, "1.0")
+
+    # None params and key order do not matter
+    assert key == RunResultCache.make_key(
+        "top_k_diff", {"column_name": "id", "model": "customers", "k": None}, fingerprints, "1.0"
+    )
+    # Run type, params, fingerprints and version do
+    assert key != RunResultCache.make_key(
+        "histogram_diff", {"model": "customers", "column_name": "id"}, fingerprints, "1.0"
+    )
+    assert key != RunResultCache.make_key("top_k_diff", {"model": "customers", "column_name": "x"}, fingerprints, "1.0")
+    assert key != RunResultCache.make_key(
+        "top_k_diff", {"model": "customers", "column_name": "id"}, {**fingerprints, "current.customers": "c"}, "1.0"
+    )
+    assert key != RunResultCache.make_key(
+        "top_k_diff", {"model": "customers", "column_name": "id"}, fingerprints, "1.1"
+    )
+
+
+def test_ttl(tmp_path):
+    cache = RunResultCache(db_path=str(tmp_path / "run_cache.db"), ttl_seconds=60)
+    cache.put("old", "{}")
+    with patch("recce.util.run_cache.time.time", return_value=time.time() + 120):
+        cache.put("new", "{}")
+        assert cache.get("old") is None
+        assert cache.get("new") == "{}"
+        assert cache.evict_stale() == 1
+    assert cache.stats == {"entries": 1}
+
+
+def test_bypass(tmp_path):
+    cache = RunResultCache(db_path=str(tmp_path / "run_cache.db"), bypass=True)
+    cache.put("key", "{}")
+    assert cache.get("key") is None
+
+    cache.bypass = False
+    assert cache.get("key") == "{}"
+
+
+def test_disabled():
+    cache = RunResultCache()
+    assert not cache.enabled
+    cache.put("key", "{}")
+    assert cache.get("key") is None
+    assert cache.evict_stale() == 0
+    assert cache.stats == {"entries": 0}
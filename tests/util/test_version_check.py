@@ -0,0 +1,73 @@
+import json
+import time
+from unittest.mock import patch
+
+import pytest
+
+from recce.util import version_check
+
+
+@pytest.fixture
+def cache_path(tmp_path, monkeypatch):
+    path = tmp_path / ".latest_version.json"
+    monkeypatch.setenv("RECCE_VERSION_CHECK_CACHE", str(path))
+    with patch("recce.get_version", return_value="1.0.0"):
+        yield path
+
+
+def _write(path, version, age=0):
+    path.write_text(json.dumps({"version": version, "checked_at": time.time() - age}))
+
+
+def test_import_does_not_query_pypi():
+    import importlib
+
+    import recce
+
+    with patch("requests.get") as mock_get:
+        importlib.reload(recce)
+    mock_get.assert_not_called()
+
+
+def test_missing_cache_refreshes_in_background(cache_path):
+    with patch("recce.fetch_latest_version", return_value="2.0.0") as mock_fetch:
+        # Nothing cached yet: report the installed version without waiting for PyPI
+        assert version_check.get_latest_version() == "1.0.0"
+        version_check._refresh_thread.join(timeout=5)
+
+    mock_fetch.assert_called_once()
+    assert json.loads(cache_path.read_text())["version"] == "2.0.0"
+    assert version_check.get_latest_version(refresh=False) == "2.0.0"
+    assert version_check.is_recce_outdated(refresh=False) is True
+
+
+def test_fresh_cache_is_not_refreshed(cache_path):
+    _write(cache_path, "1.0.0")
+    with patch.object(version_check, "refresh_in_background") as mock_refresh:
+        assert version_check.get_latest_version() == "1.0.0"
+        assert version_check.is_recce_outdated() is False
+    mock_refresh.assert_not_called()
+
+
+def test_stale_cache_is_served_while_refreshing(cache_path):
+    _write(cache_path, "1.5.0", age=version_check._DEFAULT_TTL_SECONDS + 1)
+    with patch.object(version_check, "refresh_in_background") as mock_refresh:
+        assert version_check.get_latest_version() == "1.5.0"
+    mock_refresh.assert_called_once()
+
+
+def test_dev_version_skips_check(cache_path):
+    with (
+        patch("recce.get_version", return_value="1.1.0.dev0"),
+        patch.object(version_check, "refresh_in_background") as mock_refresh,
+    ):
+        assert version_check.get_latest_version() == "1.1.0.dev0"
+        assert version_check.is_recce_outdated() is False
+    mock_refresh.assert_not_called()
+
+
+def test_corrupt_cache_is_ignored(cache_path):
+    cache_path.write_text("not json")
+    with patch.object(version_check, "refresh_in_background") as mock_refresh:
+        assert version_check.get_latest_version() == "1.0.0"
+    mock_refresh.assert_called_once()